@@ -0,0 +1,289 @@
+"""
+Parallel Search module for FlyRecordKeeper.
+
+This module evaluates flight searches over very large collections in a
+pool of worker processes, so a search is not limited to a single core.
+
+The searchable flight fields are laid out once per data version as
+columnar text in shared memory. Each worker attaches to the block, scans
+its own partition of rows and returns the matching row numbers, so no
+records are pickled. Partitions are merged in storage order. Collections
+below a size threshold are searched serially by the SearchController.
+"""
+
+import multiprocessing
+import os
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from controllers.search_controller import SearchController, SearchPredicate, departure_number, match_flight_fields
+from models.base_record import BaseRecord
+from models.record_manager import RecordManager
+from utils.text_matching import search_key
+
+# Number of candidate flights from which a search is spread across processes
+PARALLEL_THRESHOLD = 100_000
+
+# Number of flights scanned by one worker task
+DEFAULT_CHUNK_SIZE = 50_000
+
+# Keys stored per flight row, in column order, named as match_flight_fields reads them
+FLIGHT_COLUMNS = ("id", "client_id", "airline_id", "client", "airline", "from", "to", "date", "departure")
+
+# Separators of the columnar text (fields within a row, and rows)
+FIELD_SEPARATOR = "\x1f"
+ROW_SEPARATOR = "\n"
+
+# Process pool shared by every parallel search, created on first use
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Return the shared process pool, creating it on first use.
+    
+    Workers are spawned rather than forked, so they never inherit the
+    state (locks, Tk handles) of a multithreaded GUI process.
+    
+    Args:
+        max_workers: Number of worker processes, defaults to the number of CPUs
+    
+    Returns:
+        The process pool
+    """
+    global _executor
+
+    # Search workers of several views may ask for the pool at the same time
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                                            mp_context=multiprocessing.get_context("spawn"))
+    return _executor
+
+
+class FlightColumns:
+    """
+    Searchable flight fields of a record manager, stored as text in shared memory.
+    
+    Each row holds a flight's ID, client ID, airline ID, client name,
+    airline name, start city, end city and ISO date, as search keys, and
+    its departure number, so date bounds compare exactly as integers.
+    """
+
+    def __init__(self, record_manager: RecordManager):
+        """
+        Initialize a new FlightColumns instance from the current flights.
+        
+        Args:
+            record_manager: RecordManager (or snapshot) holding the flights
+        """
+        self.source = record_manager
+        self.version = record_manager.version
+        self.records = tuple(record_manager.get_records_by_type("flight"))
+
+        # Byte offset of the start of every row, plus the end of the last row
+        self.offsets = [0]
+        rows = []
+        for flight in self.records:
+            row = (FIELD_SEPARATOR.join(self.clean(value) for value in self.row_values(record_manager, flight))
+                   + ROW_SEPARATOR).encode("utf-8")
+            rows.append(row)
+            self.offsets.append(self.offsets[-1] + len(row))
+
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, self.offsets[-1]))
+        self.shm.buf[:self.offsets[-1]] = b"".join(rows)
+
+        # Release the block even if close() is never called
+        self._finalizer = weakref.finalize(self, self.release, self.shm)
+
+    @staticmethod
+    def row_values(record_manager: RecordManager, flight: BaseRecord) -> List[str]:
+        """Return the searchable values of a flight, in column order."""
+        client = record_manager.find_record(flight.client_id, "client")
+        airline = record_manager.find_record(flight.airline_id, "airline")
+
+        date = getattr(flight, "date", None)
+        departure = departure_number(date)
+
+        return [
+            str(flight.id),
+            str(flight.client_id),
+            str(flight.airline_id),
+            client.name if client is not None else "",
+            airline.company_name if airline is not None else "",
+            flight.start_city,
+            flight.end_city,
+            date.isoformat() if hasattr(date, "isoformat") else "",
+            str(departure) if departure is not None else "",
+        ]
+
+    @staticmethod
+    def clean(value: str) -> str:
+        """Convert a value to its search key and strip the characters used as separators."""
+        return search_key(value).replace(FIELD_SEPARATOR, " ").replace(ROW_SEPARATOR, " ")
+
+    @staticmethod
+    def release(shm: shared_memory.SharedMemory) -> None:
+        """Close and remove a shared memory block."""
+        shm.close()
+        shm.unlink()
+
+    def is_current(self, record_manager: RecordManager) -> bool:
+        """Check whether the columns still reflect a record manager's data."""
+        return self.source is record_manager and self.version == record_manager.version
+
+    def partitions(self, chunk_size: int) -> List[Tuple[int, int, int]]:
+        """
+        Split the rows into partitions of at most chunk_size rows.
+        
+        Args:
+            chunk_size: Number of rows per partition
+        
+        Returns:
+            List of (start byte, end byte, first row) tuples
+        """
+        return [(self.offsets[first], self.offsets[min(first + chunk_size, len(self.records))], first)
+                for first in range(0, len(self.records), chunk_size)]
+
+    def close(self) -> None:
+        """Release the shared memory block."""
+        self._finalizer()
+
+
+def match_row(fields: List[str], predicate: SearchPredicate) -> bool:
+    """
+    Check whether a flight row matches a search predicate.
+    
+    Args:
+        fields: Column values of the row, in FLIGHT_COLUMNS order
+        predicate: Search predicate
+    
+    Returns:
+        True if the row matches, False otherwise
+    """
+    values = dict(zip(FLIGHT_COLUMNS, fields))
+    values["departure"] = int(values["departure"]) if values["departure"] else None
+    return match_flight_fields(values.__getitem__, predicate)
+
+
+def match_partition(shm_name: str, start_byte: int, end_byte: int, first_row: int,
+                    predicates: List[SearchPredicate]) -> List[int]:
+    """
+    Scan one partition of the flight columns in a worker process.
+    
+    Args:
+        shm_name: Name of the shared memory block holding the columns
+        start_byte: Offset of the partition's first row
+        end_byte: Offset just past the partition's last row
+        first_row: Row number of the partition's first row
+        predicates: Search predicates, all of which must match
+    
+    Returns:
+        Row numbers of the matching flights, in storage order
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        text = bytes(shm.buf[start_byte:end_byte]).decode("utf-8")
+    finally:
+        shm.close()
+
+    matches = []
+    for offset, row in enumerate(text.split(ROW_SEPARATOR)[:-1]):
+        fields = row.split(FIELD_SEPARATOR)
+        if all(match_row(fields, predicate) for predicate in predicates):
+            matches.append(first_row + offset)
+
+    return matches
+
+
+class ParallelFlightSearch:
+    """
+    Flight search that spreads large scans across worker processes.
+    """
+
+    def __init__(self, threshold: int = PARALLEL_THRESHOLD, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 max_workers: Optional[int] = None):
+        """
+        Initialize a new ParallelFlightSearch instance.
+        
+        Args:
+            threshold: Number of candidate flights from which the search runs in parallel
+            chunk_size: Number of flights scanned by one worker task
+            max_workers: Number of worker processes, defaults to the number of CPUs
+        """
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self._columns = None
+
+    def columns(self, record_manager: RecordManager) -> FlightColumns:
+        """Return the flight columns of a record manager, rebuilding them after a change."""
+        if self._columns is None or not self._columns.is_current(record_manager):
+            if self._columns is not None:
+                self._columns.close()
+            self._columns = FlightColumns(record_manager)
+
+        return self._columns
+
+    def iter_search(self, controller: SearchController, search_query: str,
+                    cancelled: Optional[Callable[[], bool]] = None) -> Iterator[BaseRecord]:
+        """
+        Search flights, in parallel when the query leaves many candidates.
+        
+        Queries the controller can answer from its cache, or by refining
+        the previous search, run through its incremental search. So does a
+        query whose indexes narrow the candidates below the threshold; only
+        a cold query over many candidates is spread across processes.
+        Completed parallel searches are remembered by the controller, so a
+        narrower follow-up query refines them serially.
+        
+        Args:
+            controller: SearchController over the records to search (typically a snapshot)
+            search_query: Search query string
+            cancelled: Function polled between partitions; the search stops once it returns True
+        
+        Yields:
+            Flight records matching the search criteria, in storage order
+        """
+        if controller.has_warm_results("flight", search_query):
+            yield from controller.iter_search_incremental("flight", search_query, cancelled)
+            return
+
+        search_terms = controller.normalise_terms(controller.parse_search_query(search_query, "flight"))
+        predicates = controller.parse_predicates("flight", search_terms)
+        plan = controller.plan_search("flight", predicates)
+
+        if not search_terms or len(plan[0]) < self.threshold:
+            yield from controller.iter_search_incremental("flight", search_query, cancelled, plan)
+            return
+
+        version = controller.record_manager.version
+        columns = self.columns(controller.record_manager)
+        executor = get_executor(self.max_workers)
+        futures = [executor.submit(match_partition, columns.shm.name, start, end, first, predicates)
+                   for start, end, first in columns.partitions(self.chunk_size)]
+
+        results = []
+        try:
+            for future in futures:
+                if cancelled is not None and cancelled():
+                    return
+
+                for row in future.result():
+                    results.append(columns.records[row])
+                    yield columns.records[row]
+        finally:
+            for future in futures:
+                future.cancel()
+
+        controller.remember_search("flight", search_terms, version, results)
+
+    def close(self) -> None:
+        """Release the shared flight columns."""
+        if self._columns is not None:
+            self._columns.close()
+            self._columns = None
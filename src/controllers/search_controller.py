@@ -10,11 +10,350 @@ This follows the MVC (Model-View-Controller) design pattern where:
 3. Controller: This module - provides specialised search capabilities
 """
 
+import heapq
 import re
-from typing import Dict, Any, List, Optional, Union
-from datetime import datetime
+import weakref
+from typing import Dict, Any, List, Optional, Union, Callable, Tuple, Set, Iterator
+from datetime import datetime, timedelta
 from models.record_manager import RecordManager
 from models.base_record import BaseRecord
+from models.search_keys import record_search_keys
+from utils.lru_cache import LRUCache
+from utils.text_matching import search_key, normalise_name, phonetic_keys, phone_digits, MIN_PHONE_SUFFIX
+
+# Default number of search results kept per record manager
+DEFAULT_CACHE_SIZE = 64
+
+# Result caches shared by every SearchController working on the same record manager
+_result_caches = weakref.WeakKeyDictionary()
+
+# Number of results returned by a ranked search by default
+DEFAULT_RANK_LIMIT = 100
+
+# Weight of a match on each field when ranking results, by record type
+RANK_FIELD_WEIGHTS = {
+    "client": {"name": 4, "id": 3, "phone": 2, "country": 1, "city": 1},
+    "airline": {"name": 2, "id": 1},
+    "flight": {"id": 3, "client": 3, "airline": 2, "from": 2, "to": 2, "date": 1},
+}
+
+# Number of results returned per record type by a global search by default
+DEFAULT_GROUP_LIMIT = 20
+
+# Largest edit distance a fuzzy name match may have by default
+DEFAULT_FUZZY_DISTANCE = 2
+
+# Approximate name indexes of the record manager, by search mode and record type
+SEARCH_MODE_INDEXES = {
+    "fuzzy": {
+        "client": "clients_by_fuzzy_name",
+        "airline": "airlines_by_fuzzy_name",
+    },
+    "phonetic": {
+        "client": "clients_by_phonetic_name",
+    },
+}
+
+# Query prefixes that switch an incremental search to another mode ("~smyth", "%schmidt")
+SEARCH_MODE_PREFIXES = {
+    "~": "fuzzy",
+    "%": "phonetic",
+}
+
+# Fields that can qualify a search term ("field:value"), by record type
+SEARCH_FIELDS = {
+    "client": ("id", "name", "city", "country", "phone"),
+    "airline": ("id", "name"),
+    "flight": ("id", "client", "airline", "from", "to", "date"),
+}
+
+# Qualified fields whose value may be an ID or an ID range ("5" or "120..180")
+NUMERIC_FIELDS = ("id", "client", "airline")
+
+# Flight keys an unqualified term is matched against, those resolving a reference last
+FLIGHT_TEXT_FIELDS = ("id", "client_id", "airline_id", "from", "to", "date", "client", "airline")
+
+# Origin of departure numbers, which count microseconds so dates compare exactly as numbers
+DEPARTURE_EPOCH = datetime(1, 1, 1)
+
+# Fields that support comparison operators ("id>=120", "date<2025-07"), by record type
+COMPARABLE_FIELDS = {
+    "client": ("id",),
+    "airline": ("id",),
+    "flight": ("id", "date"),
+}
+
+
+def departure_number(date: Any) -> Optional[int]:
+    """
+    Convert a departure date to the number date bounds are compared with.
+    
+    Args:
+        date: Departure date of a flight
+    
+    Returns:
+        Microseconds since DEPARTURE_EPOCH, None if the value is not a datetime
+    """
+    if not isinstance(date, datetime):
+        return None
+    return (date - DEPARTURE_EPOCH) // timedelta(microseconds=1)
+
+
+class SearchPredicate:
+    """
+    A single parsed search term.
+    
+    Unqualified terms match any searchable field of a record, while
+    qualified terms ("field:value") only match the named field. Comparison
+    terms ("field>=value") bound an ID or a departure date.
+    """
+
+    def __init__(self, term: str, field: Optional[str] = None, value: Optional[str] = None,
+                 operator: str = ":"):
+        """
+        Initialize a new SearchPredicate instance.
+        
+        Args:
+            term: The normalised search term as typed
+            field: Qualifying field name, None for any-field terms
+            value: Value to match, defaults to the whole term
+            operator: ':' for a match, or one of '<', '<=', '>', '>=' for a comparison
+        """
+        self.term = term
+        self.field = field
+        self.value = term if value is None else value
+        self.operator = operator
+
+        # Inclusive ID bounds
+        self.low = None
+        self.high = None
+
+        # Departure date bounds (start inclusive, end exclusive), as dates and departure numbers
+        self.start = None
+        self.end = None
+        self.start_number = None
+        self.end_number = None
+
+        if field in NUMERIC_FIELDS:
+            if operator == ":":
+                self.low, self.high = self.parse_range(self.value)
+            elif self.value.isdigit():
+                number = int(self.value)
+                self.low = {">=": number, ">": number + 1}.get(operator)
+                self.high = {"<=": number, "<": number - 1}.get(operator)
+        elif field == "date":
+            period = self.parse_date_period(self.value)
+            if period is not None:
+                # A value denotes a whole period, so "date<=2025-06" includes all of June
+                if operator in (":", ">="):
+                    self.start = period[0]
+                elif operator == ">":
+                    self.start = period[1]
+                if operator in (":", "<="):
+                    self.end = period[1]
+                elif operator == "<":
+                    self.end = period[0]
+                self.start_number = departure_number(self.start)
+                self.end_number = departure_number(self.end)
+
+    @property
+    def qualified(self) -> bool:
+        """True if the term only matches a single field."""
+        return self.field is not None
+
+    @property
+    def is_numeric(self) -> bool:
+        """True if the value is an ID or an ID range."""
+        return self.low is not None or self.high is not None
+
+    @property
+    def is_date_range(self) -> bool:
+        """True if the value is a departure date period or bound."""
+        return self.start is not None or self.end is not None
+
+    @staticmethod
+    def parse_date_period(value: str) -> Optional[Tuple[datetime, datetime]]:
+        """
+        Parse an ISO date prefix into the period it denotes.
+        
+        Supports a year ("2025"), month ("2025-06"), day ("2025-06-15") or
+        minute ("2025-06-15t09:30").
+        
+        Args:
+            value: ISO date prefix
+            
+        Returns:
+            Tuple of (start, end) with end exclusive, None if the value is not a date
+        """
+        try:
+            if re.fullmatch(r'\d{4}', value):
+                start = datetime(int(value), 1, 1)
+                return start, start.replace(year=start.year + 1)
+
+            if re.fullmatch(r'\d{4}-\d{2}', value):
+                start = datetime.strptime(value, "%Y-%m")
+                if start.month == 12:
+                    return start, start.replace(year=start.year + 1, month=1)
+                return start, start.replace(month=start.month + 1)
+
+            if re.fullmatch(r'\d{4}-\d{2}-\d{2}', value):
+                start = datetime.strptime(value, "%Y-%m-%d")
+                return start, start + timedelta(days=1)
+
+            if re.fullmatch(r'\d{4}-\d{2}-\d{2}t\d{2}:\d{2}', value):
+                start = datetime.strptime(value, "%Y-%m-%dt%H:%M")
+                return start, start + timedelta(minutes=1)
+        except ValueError:
+            pass
+
+        return None
+
+    def matches_date(self, date: datetime) -> bool:
+        """
+        Check whether a departure date lies within the predicate's bounds.
+        
+        Args:
+            date: Departure date to check
+            
+        Returns:
+            True if the date is within the bounds, False otherwise
+        """
+        return self.matches_departure(departure_number(date))
+
+    def matches_departure(self, number: Optional[int]) -> bool:
+        """
+        Check whether a departure number lies within the predicate's date bounds.
+        
+        Args:
+            number: Departure number of a flight, None if it has no valid date
+            
+        Returns:
+            True if the departure is within the bounds, False otherwise
+        """
+        if not self.is_date_range or number is None:
+            return False
+
+        if self.start_number is not None and number < self.start_number:
+            return False
+        if self.end_number is not None and number >= self.end_number:
+            return False
+        return True
+
+    @staticmethod
+    def parse_range(value: str) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Parse an ID ("5") or an inclusive ID range ("120..180", "..180", "120..").
+        
+        Args:
+            value: Qualifier value
+        
+        Returns:
+            Tuple of (low, high) bounds, (None, None) if the value is not numeric
+        """
+        if value.isdigit():
+            return int(value), int(value)
+
+        match = re.fullmatch(r'(\d*)\.\.(\d*)', value)
+        if not match or not (match.group(1) or match.group(2)):
+            return None, None
+
+        low = int(match.group(1)) if match.group(1) else None
+        high = int(match.group(2)) if match.group(2) else None
+        return low, high
+
+    def matches_number(self, number: Any) -> bool:
+        """
+        Check whether an ID lies within the predicate's bounds.
+        
+        Args:
+            number: ID to check
+        
+        Returns:
+            True if the ID is within the bounds, False otherwise
+        """
+        if not self.is_numeric:
+            return False
+
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            return False
+
+        if self.low is not None and number < self.low:
+            return False
+        if self.high is not None and number > self.high:
+            return False
+        return True
+
+    def implies(self, other: 'SearchPredicate') -> bool:
+        """
+        Check whether every record matching this predicate also matches another.
+        
+        Args:
+            other: Predicate to compare against
+        
+        Returns:
+            True if this predicate is at least as strict as the other one
+        """
+        if self.term == other.term:
+            return True
+
+        if self.field == other.field and self.is_numeric and other.is_numeric:
+            # ID ranges only get stricter when they lie within the other range
+            return ((other.low is None or (self.low is not None and self.low >= other.low))
+                    and (other.high is None or (self.high is not None and self.high <= other.high)))
+
+        if self.field == other.field and self.is_date_range and other.is_date_range:
+            return ((other.start is None or (self.start is not None and self.start >= other.start))
+                    and (other.end is None or (self.end is not None and self.end <= other.end)))
+
+        if other.qualified and other.operator != ":":
+            return False
+
+        if self.field == other.field == "phone" and phone_digits(other.value):
+            # Phone qualifiers match number endings, so only a longer ending is stricter
+            return phone_digits(self.value).endswith(phone_digits(other.value))
+
+        if other.qualified:
+            # Substring matches on the same field only get stricter as the value grows
+            return (self.field == other.field and not self.is_numeric
+                    and not other.is_numeric and other.value in self.value)
+
+        return not self.qualified and other.value in self.value
+
+
+def match_flight_fields(field: Callable[[str], Any], predicate: SearchPredicate) -> bool:
+    """
+    Check whether a flight matches a search predicate, given its search keys.
+    
+    Serial searches read the keys from the record manager and parallel
+    searches from the shared flight columns; both match through this
+    function, so they cannot disagree.
+    
+    Args:
+        field: Function returning a key of the flight by name: 'id', 'client_id',
+            'airline_id', 'client', 'airline', 'from', 'to' and 'date' return search
+            keys, 'departure' its departure number (None without a valid date)
+        predicate: Search predicate
+    
+    Returns:
+        True if the flight matches, False otherwise
+    """
+    term = predicate.value
+
+    if predicate.field == "id":
+        return predicate.matches_number(field("id"))
+    elif predicate.field in ("client", "airline") and predicate.is_numeric:
+        return predicate.matches_number(field(f"{predicate.field}_id"))
+    elif predicate.field in ("client", "airline", "from", "to"):
+        return term in field(predicate.field)
+    elif predicate.field == "date" and predicate.is_date_range:
+        return predicate.matches_departure(field("departure"))
+    elif predicate.field == "date":
+        return predicate.operator == ":" and term in field("date")
+
+    # Unqualified terms match any key, including the partial ISO date
+    return any(term in field(name) for name in FLIGHT_TEXT_FIELDS)
 
 
 class SearchController:
@@ -24,74 +363,773 @@ class SearchController:
     Provides comprehensive search functionality with a generic core
     that can be tailored for specific entity types.
     """
-    
-    def __init__(self, record_manager: RecordManager = None):
+
+    def __init__(self, record_manager: RecordManager = None, cache_size: int = DEFAULT_CACHE_SIZE,
+                 max_distance: int = DEFAULT_FUZZY_DISTANCE):
         """
         Initialize a new SearchController instance.
         
         Args:
             record_manager: RecordManager instance, creates a new one if None
+            cache_size: Maximum number of cached search results
+            max_distance: Largest edit distance accepted by fuzzy name searches
         """
         self.record_manager = record_manager or RecordManager()
+        self.max_distance = max_distance
+
+        # Views create a new controller per search, so the cache is shared per record manager
+        self.cache = _result_caches.get(self.record_manager)
+        if self.cache is None:
+            self.cache = LRUCache(cache_size)
+            _result_caches[self.record_manager] = self.cache
 
-    def parse_search_query(self, query: str) -> List[str]:
+        # Previous incremental search as (record_type, terms, version, results)
+        self._last_search = None
+
+    def parse_search_query(self, query: str, record_type: Optional[str] = None) -> List[str]:
         """
         Parse a search query into individual search terms.
         
+        Terms are separated by commas or spaces. Double quotes keep a phrase
+        together ("new york") and a qualifier may be separated from its value
+        by spaces ("from: london"), as long as it names a known field; other
+        text such as "note: london" stays as plain terms.
+        
         Args:
             query: The search query string
-            
+            record_type: Type of records searched, None to accept the fields of every type
+        
         Returns:
             List of individual search terms
         """
         if not query or not query.strip():
             return []
-            
-        # Split by commas or spaces and remove empty terms
-        terms = [term.strip() for term in re.split(r'[,\s]+', query) if term.strip()]
-        return terms
-    
+
+        if record_type is not None:
+            fields = SEARCH_FIELDS.get(record_type, ())
+        else:
+            fields = {field for type_fields in SEARCH_FIELDS.values() for field in type_fields}
+
+        # Attach qualifier values that were typed after a space
+        query = re.sub(r'(\w+):\s+',
+                       lambda m: f"{m.group(1)}:" if m.group(1).lower() in fields else m.group(0), query)
+
+        # Split by commas or spaces, keeping quoted phrases, and remove empty terms
+        tokens = re.findall(r'[^,\s"]*"[^"]*"?|[^,\s]+', query)
+        terms = [token.replace('"', '').strip() for token in tokens]
+        return [term for term in terms if term]
+
+    def parse_predicates(self, record_type: str, search_terms: Tuple[str, ...]) -> List[SearchPredicate]:
+        """
+        Convert search terms into predicates, recognising field qualifiers.
+        
+        A term is only treated as qualified when its prefix is a known field
+        of the record type, so values such as times ("14:00") still match
+        any field. Comparisons ("date>=2025-06", "id<100") are recognised
+        for the comparable fields of the record type.
+        
+        Args:
+            record_type: Type of records being searched
+            search_terms: Normalised search terms
+        
+        Returns:
+            List of search predicates
+        """
+        fields = SEARCH_FIELDS.get(record_type, ())
+        comparable = COMPARABLE_FIELDS.get(record_type, ())
+        predicates = []
+
+        for term in search_terms:
+            comparison = re.fullmatch(r'(\w+)(<=|>=|<|>)(.+)', term)
+            field, separator, value = term.partition(":")
+
+            if comparison and comparison.group(1) in comparable:
+                predicates.append(SearchPredicate(term, comparison.group(1), comparison.group(3),
+                                                  comparison.group(2)))
+            elif separator and value and field in fields:
+                predicates.append(SearchPredicate(term, field, value))
+            else:
+                predicates.append(SearchPredicate(term))
+
+        return predicates
+
+    def normalise_terms(self, terms: List[str]) -> Tuple[str, ...]:
+        """
+        Normalise search terms so equivalent queries share a cache entry.
+        
+        Terms are combined with AND logic and matched against search keys,
+        so order, duplicates, case and accents do not affect the results.
+        
+        Args:
+            terms: Parsed search terms
+        
+        Returns:
+            Sorted tuple of unique terms converted to search keys
+        """
+        return tuple(sorted({search_key(term) for term in terms}))
+
+    def cached_search(self, record_type: str, terms: Tuple[str, ...],
+                      search: Callable[[Tuple[str, ...]], List[BaseRecord]]) -> List[BaseRecord]:
+        """
+        Return cached results for a query, running the search on a cache miss.
+        
+        Entries are keyed by the current data version of the record manager,
+        and the cache is emptied once the version changes, so results of
+        older versions are neither returned nor kept alive.
+        
+        Args:
+            record_type: Type of records being searched
+            terms: Normalised search terms
+            search: Function computing the results for the terms
+        
+        Returns:
+            List of matching records
+        """
+        version = self.record_manager.version
+        self.cache.set_version(version)
+
+        key = (record_type, terms, version)
+        results = self.cache.get(key)
+        if results is None:
+            results = search(terms)
+            self.cache.put(key, results)
+
+        return list(results)
+
+    def search(self, record_type: str, search_query: str, mode: str = "exact") -> List[BaseRecord]:
+        """
+        Search records of the given type.
+        
+        Args:
+            record_type: Type of records to search ('client', 'airline', or 'flight')
+            search_query: Search query string
+            mode: 'exact' for substring and qualifier matching, 'fuzzy' for
+                approximate name matching, 'phonetic' for names that sound alike
+        
+        Returns:
+            List of records matching the search criteria
+        
+        Raises:
+            ValueError: If record type or search mode is unknown
+        """
+        if mode == "fuzzy":
+            return self.search_fuzzy(record_type, search_query)
+        elif mode == "phonetic":
+            return self.search_phonetic(record_type, search_query)
+        elif mode != "exact":
+            raise ValueError(f"Unknown search mode: {mode}")
+
+        if record_type == "client":
+            return self.search_clients(search_query)
+        elif record_type == "airline":
+            return self.search_airlines(search_query)
+        elif record_type == "flight":
+            return self.search_flights(search_query)
+        else:
+            raise ValueError(f"Unknown record type: {record_type}")
+
+    def search_all(self, search_query: str, limit: int = DEFAULT_GROUP_LIMIT) -> Dict[str, List[BaseRecord]]:
+        """
+        Search clients, airlines and flights with a single query.
+        
+        Each record type is searched through the same indexes and result
+        cache as the per-type searches, so opening a view with the same
+        query afterwards is answered from the cache. A "~" or "%" prefix
+        runs the fuzzy or phonetic name search on the types supporting it.
+        
+        Args:
+            search_query: Search query string
+            limit: Maximum number of records returned per record type
+        
+        Returns:
+            Dictionary of record type to its best matching records, best first
+        """
+        return dict(self.iter_search_all(search_query, limit))
+
+    def iter_search_all(self, search_query: str, limit: int = DEFAULT_GROUP_LIMIT,
+                        cancelled: Optional[Callable[[], bool]] = None) -> Iterator[Tuple[str, List[BaseRecord]]]:
+        """
+        Generator variant of search_all, yielding the results of each record type once it is searched.
+        
+        Args:
+            search_query: Search query string
+            limit: Maximum number of records returned per record type
+            cancelled: Function polled between record types; the search stops once it returns True
+        
+        Yields:
+            (record type, best matching records) tuples, in SEARCH_FIELDS order
+        """
+        has_terms = bool(self.parse_search_query(search_query))
+        mode = SEARCH_MODE_PREFIXES.get(search_query[:1])
+
+        for record_type in SEARCH_FIELDS:
+            if cancelled is not None and cancelled():
+                return
+
+            if not has_terms:
+                yield record_type, []
+            elif mode is not None:
+                yield record_type, (self.search(record_type, search_query[1:], mode)[:limit]
+                                    if record_type in SEARCH_MODE_INDEXES[mode] else [])
+            else:
+                yield record_type, self.search_ranked(record_type, search_query, limit)
+
+    def search_fuzzy(self, record_type: str, search_query: str,
+                     max_distance: Optional[int] = None) -> List[BaseRecord]:
+        """
+        Search clients or airlines by approximate name.
+        
+        The normalised query is compared by edit distance against each whole
+        name and each word of it, using the record manager's BK-tree index,
+        so misspellings such as "smyth" still find "John Smith".
+        
+        Args:
+            record_type: Type of records to search ('client' or 'airline')
+            search_query: Name, or part of a name, to look up
+            max_distance: Largest edit distance accepted, defaults to the controller's setting
+        
+        Returns:
+            List of matching records, closest matches first
+        
+        Raises:
+            ValueError: If the record type has no name index
+        """
+        if record_type not in SEARCH_MODE_INDEXES["fuzzy"]:
+            raise ValueError(f"Fuzzy search is not supported for {record_type} records")
+
+        name = normalise_name(search_query)
+        if not name:
+            return self.record_manager.get_records_by_type(record_type)
+
+        if max_distance is None:
+            max_distance = self.max_distance
+
+        index = self.record_manager.get_index(SEARCH_MODE_INDEXES["fuzzy"][record_type])
+        return [self.record_manager.find_record(record_id, record_type)
+                for _, record_id in index.search(name, max_distance)]
+
+    def search_phonetic(self, record_type: str, search_query: str) -> List[BaseRecord]:
+        """
+        Search clients by names that sound like the query.
+        
+        Each word of the query is reduced to its Soundex code and looked up
+        in the record manager's phonetic index, so "Smyth" finds "Smith".
+        Words are combined with AND logic.
+        
+        Args:
+            record_type: Type of records to search ('client')
+            search_query: Name, or words of a name, as heard
+        
+        Returns:
+            List of matching records, in storage order
+        
+        Raises:
+            ValueError: If the record type has no phonetic index
+        """
+        if record_type not in SEARCH_MODE_INDEXES["phonetic"]:
+            raise ValueError(f"Phonetic search is not supported for {record_type} records")
+
+        codes = phonetic_keys(search_query)
+        if not codes:
+            return self.record_manager.get_records_by_type(record_type)
+
+        index = self.record_manager.get_index(SEARCH_MODE_INDEXES["phonetic"][record_type])
+        candidate_ids = index.get(codes[0])
+        for code in codes[1:]:
+            candidate_ids &= index.get(code)
+
+        return self.record_manager.get_records_by_ids(candidate_ids, record_type)
+
+    def search_ranked(self, record_type: str, search_query: str,
+                      limit: int = DEFAULT_RANK_LIMIT) -> List[BaseRecord]:
+        """
+        Search records and return only the best matches, best first.
+        
+        Args:
+            record_type: Type of records to search ('client', 'airline', or 'flight')
+            search_query: Search query string
+            limit: Maximum number of records to return
+        
+        Returns:
+            List of at most limit records, ordered by relevance
+        """
+        return self.rank_results(record_type, self.search(record_type, search_query), search_query, limit)
+
+    def rank_results(self, record_type: str, records: List[BaseRecord], search_query: str,
+                     limit: int = DEFAULT_RANK_LIMIT) -> List[BaseRecord]:
+        """
+        Order search results by relevance and keep the best ones.
+        
+        The best matches are selected with a heap bounded by the limit, so
+        a short term matching most of a large collection does not sort
+        every result. Equally relevant records keep their order.
+        
+        Args:
+            record_type: Type of the records
+            records: Records matching the query
+            search_query: Search query string the records were found by
+            limit: Maximum number of records to return
+        
+        Returns:
+            List of at most limit records, ordered by relevance
+        """
+        predicates = self.parse_predicates(record_type,
+                                           self.normalise_terms(self.parse_search_query(search_query, record_type)))
+        return heapq.nlargest(limit, records, key=lambda r: self.score(record_type, r, predicates))
+
+    def score(self, record_type: str, record: BaseRecord, predicates: List[SearchPredicate]) -> int:
+        """
+        Score how well a record matches a query.
+        
+        Each text term adds the weight of the field it matches best, times 3
+        for an exact match, 2 for a word prefix or 1 for a substring. ID
+        ranges and date bounds only filter, so they do not add to the score.
+        
+        Args:
+            record_type: Type of the record
+            record: Record to score
+            predicates: Parsed search predicates
+        
+        Returns:
+            Relevance score, higher is better
+        """
+        weights = RANK_FIELD_WEIGHTS.get(record_type, {})
+        values = self.rank_values(record_type, record)
+        total = 0
+
+        for predicate in predicates:
+            if predicate.is_numeric or predicate.is_date_range or predicate.operator != ":":
+                continue
+
+            fields = [predicate.field] if predicate.qualified else weights
+            total += max((weights.get(field, 0) * self.match_quality(values.get(field, ""), predicate.value)
+                          for field in fields), default=0)
+
+        return total
+
+    @staticmethod
+    def match_quality(value: str, term: str) -> int:
+        """Return 3 if a value equals a term, 2 if a word starts with it, 1 if it contains it, else 0."""
+        if value == term:
+            return 3
+        if value.startswith(term) or f" {term}" in value:
+            return 2
+        if term in value:
+            return 1
+        return 0
+
+    def rank_values(self, record_type: str, record: BaseRecord) -> Dict[str, str]:
+        """
+        Return the search keys of the fields a record is ranked on.
+        
+        Args:
+            record_type: Type of the record
+            record: Record to describe
+        
+        Returns:
+            Dictionary of field name to search key
+        """
+        values = dict(self.search_keys(record_type, record))
+        if record_type == "flight":
+            values["client"] = self.client_name(record)
+            values["airline"] = self.airline_name(record)
+        return values
+
+    def run_search(self, record_type: str, search_terms: Tuple[str, ...]) -> List[BaseRecord]:
+        """
+        Evaluate normalised search terms against the records of a type.
+        
+        Args:
+            record_type: Type of records to search
+            search_terms: Normalised search terms
+        
+        Returns:
+            List of records matching every term, in storage order
+        """
+        predicates = self.parse_predicates(record_type, search_terms)
+        search_results, remaining = self.plan_search(record_type, predicates)
+
+        for predicate in remaining:
+            search_results = [r for r in search_results if self.matches(record_type, r, predicate)]
+
+        return search_results
+
+    def plan_search(self, record_type: str,
+                    predicates: List[SearchPredicate]) -> Tuple[List[BaseRecord], List[SearchPredicate]]:
+        """
+        Choose the evaluation order for a query.
+        
+        The indexed predicate with the fewest candidates produces the initial
+        record set instead of the full collection. The remaining predicates
+        then filter it, precise qualified predicates before any-field terms.
+        
+        Args:
+            record_type: Type of records being searched
+            predicates: Parsed search predicates
+        
+        Returns:
+            Tuple of (candidate records, predicates still to be applied)
+        """
+        best_ids = None
+        best_predicate = None
+
+        for predicate in predicates:
+            if not predicate.qualified:
+                continue
+
+            candidate_ids = self.indexed_candidates(record_type, predicate)
+            if candidate_ids is not None and (best_ids is None or len(candidate_ids) < len(best_ids)):
+                best_ids = candidate_ids
+                best_predicate = predicate
+
+        remaining = sorted((p for p in predicates if p is not best_predicate),
+                           key=lambda p: not p.qualified)
+
+        if best_predicate is None:
+            return self.record_manager.get_records_by_type(record_type), remaining
+
+        return self.record_manager.get_records_by_ids(best_ids, record_type), remaining
+
+    def indexed_candidates(self, record_type: str, predicate: SearchPredicate) -> Optional[Set[int]]:
+        """
+        Resolve a qualified predicate through the record manager's indexes.
+        
+        Args:
+            record_type: Type of records being searched
+            predicate: Qualified search predicate
+        
+        Returns:
+            Set of IDs of the matching records, or None if the predicate is not indexed
+        """
+        if predicate.field == "id" and predicate.is_numeric:
+            primary = self.record_manager.get_index(f"{record_type}_by_id")
+            if (predicate.low is not None and predicate.high is not None
+                    and predicate.high - predicate.low < len(primary)):
+                return {i for i in range(predicate.low, predicate.high + 1) if primary.get(i) is not None}
+            return {i for i in primary.ids() if predicate.matches_number(i)}
+
+        if record_type == "flight" and predicate.field in ("client", "airline"):
+            # Resolve the referenced records first, then their flights
+            index = self.record_manager.get_index(f"flights_by_{predicate.field}")
+            if predicate.is_numeric:
+                reference_ids = [i for i in index.keys() if predicate.matches_number(i)]
+            else:
+                reference_ids = [r.id for r in self.record_manager.get_records_by_type(predicate.field)
+                                 if predicate.value in self.search_keys(predicate.field, r)["name"]]
+
+            candidate_ids = set()
+            for reference_id in reference_ids:
+                candidate_ids.update(index.get(int(reference_id)))
+            return candidate_ids
+
+        if (record_type == "client" and predicate.field == "phone"
+                and len(phone_digits(predicate.value)) >= MIN_PHONE_SUFFIX):
+            return self.record_manager.get_index("clients_by_phone_suffix").get(phone_digits(predicate.value))
+
+        if record_type == "flight" and predicate.is_date_range:
+            return set(self.record_manager.get_index("flights_by_date").range(predicate.start, predicate.end))
+
+        return None
+
+    def search_keys(self, record_type: str, record: BaseRecord) -> Dict[str, str]:
+        """
+        Return the search keys of a record.
+        
+        Keys are read from the record manager's key index, where they are
+        computed once per record and edit. Records the index does not know
+        have their keys computed on the spot.
+        
+        Args:
+            record_type: Type of the record
+            record: Record to look up
+        
+        Returns:
+            Dictionary of field name to search key
+        """
+        keys = self.record_manager.get_index(f"{record_type}_search_keys").get(record.id)
+        return keys if keys is not None else record_search_keys(record_type, record)
+
+    def filter_records(self, record_type: str, records: List[BaseRecord],
+                       search_terms: Tuple[str, ...]) -> List[BaseRecord]:
+        """
+        Filter records of the given type by normalised search terms (AND logic).
+        
+        Args:
+            record_type: Type of records to filter
+            records: Records to filter
+            search_terms: Normalised search terms
+        
+        Returns:
+            List of records matching every term
+        """
+        search_results = records
+        for predicate in self.parse_predicates(record_type, search_terms):
+            search_results = [r for r in search_results if self.matches(record_type, r, predicate)]
+
+        return search_results
+
+    def matches(self, record_type: str, record: BaseRecord, predicate: SearchPredicate) -> bool:
+        """
+        Check whether a record matches a single search predicate.
+        
+        Args:
+            record_type: Type of the record
+            record: Record to check
+            predicate: Search predicate
+        
+        Returns:
+            True if the record matches, False otherwise
+        
+        Raises:
+            ValueError: If record type is unknown
+        """
+        if record_type == "client":
+            return self.match_client(record, predicate)
+        elif record_type == "airline":
+            return self.match_airline(record, predicate)
+        elif record_type == "flight":
+            return self.match_flight(record, predicate)
+        else:
+            raise ValueError(f"Unknown record type: {record_type}")
+
+    def refines(self, record_type: str, previous_terms: Tuple[str, ...],
+                search_terms: Tuple[str, ...]) -> bool:
+        """
+        Check whether a query can only match a subset of a previous query.
+        
+        Terms are combined with AND logic, so this holds when every previous
+        term is implied by at least one of the new terms (e.g. "kev" by "kevin").
+        
+        Args:
+            record_type: Type of records being searched
+            previous_terms: Normalised terms of the previous query
+            search_terms: Normalised terms of the new query
+        
+        Returns:
+            True if the new results are a subset of the previous results
+        """
+        previous = self.parse_predicates(record_type, previous_terms)
+        current = self.parse_predicates(record_type, search_terms)
+
+        return all(any(new.implies(old) for new in current) for old in previous)
+
+    def refinable_search(self, record_type: str, search_terms: Tuple[str, ...],
+                         version: int) -> Optional[Tuple[str, Tuple[str, ...], int, List[BaseRecord]]]:
+        """
+        Return the previous search when a query can be answered by filtering its results.
+        
+        Args:
+            record_type: Type of records being searched
+            search_terms: Normalised terms of the new query
+            version: Current data version
+        
+        Returns:
+            The remembered (record type, terms, version, results) tuple, or None
+        """
+        previous = self._last_search
+        if (previous is not None and previous[0] == record_type and previous[2] == version
+                and self.refines(record_type, previous[1], search_terms)):
+            return previous
+        return None
+
+    def has_warm_results(self, record_type: str, search_query: str) -> bool:
+        """
+        Check whether a query is answered from the cache or by refining the previous search.
+        
+        Args:
+            record_type: Type of records to search
+            search_query: Search query string
+        
+        Returns:
+            True if the incremental search would not scan the full candidate set
+        """
+        mode = SEARCH_MODE_PREFIXES.get(search_query[:1])
+        if mode is not None and record_type in SEARCH_MODE_INDEXES[mode]:
+            return True
+
+        search_terms = self.normalise_terms(self.parse_search_query(search_query, record_type))
+        version = self.record_manager.version
+        self.cache.set_version(version)
+        return (self.cache.get((record_type, search_terms, version)) is not None
+                or self.refinable_search(record_type, search_terms, version) is not None)
+
+    def search_incremental(self, record_type: str, search_query: str) -> List[BaseRecord]:
+        """
+        Search records, reusing the previous results when the query narrows them.
+        
+        Intended for search-as-you-type: when the new query extends the previous
+        one (more characters or an extra term), only the previous result set is
+        filtered instead of the full collection. A query starting with "~"
+        runs a fuzzy name search for clients and airlines, and one starting
+        with "%" a phonetic search for clients.
+        
+        Args:
+            record_type: Type of records to search ('client', 'airline', or 'flight')
+            search_query: Search query string
+        
+        Returns:
+            List of records matching the search criteria
+        """
+        return list(self.iter_search_incremental(record_type, search_query))
+
+    def iter_search_incremental(self, record_type: str, search_query: str,
+                                cancelled: Optional[Callable[[], bool]] = None,
+                                plan: Optional[Tuple[List[BaseRecord], List[SearchPredicate]]] = None
+                                ) -> Iterator[BaseRecord]:
+        """
+        Generator variant of search_incremental, yielding matches as they are found.
+        
+        Lets a view show the first results before the whole collection has
+        been scanned. Only a search that runs to completion is cached and
+        remembered for refinement, so closing the generator early is safe.
+        
+        Args:
+            record_type: Type of records to search ('client', 'airline', or 'flight')
+            search_query: Search query string
+            cancelled: Function polled while scanning; the search stops once it returns True
+            plan: Result of plan_search for the query, if the caller already planned it
+        
+        Yields:
+            Records matching the search criteria, in storage order
+        """
+        mode = SEARCH_MODE_PREFIXES.get(search_query[:1])
+        if mode is not None and record_type in SEARCH_MODE_INDEXES[mode]:
+            # Name-matching modes are index lookups, so they are never refined in place
+            self._last_search = None
+            yield from self.search(record_type, search_query[1:], mode)
+            return
+
+        search_terms = self.normalise_terms(self.parse_search_query(search_query, record_type))
+        version = self.record_manager.version
+        self.cache.set_version(version)
+        cached = self.cache.get((record_type, search_terms, version))
+        previous = None if cached is not None else self.refinable_search(record_type, search_terms, version)
+
+        if not search_terms:
+            records, predicates = self.record_manager.get_records_by_type(record_type), []
+        elif cached is not None:
+            records, predicates = cached, []
+        elif previous is not None:
+            new_terms = tuple(term for term in search_terms if term not in previous[1])
+            records, predicates = previous[3], self.parse_predicates(record_type, new_terms)
+        elif plan is not None:
+            records, predicates = plan
+        else:
+            records, predicates = self.plan_search(record_type, self.parse_predicates(record_type, search_terms))
+
+        results = []
+        for record in records:
+            if cancelled is not None and cancelled():
+                return
+
+            if all(self.matches(record_type, record, predicate) for predicate in predicates):
+                results.append(record)
+                yield record
+
+        self.remember_search(record_type, search_terms, version, results)
+
+    def remember_search(self, record_type: str, search_terms: Tuple[str, ...],
+                        version: int, results: List[BaseRecord]) -> None:
+        """
+        Cache the complete results of a query and keep them for refinement.
+        
+        Args:
+            record_type: Type of records searched
+            search_terms: Normalised search terms
+            version: Data version of the record manager when the search started
+            results: Every record matching the terms, in storage order
+        """
+        # Results of data changed during the search are stale, and must not evict current ones
+        if search_terms and version == self.cache.version:
+            self.cache.put((record_type, search_terms, version), results)
+        self._last_search = (record_type, search_terms, version, results)
+
     def search_clients(self, search_query: str) -> List[BaseRecord]:
         """
         Search for clients matching the given query.
         
         The search supports:
         - Partial matches on client ID, name, country or phone number
+          (phone numbers are compared by their digits, ignoring formatting)
+        - Field qualifiers: id:, name:, city:, country:, phone:
+          (phone: matches the last digits of the number, e.g. 'phone:"7946 0958"')
         - Multiple search terms (combined with AND logic)
         
         Args:
             query: Search query string
-            
+        
         Returns:
             List of client records matching the search criteria
         """
         # Parse the query into search terms
-        search_terms = self.parse_search_query(search_query)
-        
-        # Get all client records
-        all_clients = self.record_manager.get_records_by_type('client')
-        
+        search_terms = self.parse_search_query(search_query, 'client')
+
         # If no search terms, return all clients
         if not search_terms:
-            return all_clients
-            
-        # Filter clients based on search terms
-        search_results = all_clients
-        for term in search_terms:
-            # Filter results for this term
-            term_results = []
-            for client in search_results:
-                # Check if term matches ID, name, country or phone number
-                id_match = term in str(client.id)
-                name_match = term.lower() in client.name.lower()
-                country_match = term.lower() in client.country.lower()
-                phone_match = term in str(client.phone_number)
-                
-                if id_match or name_match or country_match or phone_match:
-                    term_results.append(client)
-            search_results = term_results
-            
-        return search_results
+            return self.record_manager.get_records_by_type('client')
+
+        return self.cached_search('client', self.normalise_terms(search_terms),
+                                  lambda terms: self.run_search('client', terms))
+
+    def match_client(self, client: BaseRecord, predicate: SearchPredicate) -> bool:
+        """
+        Check whether a client matches a search predicate.
+        
+        Args:
+            client: Client record to check
+            predicate: Search predicate
+        
+        Returns:
+            True if the client matches, False otherwise
+        """
+        term = predicate.value
+        keys = self.search_keys("client", client)
+
+        if not predicate.qualified:
+            # Check if term matches ID, name, country or phone number
+            id_match = term in keys["id"]
+            name_match = term in keys["name"]
+            country_match = term in keys["country"]
+            phone_match = self.match_phone(keys["phone"], term)
+
+            return id_match or name_match or country_match or phone_match
+
+        if predicate.field == "id":
+            return predicate.matches_number(client.id)
+        elif predicate.field == "name":
+            return term in keys["name"]
+        elif predicate.field == "city":
+            return term in keys["city"]
+        elif predicate.field == "country":
+            return term in keys["country"]
+        elif predicate.field == "phone":
+            if phone_digits(term):
+                return phone_digits(keys["phone"]).endswith(phone_digits(term))
+            return term in keys["phone"]
+
+        return False
+
+    def match_phone(self, phone_number: Any, term: str) -> bool:
+        """
+        Check whether a search term occurs in a phone number, ignoring formatting.
+        
+        Terms made of digits and phone punctuation ("+44", "(20)", "7946-0958")
+        are compared by their digits, other terms by plain substring.
+        
+        Args:
+            phone_number: Search key of the record's phone number
+            term: Search term
+        
+        Returns:
+            True if the term matches the number, False otherwise
+        """
+        if term in phone_number:
+            return True
+
+        if not re.fullmatch(r'[\d()+.-]+', term) or not phone_digits(term):
+            return False
+
+        return phone_digits(term) in phone_digits(phone_number)
 
     def search_airlines(self, search_query: str) -> List[BaseRecord]:
         """
@@ -99,40 +1137,53 @@ class SearchController:
         
         The search supports:
         - Partial matches on airline ID or company name
+        - Field qualifiers: id:, name:
         - Multiple search terms (combined with AND logic)
         
         Args:
             query: Search query string
-            
+        
         Returns:
             List of airline records matching the search criteria
         """
         # Parse the query into search terms
-        search_terms = self.parse_search_query(search_query)
+        search_terms = self.parse_search_query(search_query, 'airline')
 
-        # Get all airline records
-        all_airlines = self.record_manager.get_records_by_type('airline')
-        
         # If no search terms, return all airlines
         if not search_terms:
-            return all_airlines
-            
-        # Filter airlines based on search terms
-        search_results = all_airlines
-        for term in search_terms:
-            # Filter results for this term
-            term_results = []
-            for airline in search_results:
-                # Check if term matches ID or company name
-                id_match = term in str(airline.id)
-                name_match = term.lower() in airline.company_name.lower()
-
-                if id_match or name_match:
-                    term_results.append(airline)
-            search_results = term_results
-            
-        return search_results
-    
+            return self.record_manager.get_records_by_type('airline')
+
+        return self.cached_search('airline', self.normalise_terms(search_terms),
+                                  lambda terms: self.run_search('airline', terms))
+
+    def match_airline(self, airline: BaseRecord, predicate: SearchPredicate) -> bool:
+        """
+        Check whether an airline matches a search predicate.
+        
+        Args:
+            airline: Airline record to check
+            predicate: Search predicate
+        
+        Returns:
+            True if the airline matches, False otherwise
+        """
+        term = predicate.value
+        keys = self.search_keys("airline", airline)
+
+        if not predicate.qualified:
+            # Check if term matches ID or company name
+            id_match = term in keys["id"]
+            name_match = term in keys["name"]
+
+            return id_match or name_match
+
+        if predicate.field == "id":
+            return predicate.matches_number(airline.id)
+        elif predicate.field == "name":
+            return term in keys["name"]
+
+        return False
+
     def search_flights(self, search_query: str) -> List[BaseRecord]:
         """
         Search for flights matching the given query.
@@ -140,65 +1191,59 @@ class SearchController:
         The search supports:
         - Partial matches on flight ID, client ID, client name, client phone number, airline ID,
           airline name, date, start city, or end city
+        - Field qualifiers: id:, client:, airline:, from:, to:, date:
+          (e.g. "client:smith from:london date:2025-06 id:120..180")
+        - Departure date comparisons: date>=, date>, date<=, date<
+          (e.g. "date>=2025-06-01 date<2025-07")
         - Multiple search terms (combined with AND logic)
         
         Args:
             query: Search query string
-            
+        
         Returns:
             List of flight records matching the search criteria
         """
         # Parse the query into search terms
-        search_terms = self.parse_search_query(search_query)
-        
-        # Get all flight records
-        all_flights = self.record_manager.get_records_by_type('flight')
-        
+        search_terms = self.parse_search_query(search_query, 'flight')
+
         # If no search terms, return all flights
         if not search_terms:
-            return all_flights
-            
-        # Filter flights based on search terms
-        search_results = all_flights
-        for term in search_terms:
-            # Filter results for this term
-            term_results = []
-            for flight in search_results:
-                # Check if term matches flight ID, client ID, client name, client phone number,
-                # airline ID, airline name, start city, or end city
-                id_match = term in str(flight.id)
-                client_id_match = term in str(flight.client_id)
-                airline_id_match = term in str(flight.airline_id)
-                start_city_match = term.lower() in flight.start_city.lower()
-                end_city_match = term.lower() in flight.end_city.lower()
-
-                # Also check client and airline name matches
-                client_name_match = False
-                try:
-                    client = self.record_manager.get_record_by_id(flight.client_id, "client")
-                    client_name_match = term.lower() in client.name.lower()
-                except:
-                    pass
-
-                airline_name_match = False
-                try:
-                    airline = self.record_manager.get_record_by_id(flight.airline_id, "airline")
-                    airline_name_match = term.lower() in airline.company_name.lower()
-                except:
-                    pass
-                
-                # Also check date matches (partial string in ISO format)
-                date_match = False
-                if hasattr(flight, 'date'):
-                    try:
-                        date_str = flight.date.isoformat()
-                        date_match = term in date_str
-                    except:
-                        pass
-                
-                if (id_match or client_id_match or client_name_match or airline_id_match or 
-                    airline_name_match or start_city_match or end_city_match or date_match):
-                    term_results.append(flight)
-            search_results = term_results
-            
-        return search_results
+            return self.record_manager.get_records_by_type('flight')
+
+        return self.cached_search('flight', self.normalise_terms(search_terms),
+                                  lambda terms: self.run_search('flight', terms))
+
+    def match_flight(self, flight: BaseRecord, predicate: SearchPredicate) -> bool:
+        """
+        Check whether a flight matches a search predicate.
+        
+        Args:
+            flight: Flight record to check
+            predicate: Search predicate
+        
+        Returns:
+            True if the flight matches, False otherwise
+        """
+        keys = self.search_keys("flight", flight)
+
+        def field(name):
+            # Names and the departure number are only resolved when a predicate needs them
+            if name == "client":
+                return self.client_name(flight)
+            elif name == "airline":
+                return self.airline_name(flight)
+            elif name == "departure":
+                return departure_number(getattr(flight, "date", None))
+            return keys[name]
+
+        return match_flight_fields(field, predicate)
+
+    def client_name(self, flight: BaseRecord) -> str:
+        """Return the search key of a flight's client name, empty if it cannot be resolved."""
+        client = self.record_manager.find_record(flight.client_id, "client")
+        return self.search_keys("client", client)["name"] if client is not None else ""
+
+    def airline_name(self, flight: BaseRecord) -> str:
+        """Return the search key of a flight's airline name, empty if it cannot be resolved."""
+        airline = self.record_manager.find_record(flight.airline_id, "airline")
+        return self.search_keys("airline", airline)["name"] if airline is not None else ""
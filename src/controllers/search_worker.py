@@ -0,0 +1,241 @@
+"""
+Search Worker module for FlyRecordKeeper.
+
+This module runs SearchController queries on a background thread, so large
+searches do not block the Tk event loop.
+
+Searches work on a read-only snapshot of the RecordManager. Results are
+passed back in batches through a thread-safe queue, which the view polls
+with after(); Tk widgets are only ever touched from the main thread.
+
+A worker runs one query at a time on its own SearchController, but the
+workers of different views search the same snapshot concurrently. The
+snapshot builds its indexes under a lock, and the result cache shared by
+its controllers locks every access.
+"""
+
+import queue
+import threading
+from typing import Any, Callable, Hashable, Iterator, List, Optional, Tuple
+
+from controllers.parallel_search import ParallelFlightSearch
+from controllers.search_controller import SearchController, DEFAULT_GROUP_LIMIT
+from models.base_record import BaseRecord
+from models.record_manager import RecordManager
+
+# Number of records passed back to the view per batch
+DEFAULT_BATCH_SIZE = 100
+
+
+class SearchWorker:
+    """
+    Runs one search at a time on a background thread.
+    
+    Submitting a new query cancels the one still running, and batches of a
+    superseded query are discarded when polled.
+    """
+
+    def __init__(self, record_manager: RecordManager, batch_size: int = DEFAULT_BATCH_SIZE,
+                 parallel: ParallelFlightSearch = None):
+        """
+        Initialize a new SearchWorker instance.
+        
+        Args:
+            record_manager: RecordManager whose records are searched
+            batch_size: Number of records passed back per batch
+            parallel: Engine used for flight searches, spreading large ones across processes
+        """
+        self.record_manager = record_manager
+        self.batch_size = batch_size
+        self.parallel = parallel or ParallelFlightSearch()
+        self.results = queue.Queue()
+
+        self._query_id = 0
+        self._cancel_event = None
+        self._thread = None
+
+        # Controller for the current snapshot, kept so consecutive queries can refine
+        self._controller = None
+
+        # Page key functions by sort name, each with the snapshot it was built for
+        self._page_keys = {}
+
+    def submit(self, record_type: str, search_query: str) -> int:
+        """
+        Start searching in the background, cancelling the previous query.
+        
+        Args:
+            record_type: Type of records to search ('client', 'airline', or 'flight')
+            search_query: Search query string
+        
+        Returns:
+            ID of the new query
+        """
+        if record_type == "flight":
+            search = lambda controller, cancelled: self.parallel.iter_search(controller, search_query, cancelled)
+        else:
+            search = lambda controller, cancelled: controller.iter_search_incremental(record_type, search_query,
+                                                                                      cancelled)
+        return self._start(search, self.batch_size)
+
+    def submit_all(self, search_query: str, limit: int = DEFAULT_GROUP_LIMIT) -> int:
+        """
+        Start searching every record type in the background, cancelling the previous query.
+        
+        Each record type's results are queued as their own batch, holding a
+        single (record type, records) tuple, as soon as that type is searched.
+        
+        Args:
+            search_query: Search query string
+            limit: Maximum number of records returned per record type
+        
+        Returns:
+            ID of the new query
+        """
+        return self._start(lambda controller, cancelled: controller.iter_search_all(search_query, limit, cancelled),
+                           1)
+
+    def submit_ranked(self, record_type: str, search_query: str, limit: int) -> int:
+        """
+        Start a ranked search in the background, cancelling the previous query.
+        
+        The query runs as an incremental search, so it refines the previous
+        one where it can. Its results are queued as a single batch holding
+        one (best results, number of matches) tuple.
+        
+        Args:
+            record_type: Type of records to search ('client', 'airline', or 'flight')
+            search_query: Search query string
+            limit: Maximum number of results returned, best first
+        
+        Returns:
+            ID of the new query
+        """
+        def search(controller, cancelled):
+            results = list(controller.iter_search_incremental(record_type, search_query, cancelled))
+            if not cancelled():
+                yield controller.rank_results(record_type, results, search_query, limit), len(results)
+
+        return self._start(search, 1)
+
+    def submit_page(self, record_type: str, offset: int, limit: int, sort_name: Hashable = None,
+                    sort_key_for: Callable[[RecordManager], Callable[[BaseRecord], Any]] = None,
+                    reverse: bool = False) -> int:
+        """
+        Start reading a page of records in the background, cancelling the previous query.
+        
+        Sorting a whole collection takes a while, so pages in a sort order
+        are read from the snapshot on the worker thread. The key function
+        is built once per snapshot and sort name, so reading further pages
+        in the same order only slices the sorted records. An offset past
+        the last record reads the last page instead. The page is queued as
+        a single batch holding one (offset, records, total) tuple.
+        
+        Args:
+            record_type: Type of records to read ('client', 'airline', or 'flight')
+            offset: Position of the first record of the page
+            limit: Maximum number of records on the page
+            sort_name: Name of the sort order (e.g. the sorted column), None for storage order
+            sort_key_for: Function building the key function for a snapshot; the
+                key runs on the worker thread, so it must not touch Tk widgets
+            reverse: True to order by descending sort key
+        
+        Returns:
+            ID of the new query
+        """
+        def search(controller, cancelled):
+            snapshot = controller.record_manager
+            sort_key = None
+            if sort_name is not None:
+                # Only worker threads touch the key cache, and they run one at a time
+                cached = self._page_keys.get(sort_name)
+                if cached is None or cached[0] is not snapshot:
+                    cached = self._page_keys[sort_name] = (snapshot, sort_key_for(snapshot))
+                sort_key = cached[1]
+
+            page_offset = offset
+            records, total = snapshot.get_page(record_type, page_offset, limit, sort_key, reverse=reverse)
+            if not records and page_offset > 0 and limit:
+                page_offset = max(0, total - 1) // limit * limit
+                records, total = snapshot.get_page(record_type, page_offset, limit, sort_key, reverse=reverse)
+
+            if not cancelled():
+                yield page_offset, records, total
+
+        return self._start(search, 1)
+
+    def _start(self, search: Callable[[SearchController, Callable[[], bool]], Iterator[Any]],
+               batch_size: int) -> int:
+        """Cancel the previous query and run a search on a new worker thread."""
+        self.cancel()
+
+        snapshot = self.record_manager.snapshot()
+        if self._controller is None or self._controller.record_manager is not snapshot:
+            self._controller = SearchController(snapshot)
+
+        self._query_id += 1
+        self._cancel_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(self._query_id, self._controller, search, batch_size, self._cancel_event, self._thread),
+            daemon=True
+        )
+        self._thread.start()
+
+        return self._query_id
+
+    def _run(self, query_id: int, controller: SearchController,
+             search: Callable[[SearchController, Callable[[], bool]], Iterator[Any]], batch_size: int,
+             cancel_event: threading.Event, previous: Optional[threading.Thread]) -> None:
+        """Run a query on the worker thread, queueing its results in batches."""
+        # The controller is not thread-safe, so wait for the cancelled query to stop
+        if previous is not None:
+            previous.join()
+
+        batch = []
+        try:
+            for record in search(controller, cancel_event.is_set):
+                batch.append(record)
+                if len(batch) >= batch_size:
+                    self.results.put((query_id, batch, False))
+                    batch = []
+        except Exception as e:
+            self.results.put((query_id, e, True))
+            return
+
+        if not cancel_event.is_set():
+            self.results.put((query_id, batch, True))
+
+    def cancel(self) -> None:
+        """Cancel the running query, if any."""
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+            self._cancel_event = None
+
+    def poll(self) -> List[Tuple[List[BaseRecord], bool]]:
+        """
+        Collect the batches queued for the current query without blocking.
+        
+        Returns:
+            List of (records, done) tuples; done is True for the last batch
+        
+        Raises:
+            Exception: Any error raised while the current query was running
+        """
+        batches = []
+        while True:
+            try:
+                query_id, payload, done = self.results.get_nowait()
+            except queue.Empty:
+                return batches
+
+            if query_id != self._query_id or self._cancel_event is None:
+                continue
+
+            if isinstance(payload, Exception):
+                self._cancel_event = None
+                raise payload
+
+            batches.append((payload, done))
+            if done:
+                self._cancel_event = None
@@ -1,6 +1,11 @@
+import multiprocessing
+
 from views import app
 
 
 if __name__ == "__main__":
+    # Needed by the parallel search's worker processes in frozen builds
+    multiprocessing.freeze_support()
+
     # Create the app instance
     app = app.App()
@@ -0,0 +1,114 @@
+"""
+Change feed module for FlyRecordKeeper.
+
+This module provides the publish/subscribe feed through which the
+RecordManager announces record changes, so views and caches can apply
+them incrementally instead of re-reading whole collections.
+
+Every change is published as a ChangeEvent:
+1. created, updated and deleted events carry the type and ID of one record
+2. reloaded events mean a whole collection was replaced (record ID is None)
+
+Subscribers receive events in batches. Outside a transaction each event
+is delivered on its own; changes made inside a transaction are delivered
+together once the outermost transaction ends.
+"""
+from typing import Callable, List, Optional
+
+# Actions a change event can announce
+CREATED = "created"
+UPDATED = "updated"
+DELETED = "deleted"
+RELOADED = "reloaded"
+
+
+class ChangeEvent:
+    """
+    A change to one record, or to a whole collection of records.
+    """
+
+    __slots__ = ("action", "record_type", "record_id")
+
+    def __init__(self, action: str, record_type: str, record_id: Optional[int] = None):
+        """
+        Initialize a new ChangeEvent instance.
+
+        Args:
+            action: One of CREATED, UPDATED, DELETED or RELOADED
+            record_type: Type of the changed record ('client', 'airline', or 'flight')
+            record_id: ID of the changed record, None for RELOADED
+        """
+        self.action = action
+        self.record_type = record_type
+        self.record_id = record_id
+
+    def __repr__(self) -> str:
+        return f"ChangeEvent({self.action!r}, {self.record_type!r}, {self.record_id!r})"
+
+
+class ChangeFeed:
+    """
+    Publish/subscribe feed of record changes, batched per transaction.
+
+    The feed is its own transaction context manager:
+
+        with feed:
+            ...  # changes published here are delivered together
+    """
+
+    def __init__(self):
+        """Initialize a new ChangeFeed instance without subscribers."""
+        self._subscribers = []
+        self._pending = []
+        self._depth = 0
+
+    def subscribe(self, callback: Callable[[List[ChangeEvent]], None]) -> None:
+        """
+        Register a function to be called with every batch of change events.
+
+        Args:
+            callback: Function taking the list of events of a batch
+        """
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[List[ChangeEvent]], None]) -> None:
+        """
+        Stop delivering change events to a function.
+
+        Args:
+            callback: Function previously passed to subscribe()
+        """
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def publish(self, event: ChangeEvent) -> None:
+        """
+        Announce a change, delivering it now or when the current transaction ends.
+
+        Args:
+            event: Change to announce
+        """
+        self._pending.append(event)
+        if self._depth == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        """Deliver the pending events to every subscriber as one batch."""
+        events, self._pending = self._pending, []
+        if not events:
+            return
+
+        # Copy the list so callbacks can unsubscribe while being called
+        for callback in list(self._subscribers):
+            callback(events)
+
+    def __enter__(self) -> 'ChangeFeed':
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            # Changes made before an error still happened, so they are delivered too
+            self.flush()
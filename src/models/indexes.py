@@ -0,0 +1,636 @@
+"""
+Record indexes module for FlyRecordKeeper.
+
+This module defines the in-memory indexes the RecordManager maintains
+next to its record lists, so lookups do not have to scan every record.
+
+Every index exposes the same maintenance interface:
+1. add(record) indexes a record under the keys derived from it
+2. add_all(records) bulk-loads the index from a record list
+3. discard(record_id) removes whatever was indexed for a record ID
+4. update(record) re-indexes a record after its fields were edited
+
+Indexes remember the keys stored for each record ID, so a record can be
+re-indexed even after it has been edited in place.
+"""
+from bisect import bisect_left, insort
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Set, Tuple
+
+from models.base_record import BaseRecord
+from utils.text_matching import edit_distance
+
+
+class PrimaryIndex:
+    """
+    Index of records by ID that remembers the order records were stored in.
+    """
+
+    def __init__(self):
+        """Initialize a new, empty PrimaryIndex instance."""
+        self._records = {}
+        self._order = {}
+        self._next_position = 0
+
+    def add(self, record: BaseRecord) -> None:
+        """
+        Index a record by its ID.
+
+        Args:
+            record: Record to index
+        """
+        record_id = int(record.id)
+        self._records[record_id] = record
+
+        if record_id not in self._order:
+            self._order[record_id] = self._next_position
+            self._next_position += 1
+
+    def add_all(self, records: Iterable[BaseRecord]) -> None:
+        """
+        Index every record of a list.
+
+        Args:
+            records: Records to index
+        """
+        for record in records:
+            self.add(record)
+
+    def discard(self, record_id: int) -> None:
+        """
+        Remove a record from the index if present.
+
+        Args:
+            record_id: ID of the record to remove
+        """
+        self._records.pop(int(record_id), None)
+        self._order.pop(int(record_id), None)
+
+    def update(self, record: BaseRecord) -> None:
+        """
+        Replace the indexed record, keeping its storage position.
+
+        Args:
+            record: Record carrying the updated values
+        """
+        self.add(record)
+
+    def get(self, record_id: int) -> Optional[BaseRecord]:
+        """
+        Return the record with the given ID.
+
+        Args:
+            record_id: ID of the record
+
+        Returns:
+            The record, or None if no record has that ID
+        """
+        return self._records.get(int(record_id))
+
+    def ids(self) -> Iterable[int]:
+        """Return the IDs of all indexed records."""
+        return self._records.keys()
+
+    def position(self, records: List[BaseRecord], record_id: int) -> Optional[int]:
+        """
+        Return the slot of a record in the list it is stored in.
+
+        Records are stored in the order they were indexed, so the slot is
+        found by binary search over their storage positions.
+
+        Args:
+            records: Record list this index was built from
+            record_id: ID of the record
+
+        Returns:
+            Index of the record in records, or None if no record has that ID
+        """
+        order = self._order.get(int(record_id))
+        if order is None:
+            return None
+
+        slot = bisect_left(records, order, key=lambda record: self._order.get(int(record.id), -1))
+        if slot < len(records) and int(records[slot].id) == int(record_id):
+            return slot
+        return None
+
+    def in_order(self, record_ids: Iterable[int]) -> List[BaseRecord]:
+        """
+        Return the records for a set of IDs in storage order.
+
+        Args:
+            record_ids: IDs of the records to return; unknown IDs are skipped
+
+        Returns:
+            List of records, ordered as they are stored
+        """
+        known = [int(i) for i in record_ids if int(i) in self._records]
+        known.sort(key=self._order.__getitem__)
+        return [self._records[i] for i in known]
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+class HashIndex:
+    """
+    Index mapping keys derived from a record to the IDs of matching records.
+    """
+
+    def __init__(self, key_func: Callable[[Any], Iterable[Hashable]]):
+        """
+        Initialize a new HashIndex instance.
+
+        Args:
+            key_func: Function returning the keys a record is indexed under
+        """
+        self.key_func = key_func
+        self._ids = {}
+        self._keys = {}
+
+    def add(self, record: BaseRecord) -> None:
+        """
+        Index a record under every key returned by the key function.
+
+        Args:
+            record: Record to index
+        """
+        record_id = int(record.id)
+        keys = set(self.key_func(record))
+        self._keys[record_id] = keys
+
+        for key in keys:
+            self._ids.setdefault(key, set()).add(record_id)
+
+    def add_all(self, records: Iterable[BaseRecord]) -> None:
+        """
+        Index every record of a list.
+
+        Args:
+            records: Records to index
+        """
+        for record in records:
+            self.add(record)
+
+    def discard(self, record_id: int) -> None:
+        """
+        Remove a record from the index if present.
+
+        Args:
+            record_id: ID of the record to remove
+        """
+        for key in self._keys.pop(int(record_id), ()):
+            ids = self._ids.get(key)
+            if ids is None:
+                continue
+
+            ids.discard(int(record_id))
+            if not ids:
+                del self._ids[key]
+
+    def update(self, record: BaseRecord) -> None:
+        """
+        Re-index a record after its fields were edited.
+
+        Args:
+            record: Record carrying the updated values
+        """
+        self.discard(record.id)
+        self.add(record)
+
+    def get(self, key: Hashable) -> Set[int]:
+        """
+        Return the IDs of the records indexed under a key.
+
+        Args:
+            key: Index key
+
+        Returns:
+            Set of record IDs (empty if the key is unknown)
+        """
+        return set(self._ids.get(key, ()))
+
+    def count(self, key: Hashable) -> int:
+        """
+        Return the number of records indexed under a key.
+
+        Args:
+            key: Index key
+
+        Returns:
+            Number of matching records
+        """
+        return len(self._ids.get(key, ()))
+
+    def keys(self) -> Iterable[Hashable]:
+        """Return all keys present in the index."""
+        return self._ids.keys()
+
+
+class SearchKeyIndex:
+    """
+    Index holding a value precomputed from each record, such as its search keys.
+    """
+
+    def __init__(self, key_func: Callable[[Any], Any]):
+        """
+        Initialize a new SearchKeyIndex instance.
+
+        Args:
+            key_func: Function computing the value stored for a record
+        """
+        self.key_func = key_func
+        self._values = {}
+
+    def add(self, record: BaseRecord) -> None:
+        """
+        Compute and store the value for a record.
+
+        Args:
+            record: Record to index
+        """
+        self._values[int(record.id)] = self.key_func(record)
+
+    def add_all(self, records: Iterable[BaseRecord]) -> None:
+        """
+        Index every record of a list.
+
+        Args:
+            records: Records to index
+        """
+        for record in records:
+            self.add(record)
+
+    def discard(self, record_id: int) -> None:
+        """
+        Remove a record from the index if present.
+
+        Args:
+            record_id: ID of the record to remove
+        """
+        self._values.pop(int(record_id), None)
+
+    def update(self, record: BaseRecord) -> None:
+        """
+        Recompute the value for a record after its fields were edited.
+
+        Args:
+            record: Record carrying the updated values
+        """
+        self.add(record)
+
+    def get(self, record_id: int) -> Any:
+        """
+        Return the value stored for a record.
+
+        Args:
+            record_id: ID of the record
+
+        Returns:
+            The stored value, or None if the record is not indexed
+        """
+        return self._values.get(int(record_id))
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class SortedIndex:
+    """
+    Index keeping record IDs sorted by a key, for range queries in O(log n + k).
+    """
+
+    def __init__(self, key_func: Callable[[Any], Any]):
+        """
+        Initialize a new SortedIndex instance.
+
+        Args:
+            key_func: Function returning the sort key of a record (None to skip the record)
+        """
+        self.key_func = key_func
+        self._entries = []
+        self._keys = {}
+
+    def add(self, record: BaseRecord) -> None:
+        """
+        Insert a record at its sorted position.
+
+        Args:
+            record: Record to index
+        """
+        key = self.key_func(record)
+        if key is None:
+            return
+
+        record_id = int(record.id)
+        self._keys[record_id] = key
+        insort(self._entries, (key, record_id))
+
+    def add_all(self, records: Iterable[BaseRecord]) -> None:
+        """
+        Index every record of a list, sorting once instead of inserting one by one.
+
+        Args:
+            records: Records to index
+        """
+        for record in records:
+            key = self.key_func(record)
+            if key is not None:
+                self._keys[int(record.id)] = key
+                self._entries.append((key, int(record.id)))
+
+        self._entries.sort()
+
+    def discard(self, record_id: int) -> None:
+        """
+        Remove a record from the index if present.
+
+        Args:
+            record_id: ID of the record to remove
+        """
+        key = self._keys.pop(int(record_id), None)
+        if key is None:
+            return
+
+        position = bisect_left(self._entries, (key, int(record_id)))
+        if position < len(self._entries) and self._entries[position] == (key, int(record_id)):
+            del self._entries[position]
+
+    def update(self, record: BaseRecord) -> None:
+        """
+        Move a record to its new sorted position after its key was edited.
+
+        Args:
+            record: Record carrying the updated values
+        """
+        self.discard(record.id)
+        self.add(record)
+
+    def _bounds(self, low: Any, high: Any) -> range:
+        """Return the positions of the entries with low <= key < high."""
+        start = 0 if low is None else bisect_left(self._entries, (low,))
+        stop = len(self._entries) if high is None else bisect_left(self._entries, (high,))
+        return range(start, max(start, stop))
+
+    def range(self, low: Any = None, high: Any = None, limit: Optional[int] = None) -> List[int]:
+        """
+        Return the IDs of the records with low <= key < high, in key order.
+
+        Args:
+            low: Inclusive lower bound, None for no lower bound
+            high: Exclusive upper bound, None for no upper bound
+            limit: Maximum number of IDs to return, None for all
+
+        Returns:
+            List of record IDs sorted by key
+        """
+        positions = self._bounds(low, high)
+        if limit is not None:
+            positions = positions[:max(0, limit)]
+
+        return [self._entries[i][1] for i in positions]
+
+    def count(self, low: Any = None, high: Any = None) -> int:
+        """
+        Return the number of records with low <= key < high.
+
+        Args:
+            low: Inclusive lower bound, None for no lower bound
+            high: Exclusive upper bound, None for no upper bound
+
+        Returns:
+            Number of matching records
+        """
+        return len(self._bounds(low, high))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class PrefixIndex:
+    """
+    Index of records by string keys, for prefix (autocomplete) lookups.
+
+    Keys are kept in a sorted array, so the keys starting with a prefix
+    form one contiguous run found by bisection in O(log n).
+    """
+
+    def __init__(self, key_func: Callable[[Any], Iterable[str]]):
+        """
+        Initialize a new PrefixIndex instance.
+
+        Args:
+            key_func: Function returning the keys a record can be completed from
+        """
+        self.key_func = key_func
+        self._entries = []
+        self._keys = {}
+
+    def add(self, record: BaseRecord) -> None:
+        """
+        Insert a record's keys at their sorted positions.
+
+        Args:
+            record: Record to index
+        """
+        keys = list(dict.fromkeys(self.key_func(record)))
+        record_id = int(record.id)
+        self._keys[record_id] = keys
+        for key in keys:
+            insort(self._entries, (key, record_id))
+
+    def add_all(self, records: Iterable[BaseRecord]) -> None:
+        """
+        Index every record of a list, sorting once instead of inserting one by one.
+
+        Args:
+            records: Records to index
+        """
+        for record in records:
+            keys = list(dict.fromkeys(self.key_func(record)))
+            self._keys[int(record.id)] = keys
+            self._entries.extend((key, int(record.id)) for key in keys)
+
+        self._entries.sort()
+
+    def discard(self, record_id: int) -> None:
+        """
+        Remove a record from the index if present.
+
+        Args:
+            record_id: ID of the record to remove
+        """
+        for key in self._keys.pop(int(record_id), []):
+            position = bisect_left(self._entries, (key, int(record_id)))
+            if position < len(self._entries) and self._entries[position] == (key, int(record_id)):
+                del self._entries[position]
+
+    def update(self, record: BaseRecord) -> None:
+        """
+        Re-index a record after its keys were edited.
+
+        Args:
+            record: Record carrying the updated values
+        """
+        self.discard(record.id)
+        self.add(record)
+
+    def complete(self, prefix: str, limit: Optional[int] = None) -> List[int]:
+        """
+        Return the IDs of the records having a key that starts with a prefix.
+
+        Args:
+            prefix: Start of the key, an empty prefix matches every record
+            limit: Maximum number of IDs to return, None for all
+
+        Returns:
+            List of unique record IDs, ordered by their first matching key
+        """
+        ids = {}
+        for position in range(bisect_left(self._entries, (prefix,)), len(self._entries)):
+            key, record_id = self._entries[position]
+            if not key.startswith(prefix) or (limit is not None and len(ids) >= limit):
+                break
+            ids[record_id] = None
+
+        return list(ids)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class _BKNode:
+    """Node of a BKTree holding one key and the records indexed under it."""
+
+    __slots__ = ("key", "ids", "children")
+
+    def __init__(self, key: str):
+        self.key = key
+        self.ids = set()
+        self.children = {}
+
+
+class BKTree:
+    """
+    Index of record keys in a BK-tree, for approximate lookups by edit distance.
+
+    Each child hangs off its parent at the distance between their keys, so
+    a lookup only descends into the children whose distance lies within the
+    tolerance of the query, visiting a small part of the tree.
+
+    Discarded keys stay in the tree as routing nodes without records; the
+    RecordManager rebuilds the tree when a whole record list is replaced.
+    """
+
+    def __init__(self, key_func: Callable[[Any], Iterable[str]],
+                 distance: Callable[[str, str], int] = edit_distance):
+        """
+        Initialize a new BKTree instance.
+
+        Args:
+            key_func: Function returning the keys a record is indexed under
+            distance: Metric between two keys (defaults to the Levenshtein distance)
+        """
+        self.key_func = key_func
+        self.distance = distance
+        self._root = None
+        self._keys = {}
+
+    def _node(self, key: str, create: bool = False) -> Optional[_BKNode]:
+        """Return the node holding a key, optionally inserting it."""
+        if self._root is None:
+            if not create:
+                return None
+            self._root = _BKNode(key)
+            return self._root
+
+        node = self._root
+        while node.key != key:
+            d = self.distance(key, node.key)
+            child = node.children.get(d)
+            if child is None:
+                if not create:
+                    return None
+                child = node.children[d] = _BKNode(key)
+            node = child
+
+        return node
+
+    def add(self, record: BaseRecord) -> None:
+        """
+        Index a record under every key returned by the key function.
+
+        Args:
+            record: Record to index
+        """
+        record_id = int(record.id)
+        keys = [key for key in self.key_func(record) if key]
+        self._keys[record_id] = keys
+
+        for key in keys:
+            self._node(key, create=True).ids.add(record_id)
+
+    def add_all(self, records: Iterable[BaseRecord]) -> None:
+        """
+        Index every record of a list.
+
+        Args:
+            records: Records to index
+        """
+        for record in records:
+            self.add(record)
+
+    def discard(self, record_id: int) -> None:
+        """
+        Remove a record from the index if present.
+
+        Args:
+            record_id: ID of the record to remove
+        """
+        for key in self._keys.pop(int(record_id), ()):
+            node = self._node(key)
+            if node is not None:
+                node.ids.discard(int(record_id))
+
+    def update(self, record: BaseRecord) -> None:
+        """
+        Re-index a record after its fields were edited.
+
+        Args:
+            record: Record carrying the updated values
+        """
+        self.discard(record.id)
+        self.add(record)
+
+    def search(self, key: str, max_distance: int) -> List[Tuple[int, int]]:
+        """
+        Find the records indexed under keys within an edit distance of a key.
+
+        Args:
+            key: Key to look up
+            max_distance: Largest distance still considered a match
+
+        Returns:
+            List of (distance, record ID) tuples, closest first; a record
+            appears once, with the distance of its closest key
+        """
+        best = {}
+        pending = [self._root] if self._root is not None else []
+
+        while pending:
+            node = pending.pop()
+            d = self.distance(key, node.key)
+
+            if d <= max_distance:
+                for record_id in node.ids:
+                    if d < best.get(record_id, max_distance + 1):
+                        best[record_id] = d
+
+            # Triangle inequality: only children at node distance d +/- max_distance can match
+            for child_distance, child in node.children.items():
+                if d - max_distance <= child_distance <= d + max_distance:
+                    pending.append(child)
+
+        return sorted((d, record_id) for record_id, d in best.items())
+
+    def __len__(self) -> int:
+        return len(self._keys)
@@ -9,8 +9,10 @@ This project uses a "Structured Dictionaries with OO Benefits" approach where:
 2. Classes provide structure, validation, and object-oriented functionality
 3. The system maintains the benefits of both approaches
 """
-from typing import List, Dict, Any
-from datetime import datetime
+import copy
+import threading
+from typing import List, Dict, Any, Iterable, Callable, Tuple
+from datetime import datetime, timedelta
 from operator import length_hint
 
 # Import the record classes
@@ -18,9 +20,13 @@ from models.client_record import ClientRecord
 from models.airline_record import AirlineRecord
 from models.flight_record import FlightRecord
 from models.base_record import BaseRecord
+from models.change_feed import ChangeEvent, ChangeFeed, CREATED, UPDATED, DELETED, RELOADED
+from models.indexes import PrimaryIndex, HashIndex, SortedIndex, PrefixIndex, BKTree, SearchKeyIndex
+from models.search_keys import record_search_keys
 
 # Import the file handler
 from utils.file_handler import load_records, save_records
+from utils.text_matching import normalise_name, name_keys, phonetic_keys, phone_digits, phone_suffixes, MIN_PHONE_SUFFIX
 
 
 class RecordManager:
@@ -38,10 +44,231 @@ class RecordManager:
             filename: Path to the JSON file where records are stored
         """
         self.filename = filename
+
+        # Mutation counter, incremented whenever any record collection changes
+        self.version = 0
+
+        # Feed announcing every change to subscribers
+        self.changes = ChangeFeed()
+
+        # Index definitions as name -> (record type, factory); indexes are built on first use
+        self._index_specs = {
+            "client_by_id": ("client", PrimaryIndex),
+            "airline_by_id": ("airline", PrimaryIndex),
+            "flight_by_id": ("flight", PrimaryIndex),
+            "flights_by_client": ("flight", lambda: HashIndex(lambda r: [int(r.client_id)])),
+            "flights_by_airline": ("flight", lambda: HashIndex(lambda r: [int(r.airline_id)])),
+            "flights_by_date": ("flight", lambda: SortedIndex(lambda r: r.date)),
+            "flights_by_day": ("flight", lambda: HashIndex(lambda r: [r.date.date()])),
+            "clients_by_fuzzy_name": ("client", lambda: BKTree(lambda r: name_keys(r.name))),
+            "airlines_by_fuzzy_name": ("airline", lambda: BKTree(lambda r: name_keys(r.company_name))),
+            "clients_by_name": ("client", lambda: HashIndex(lambda r: [r.name])),
+            "airlines_by_name": ("airline", lambda: HashIndex(lambda r: [r.company_name])),
+            "clients_by_name_prefix": ("client", lambda: PrefixIndex(lambda r: name_keys(r.name))),
+            "airlines_by_name_prefix": ("airline", lambda: PrefixIndex(lambda r: name_keys(r.company_name))),
+            "clients_by_phonetic_name": ("client", lambda: HashIndex(lambda r: phonetic_keys(r.name))),
+            "clients_by_phone_suffix": ("client", lambda: HashIndex(lambda r: phone_suffixes(r.phone_number))),
+            "client_search_keys": ("client", lambda: SearchKeyIndex(lambda r: record_search_keys("client", r))),
+            "airline_search_keys": ("airline", lambda: SearchKeyIndex(lambda r: record_search_keys("airline", r))),
+            "flight_search_keys": ("flight", lambda: SearchKeyIndex(lambda r: record_search_keys("flight", r))),
+        }
+        self._indexes = {}
+
+        # Serialises lazy index builds, since snapshots are searched from several threads
+        self._index_lock = threading.Lock()
+
+        # Read-only copy of the collections handed to background searches
+        self._snapshot = None
+
+        # Filtered and sorted records of the last get_page() call, as (query, version, records)
+        self._page_order = None
+
         self.clients = []
         self.airlines = []
         self.flights = []
         self.load_from_file()
+
+    @property
+    def clients(self) -> List[ClientRecord]:
+        """List of client records."""
+        return self._clients
+
+    @clients.setter
+    def clients(self, records: List[ClientRecord]):
+        self._clients = records
+        self.drop_indexes("client")
+        self.mark_changed("client")
+
+    @property
+    def airlines(self) -> List[AirlineRecord]:
+        """List of airline records."""
+        return self._airlines
+
+    @airlines.setter
+    def airlines(self, records: List[AirlineRecord]):
+        self._airlines = records
+        self.drop_indexes("airline")
+        self.mark_changed("airline")
+
+    @property
+    def flights(self) -> List[FlightRecord]:
+        """List of flight records."""
+        return self._flights
+
+    @flights.setter
+    def flights(self, records: List[FlightRecord]):
+        self._flights = records
+        self.drop_indexes("flight")
+        self.mark_changed("flight")
+
+    def mark_changed(self, record_type: str, action: str = RELOADED, record_id: int = None) -> int:
+        """
+        Record that a collection has changed, invalidating derived data and
+        announcing the change on the change feed.
+        
+        Args:
+            record_type: Type of the records that changed
+            action: Change made (CREATED, UPDATED, DELETED, or RELOADED for the whole collection)
+            record_id: ID of the changed record, None for RELOADED
+            
+        Returns:
+            The new data version
+        """
+        self.version += 1
+        self.changes.publish(ChangeEvent(action, record_type, record_id))
+        return self.version
+
+    def subscribe(self, callback) -> None:
+        """
+        Register a function to be called with every batch of record changes.
+        
+        Args:
+            callback: Function taking a list of ChangeEvent objects
+        """
+        self.changes.subscribe(callback)
+
+    def unsubscribe(self, callback) -> None:
+        """
+        Stop announcing record changes to a function.
+        
+        Args:
+            callback: Function previously passed to subscribe()
+        """
+        self.changes.unsubscribe(callback)
+
+    def transaction(self) -> ChangeFeed:
+        """
+        Group changes so subscribers receive them as one batch.
+        
+        Use as a context manager; the batch is delivered when the outermost
+        transaction ends.
+        
+        Returns:
+            Context manager delimiting the transaction
+        """
+        return self.changes
+
+    def snapshot(self) -> 'RecordManager':
+        """
+        Return a read-only copy of the record collections for use off the main thread.
+        
+        The copy holds the record lists as tuples, so its add, update and
+        delete methods fail, and it builds its own indexes on first use,
+        one thread at a time. Snapshots are reused until the data version
+        changes. Records are shared with this manager, not copied; they
+        are never edited in place, since edit dialogs work on a copy that
+        update_record stores in the original's place.
+        
+        Returns:
+            RecordManager holding the records as of the current version
+        """
+        if self._snapshot is not None and self._snapshot.version == self.version:
+            return self._snapshot
+
+        snapshot = copy.copy(self)
+        snapshot._clients = tuple(self._clients)
+        snapshot._airlines = tuple(self._airlines)
+        snapshot._flights = tuple(self._flights)
+        snapshot._indexes = {}
+        snapshot._index_lock = threading.Lock()
+        snapshot._snapshot = None
+        snapshot.changes = ChangeFeed()
+
+        self._snapshot = snapshot
+        return snapshot
+
+    def get_index(self, name: str):
+        """
+        Return a record index, building it from the record list on first use.
+        
+        Args:
+            name: Name of the index (e.g. 'flight_by_id' or 'flights_by_client')
+            
+        Returns:
+            The index instance
+            
+        Raises:
+            ValueError: If the index name is unknown
+        """
+        index = self._indexes.get(name)
+        if index is not None:
+            return index
+
+        if name not in self._index_specs:
+            raise ValueError(f"Unknown index: {name}")
+
+        with self._index_lock:
+            # Another thread may have built the index while this one waited
+            index = self._indexes.get(name)
+            if index is None:
+                record_type, factory = self._index_specs[name]
+                index = factory()
+                index.add_all(self.get_records_by_type(record_type))
+                self._indexes[name] = index
+
+        return index
+
+    def drop_indexes(self, record_type: str) -> None:
+        """
+        Discard the built indexes over a record type so they are rebuilt on next use.
+        
+        Args:
+            record_type: Type of the records the indexes cover
+        """
+        for name, (index_type, _) in self._index_specs.items():
+            if index_type == record_type:
+                self._indexes.pop(name, None)
+
+    def _built_indexes(self, record_type: str) -> List[Any]:
+        """Return the indexes over a record type that have already been built."""
+        return [self._indexes[name] for name, (index_type, _) in self._index_specs.items()
+                if index_type == record_type and name in self._indexes]
+
+    def find_record(self, record_id: int, record_type: str) -> BaseRecord:
+        """
+        Look up a record by its ID using the ID index.
+        
+        Args:
+            record_id: ID of the record to retrieve
+            record_type: Type of the record
+            
+        Returns:
+            The record if found, None otherwise
+        """
+        return self.get_index(f"{record_type}_by_id").get(record_id)
+
+    def get_records_by_ids(self, record_ids: Iterable[int], record_type: str) -> List[BaseRecord]:
+        """
+        Retrieve the records for a set of IDs in storage order.
+        
+        Args:
+            record_ids: IDs of the records to retrieve; unknown IDs are skipped
+            record_type: Type of the records
+            
+        Returns:
+            List of records, ordered as they are stored
+        """
+        return self.get_index(f"{record_type}_by_id").in_order(record_ids)
     
     def load_from_file(self) -> bool:
         """
@@ -59,16 +286,17 @@ class RecordManager:
             return False
     
     def from_json(self, data) -> bool:
-        self.clients = []
-        self.airlines = []
-        self.flights = []
-        
-        for rec in data["clients"]:
-            self.clients.append(ClientRecord.from_dict(rec))
-        for rec in data["airlines"]:
-            self.airlines.append(AirlineRecord.from_dict(rec))
-        for rec in data["flights"]:
-            self.flights.append(FlightRecord.from_dict(rec))
+        with self.transaction():
+            self.clients = []
+            self.airlines = []
+            self.flights = []
+            
+            for rec in data["clients"]:
+                self.clients.append(ClientRecord.from_dict(rec))
+            for rec in data["airlines"]:
+                self.airlines.append(AirlineRecord.from_dict(rec))
+            for rec in data["flights"]:
+                self.flights.append(FlightRecord.from_dict(rec))
 
         return True
     
@@ -234,6 +462,47 @@ class RecordManager:
         return FlightRecord(new_id, client_id, airline_id, date, start_city, end_city)
     
     
+    def add_record(self, record: BaseRecord) -> BaseRecord:
+        """
+        Add a newly created record to its collection.
+        
+        Args:
+            record: Record returned by one of the create_* methods
+            
+        Returns:
+            The added record
+        """
+        self.get_records_by_type(record.type).append(record)
+
+        for index in self._built_indexes(record.type):
+            index.add(record)
+        self.mark_changed(record.type, CREATED, record.id)
+
+        return record
+
+    def update_record(self, record: BaseRecord) -> bool:
+        """
+        Store the edited values of an existing record.
+        
+        Args:
+            record: Record carrying the updated values
+            
+        Returns:
+            True if successful, False if no record with that ID exists
+        """
+        data_list = self.get_records_by_type(record.type)
+
+        # The ID index locates the record's slot without scanning the list
+        slot = self.get_index(f"{record.type}_by_id").position(data_list, record.id)
+        if slot is None:
+            return False
+
+        data_list[slot] = record
+        for index in self._built_indexes(record.type):
+            index.update(record)
+        self.mark_changed(record.type, UPDATED, record.id)
+        return True
+
     def get_record_by_id(self, record_id: int, record_type: str) -> BaseRecord:
         """
         Retrieve a record by its ID.
@@ -284,31 +553,216 @@ class RecordManager:
         else:
             raise ValueError(f"Unknown record type: {record_type}")
 
+    def get_page(self, record_type: str, offset: int = 0, limit: int = None,
+                 sort_key: Callable[[BaseRecord], Any] = None,
+                 filter: Callable[[BaseRecord], bool] = None,
+                 reverse: bool = False) -> Tuple[List[BaseRecord], int]:
+        """
+        Retrieve one page of the records of a type, optionally filtered and sorted.
+        
+        The filtered and sorted order is kept until the data changes, so
+        reading further pages with the same sort key and filter functions
+        only slices it. Without sort key and filter pages are slices of the
+        stored records, in storage order.
+        
+        Args:
+            record_type: Type of records to retrieve ('client', 'airline', or 'flight')
+            offset: Number of matching records skipped before the page
+            limit: Maximum number of records on the page, None for all remaining
+            sort_key: Function returning the key records are ordered by, None for storage order
+            filter: Function returning True for the records to include, None for all
+            reverse: True to order by descending sort key, equal keys staying in storage order
+            
+        Returns:
+            Tuple of (records on the page, total number of matching records)
+            
+        Raises:
+            ValueError: If the record type is unknown, or offset or limit is negative
+        """
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("Page offset and limit must not be negative")
+
+        records = self.get_records_by_type(record_type)
+        if sort_key is not None or filter is not None:
+            query = (record_type, sort_key, filter, reverse)
+            # Read once, since page workers may replace it on a shared snapshot meanwhile
+            page_order = self._page_order
+            if page_order is not None and page_order[:2] == (query, self.version):
+                records = page_order[2]
+            else:
+                records = [r for r in records if filter(r)] if filter is not None else list(records)
+                if sort_key is not None:
+                    records.sort(key=sort_key, reverse=reverse)
+                self._page_order = (query, self.version, records)
+
+        end = offset + limit if limit is not None else None
+        return list(records[offset:end]), len(records)
     
-    def get_related_records(self, record_id: int, record_type: str) -> List[Dict[str, Any]]:
+    def find_clients_by_phone(self, phone: str, suffix_length: int = None) -> List[ClientRecord]:
         """
-        Get all records that relate to a specific record.
+        Look up the clients whose phone number ends with the digits of a number.
+        
+        Numbers are compared by their digits only, so formatting does not
+        matter. Lookups of at least MIN_PHONE_SUFFIX digits are answered by
+        the phone suffix index in O(1); shorter ones scan the clients.
         
         Args:
-            record_id: ID of the reference record
-            record_type: Type of the reference record ('client' or 'airline')
+            phone: Phone number, or its last digits, in any format
+            suffix_length: Only compare the last suffix_length digits (e.g. to
+                ignore a country code), None to compare every digit given
             
         Returns:
-            List of records that reference this record
+            List of matching client records in storage order
         """
-        related_records = []
+        digits = phone_digits(phone)
+        if suffix_length:
+            digits = digits[-suffix_length:]
+
+        if not digits:
+            return []
+
+        if len(digits) < MIN_PHONE_SUFFIX:
+            return [c for c in self.clients if phone_digits(c.phone_number).endswith(digits)]
+
+        return self.get_records_by_ids(self.get_index("clients_by_phone_suffix").get(digits), "client")
+
+    def find_records_by_name(self, record_type: str, name: str) -> List[BaseRecord]:
+        """
+        Look up the clients or airlines with exactly the given name using the name index.
         
-        if record_type == "client":
-            # Find flights that reference this client
-            related_records = [r for r in self.flights 
-                            if r.client_id == record_id]
+        Args:
+            record_type: Type of records to look up ('client' or 'airline')
+            name: Client name or airline company name
+            
+        Returns:
+            List of records with that name in storage order; more than one if the name is shared
+            
+        Raises:
+            ValueError: If the record type has no name index
+        """
+        return self.get_records_by_ids(self.get_index(f"{record_type}s_by_name").get(name), record_type)
+
+    def complete_names(self, record_type: str, prefix: str, limit: int = None) -> List[BaseRecord]:
+        """
+        Look up the clients or airlines whose name, or a word of it, starts with a prefix.
         
-        elif record_type == "airline":
-            # Find flights that reference this airline
-            related_records = [r for r in self.flights 
-                            if r.airline_id == record_id]
+        Names and prefix are compared in their normalised form, so case,
+        accents and punctuation do not matter. Lookups are answered by the
+        name prefix index in O(log n + limit).
+        
+        Args:
+            record_type: Type of records to complete ('client' or 'airline')
+            prefix: Start of the name as typed so far
+            limit: Maximum number of records to return, None for all
+            
+        Returns:
+            List of matching records, ordered by the matching name
+            
+        Raises:
+            ValueError: If the record type has no name prefix index
+        """
+        ids = self.get_index(f"{record_type}s_by_name_prefix").complete(normalise_name(prefix), limit)
+        return [self.find_record(record_id, record_type) for record_id in ids]
+
+    def get_flights_between(self, start: datetime = None, end: datetime = None) -> List[FlightRecord]:
+        """
+        Retrieve the flights departing within a time range.
+        
+        Uses the sorted departure index, so the cost is O(log n + k) for
+        k matching flights.
+        
+        Args:
+            start: Earliest departure time (inclusive), None for no lower bound
+            end: Latest departure time (exclusive), None for no upper bound
+            
+        Returns:
+            List of flight records ordered by departure time
+        """
+        flights = self.get_index("flight_by_id")
+        return [flights.get(i) for i in self.get_index("flights_by_date").range(start, end)]
+
+    def get_upcoming_flights(self, limit: int = 10, now: datetime = None,
+                             within: timedelta = None) -> List[FlightRecord]:
+        """
+        Retrieve the next flights departing from a point in time.
+        
+        Reads the sorted departure index from the first flight at or after
+        now, so only the returned flights are visited.
+        
+        Args:
+            limit: Maximum number of flights to return
+            now: Reference time, defaults to the current time
+            within: Only include flights departing before now + within
+            
+        Returns:
+            List of flight records ordered by departure time
+        """
+        now = now or datetime.now()
+        end = now + within if within is not None else None
+
+        flights = self.get_index("flight_by_id")
+        return [flights.get(i) for i in self.get_index("flights_by_date").range(now, end, limit)]
+
+    def get_flight_groups(self, group_by: str) -> List[Tuple[Any, int]]:
+        """
+        Count the flights per departure day, client or airline.
         
-        return related_records
+        Counts are read from the flight grouping indexes, which follow
+        every change to the flights, so no flight is visited.
+        
+        Args:
+            group_by: 'day', 'client' or 'airline'
+            
+        Returns:
+            List of (group key, number of flights) tuples in key order; keys are
+            dates for 'day' and client or airline IDs otherwise
+            
+        Raises:
+            ValueError: If flights cannot be grouped that way
+        """
+        index = self.get_index(self._flight_group_index(group_by))
+        return [(key, index.count(key)) for key in sorted(index.keys())]
+
+    def get_flights_in_group(self, group_by: str, key: Any) -> List[FlightRecord]:
+        """
+        Retrieve the flights of one group returned by get_flight_groups().
+        
+        Args:
+            group_by: 'day', 'client' or 'airline'
+            key: Departure date, client ID or airline ID of the group
+            
+        Returns:
+            List of flight records ordered by departure time
+            
+        Raises:
+            ValueError: If flights cannot be grouped that way
+        """
+        flight_ids = self.get_index(self._flight_group_index(group_by)).get(key)
+        return sorted(self.get_records_by_ids(flight_ids, "flight"), key=lambda f: f.date)
+
+    def _flight_group_index(self, group_by: str) -> str:
+        """Return the name of the index flights are grouped by."""
+        if group_by not in ("day", "client", "airline"):
+            raise ValueError(f"Cannot group flights by: {group_by}")
+        return f"flights_by_{group_by}"
+
+    def get_related_records(self, record_id: int, record_type: str) -> List[Dict[str, Any]]:
+        """
+        Get all records that relate to a specific record using the flight reference indexes.
+        
+        Args:
+            record_id: ID of the reference record
+            record_type: Type of the reference record ('client' or 'airline')
+            
+        Returns:
+            List of records that reference this record, in storage order
+        """
+        if record_type not in ("client", "airline"):
+            return []
+
+        # Find flights that reference this client or airline
+        flight_ids = self.get_index(f"flights_by_{record_type}").get(int(record_id))
+        return self.get_records_by_ids(flight_ids, "flight")
     
     def get_all_records(self) -> List[Dict[str, Any]]:
         """
@@ -385,6 +839,10 @@ class RecordManager:
         
         # Delete the record
         del data_list[record_index]
+
+        for index in self._built_indexes(record_type):
+            index.discard(record_id)
+        self.mark_changed(record_type, DELETED, record_id)
         
         # Save to file
         self.save_to_file()
@@ -0,0 +1,43 @@
+"""
+Search keys module for FlyRecordKeeper.
+
+This module defines which fields of each record type are searchable and
+converts them into search keys: accent-free, case-folded strings that
+search terms are compared against. The RecordManager keeps the keys of
+every record in an index, so they are computed once per record and edit
+rather than on every comparison.
+"""
+from typing import Any, Dict
+
+from utils.text_matching import search_key
+
+# Record attribute behind each searchable field, by record type
+SEARCH_KEY_FIELDS = {
+    "client": {"id": "id", "name": "name", "city": "city", "country": "country", "phone": "phone_number"},
+    "airline": {"id": "id", "name": "company_name"},
+    "flight": {"id": "id", "client_id": "client_id", "airline_id": "airline_id",
+               "from": "start_city", "to": "end_city", "date": "date"},
+}
+
+
+def record_search_keys(record_type: str, record: Any) -> Dict[str, str]:
+    """
+    Compute the search keys of a record.
+
+    Dates are keyed by their ISO format; missing fields have an empty key.
+
+    Args:
+        record_type: Type of the record ('client', 'airline', or 'flight')
+        record: Record to compute the keys for
+
+    Returns:
+        Dictionary of field name to search key
+    """
+    keys = {}
+    for field, attribute in SEARCH_KEY_FIELDS[record_type].items():
+        value = getattr(record, attribute, "")
+        if hasattr(value, "isoformat"):
+            value = value.isoformat()
+        keys[field] = search_key(value)
+
+    return keys
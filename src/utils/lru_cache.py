@@ -0,0 +1,96 @@
+"""
+LRU cache module for FlyRecordKeeper.
+
+This module provides a small size-bounded cache with least-recently-used
+eviction, used to keep the results of repeated searches. A cache can be
+tied to a version of the data its values were computed from, so changing
+the data drops every stale value at once. Caches are shared
+by the searches running on background threads, so every operation holds
+a lock.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class LRUCache:
+    """
+    Size-bounded mapping that evicts the least recently used entry.
+    """
+
+    def __init__(self, max_size: int = 128):
+        """
+        Initialize a new LRUCache instance.
+
+        Args:
+            max_size: Maximum number of entries kept before evicting
+
+        Raises:
+            ValueError: If max_size is smaller than 1
+        """
+        if max_size < 1:
+            raise ValueError("Cache size must be at least 1")
+
+        self.max_size = max_size
+        self.version = None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for a key and mark it as recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is not cached
+
+        Returns:
+            The cached value, or default if the key is not present
+        """
+        with self._lock:
+            if key not in self._entries:
+                return default
+
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def set_version(self, version: Hashable) -> None:
+        """
+        Set the version of the data cached values are computed from.
+
+        Values computed from another version can never be used again, so
+        every entry is removed when the version changes.
+
+        Args:
+            version: Current version of the cached data
+        """
+        with self._lock:
+            if version != self.version:
+                self._entries.clear()
+                self.version = version
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,192 @@
+"""
+Text matching module for FlyRecordKeeper.
+
+This module provides the accent- and case-insensitive search keys used
+by every search path, the normalisation, distance and phonetic functions
+used by the approximate name indexes, and the digit normalisation used by
+the phone number index.
+"""
+import re
+import unicodedata
+from typing import List
+
+# Shortest phone number suffix kept in the phone index
+MIN_PHONE_SUFFIX = 4
+
+# Soundex digit for each consonant; vowels and y separate equal digits, h and w do not
+SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+
+def search_key(text: str) -> str:
+    """
+    Return the form of a text that search terms are compared against.
+
+    Compatibility characters are decomposed (NFKD), accents dropped and the
+    result case-folded, so "Zürich" matches "zurich" and "São Paulo"
+    matches "sao paulo".
+
+    Args:
+        text: Text to convert
+
+    Returns:
+        Accent-free, case-folded text
+    """
+    decomposed = unicodedata.normalize("NFKD", str(text))
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def normalise_name(name: str) -> str:
+    """
+    Normalise a name for approximate matching.
+
+    Converts the name to its search key, treats punctuation as whitespace
+    and collapses runs of whitespace, so "O'Brién,  Kevin" becomes
+    "o brien kevin".
+
+    Args:
+        name: Name to normalise
+
+    Returns:
+        Normalised name (empty if the name has no letters or digits)
+    """
+    return " ".join(re.sub(r'[\W_]+', ' ', search_key(name)).split())
+
+
+def name_keys(name: str) -> List[str]:
+    """
+    Return the keys a name is matched under: the whole name and each word.
+
+    Matching single words lets a misspelt surname ("smyth") find a
+    client stored with a full name ("John Smith").
+
+    Args:
+        name: Name to split into keys
+
+    Returns:
+        List of unique normalised keys, whole name first
+    """
+    normalised = normalise_name(name)
+    if not normalised:
+        return []
+
+    keys = [normalised]
+    for word in normalised.split():
+        if len(word) > 1 and word not in keys:
+            keys.append(word)
+    return keys
+
+
+def edit_distance(a: str, b: str) -> int:
+    """
+    Return the Levenshtein distance between two strings.
+
+    The distance is the number of single-character insertions, deletions
+    and substitutions needed to turn one string into the other.
+
+    Args:
+        a: First string
+        b: Second string
+
+    Returns:
+        Edit distance between the strings
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1,
+                               current[j - 1] + 1,
+                               previous[j - 1] + (char_a != char_b)))
+        previous = current
+
+    return previous[-1]
+
+
+def soundex(word: str) -> str:
+    """
+    Return the American Soundex code of a word.
+
+    Names that sound alike share a code, e.g. "Smith" and "Smyth" are
+    both "s530". Characters other than the letters a-z are ignored.
+
+    Args:
+        word: Word to encode
+
+    Returns:
+        Four-character code, or an empty string if the word has no letters
+    """
+    letters = re.sub(r'[^a-z]', '', search_key(word))
+    if not letters:
+        return ""
+
+    digits = []
+    previous = SOUNDEX_CODES.get(letters[0], "")
+    for letter in letters[1:]:
+        if letter in "hw":
+            continue
+
+        code = SOUNDEX_CODES.get(letter, "")
+        if code and code != previous:
+            digits.append(code)
+        previous = code
+
+    return (letters[0] + "".join(digits) + "000")[:4]
+
+
+def phonetic_keys(name: str) -> List[str]:
+    """
+    Return the Soundex codes of the words of a name.
+
+    Args:
+        name: Name to encode
+
+    Returns:
+        List of unique codes, in word order
+    """
+    keys = []
+    for word in normalise_name(name).split():
+        code = soundex(word)
+        if code and code not in keys:
+            keys.append(code)
+    return keys
+
+
+def phone_digits(phone: str) -> str:
+    """
+    Reduce a phone number to its digits, dropping spaces, brackets and signs.
+
+    Args:
+        phone: Phone number in any format, e.g. "+44 (20) 7946-0958"
+
+    Returns:
+        String of the digits of the number
+    """
+    return re.sub(r'\D', '', str(phone))
+
+
+def phone_suffixes(phone: str, min_length: int = MIN_PHONE_SUFFIX) -> List[str]:
+    """
+    Return the digit suffixes a phone number can be looked up by.
+
+    Args:
+        phone: Phone number in any format
+        min_length: Length of the shortest suffix returned
+
+    Returns:
+        List of suffixes from the whole digit string down to min_length digits
+        (just the digits if the number is shorter)
+    """
+    digits = phone_digits(phone)
+    return [digits[i:] for i in range(max(1, len(digits) - min_length + 1))] if digits else []
@@ -1,8 +1,24 @@
+import copy
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
 
 from views import airline_capture
+from views.virtual_grid import VirtualGrid, sort_key
+from controllers.search_worker import SearchWorker
+from models.change_feed import CREATED, DELETED, RELOADED
+
+# Delay after the last keystroke before a live search runs
+LIVE_SEARCH_DELAY_MS = 300
+
+# Maximum number of search results shown, best matches first
+SEARCH_RESULT_LIMIT = 100
+
+# Interval at which results of a background search are collected
+SEARCH_POLL_MS = 20
+
+# Records per page when browsing all airlines
+PAGE_SIZE = 1000
 
 class AirlineView(ttk.Frame):
     parent = None
@@ -42,6 +58,15 @@ class AirlineView(ttk.Frame):
 
         self.rec_man = rec_man
 
+        # Searches run on a background thread; its controller is kept so live search can refine results
+        self.search_worker = SearchWorker(rec_man)
+        self._search_after_id = None
+        self._live_search_after_id = None
+
+        # Pages in a sort order are read on their own worker, since sorting every airline takes a while
+        self.page_worker = SearchWorker(rec_man)
+        self._page_after_id = None
+
         self.setup_button_styles
         self.create_toolbar()
         self.create_treeview()
@@ -78,6 +103,24 @@ class AirlineView(ttk.Frame):
         self.search_frame = ttk.Frame(toolbar)
         self.search_frame.pack(side=tk.RIGHT, padx=5, pady=5)
 
+        # Pager for browsing all airlines a page at a time
+        self.pager_frame = ttk.Frame(toolbar)
+        self.pager_frame.pack(side=tk.RIGHT, padx=5, pady=5)
+
+        self.previous_page_button = ttk.Button(self.pager_frame, text="◀", width=3, command=self.previous_page, state="disabled")
+        self.previous_page_button.pack(side=tk.LEFT)
+
+        self.page_label = ttk.Label(self.pager_frame, text="")
+        self.page_label.pack(side=tk.LEFT, padx=5)
+
+        self.next_page_button = ttk.Button(self.pager_frame, text="▶", width=3, command=self.next_page, state="disabled")
+        self.next_page_button.pack(side=tk.LEFT)
+
+        # Track the page shown; search results and filters are not paged
+        self.is_paged = True
+        self.page_offset = 0
+        self.page_total = 0
+
         # Create search variable and entry widget
         self.search_var = tk.StringVar()
         self.search_entry = ttk.Entry(
@@ -92,6 +135,9 @@ class AirlineView(ttk.Frame):
         self.search_entry.bind("<Escape>", lambda e: self.toggle_search_mode())
         self.search_entry.bind("<FocusOut>", self.handle_focus_out)
 
+        # Live search: re-run the search shortly after the user stops typing
+        self.search_var.trace_add("write", self.schedule_live_search)
+
         # Create a button with a magnifying glass icon
         self.search_button = ttk.Button(
             self.search_frame,
@@ -131,21 +177,30 @@ class AirlineView(ttk.Frame):
         self.treeview.heading("company_name", text="Company Name")
         self.treeview.column("company_name", stretch=True)
 
-        # Load data
-        data = self.rec_man.get_records_by_type('airline')
-        for item in data:
-            self.treeview.insert("", "end", values=(item.id, item.company_name))
+        # Only the visible rows are kept as treeview items
+        self.grid = VirtualGrid(self.treeview, self.row_values, on_sort=self.on_sort)
+
+        # Apply record changes to the grid as they are made, even while the view is hidden
+        self.rec_man.subscribe(self.on_records_changed)
+        self.treeview.bind("<Destroy>", lambda e: self.rec_man.unsubscribe(self.on_records_changed), add="+")
+
+        # Show the first page of airlines
+        self.show_page(0)
 
         # Pack the treeview
         self.treeview.pack(expand=True, fill=tk.BOTH)
         self.treeview.bind('<<TreeviewSelect>>', self.select_item)
 
         # Bind to Configure event for handling resize
-        self.treeview.bind("<Configure>", self.on_treeview_configure)
+        self.treeview.bind("<Configure>", self.on_treeview_configure, add="+")
 
         # Initial update after UI is stable
         self.treeview.after(500, self.adjust_columns_and_scrollbar)
 
+    def row_values(self, airline):
+        """Return the column values of an airline row."""
+        return (airline.id, airline.company_name)
+
     def on_treeview_configure(self, event=None):
         """Handle treeview configuration changes (like resize or moving to another screen)"""
         # Use after to avoid multiple rapid updates
@@ -204,38 +259,31 @@ class AirlineView(ttk.Frame):
 
     def edit_item(self):
         """Handle editing an item by opening a child window."""
-        if (self.selected_item is None):
-            return
-        
-        item_data = self.treeview.item(self.selected_item)
-
-        if not item_data or len(item_data['values']) == 0:
+        selected = self.grid.selected_record()
+        if (selected is None):
             return
 
-        row_id = int(item_data['values'][0])
-        rec = self.rec_man.get_record_by_id(row_id, "airline")
+        row_id = int(selected.id)
+        # Edit a copy, so background searches never see a half-edited record
+        rec = copy.copy(self.rec_man.get_record_by_id(row_id, "airline"))
         self.open_child_window(rec, "Edit")
 
     def delete_item(self):
         """Handle deleting an item through a confirmation box."""
-        if (self.selected_item is None):
+        selected = self.grid.selected_record()
+        if (selected is None):
             messagebox.showinfo("Info", "Please select an airline to delete")
             return
         
-        item_data = self.treeview.item(self.selected_item)
-        row_id = int(item_data['values'][0])
-        record_name = str(item_data['values'][1])
+        row_id = int(selected.id)
+        record_name = str(selected.company_name)
 
         # Truncate long names to prevent status bar overflow
         old_display = self.truncate_name(record_name)
 
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete airline '{old_display}'?"):
             try:
-                if not item_data or len(item_data['values']) == 0:
-                    return
-
                 if (self.rec_man.delete_record(row_id, "airline")):
-                    self.treeview.delete(self.selected_item)
                     messagebox.showinfo("Delete Successful", "Airline deleted successfully!")
                     self.update_status(f"Airline '{old_display}' (ID: {row_id}) has been successfully deleted")
             except Exception as e:
@@ -253,6 +301,7 @@ class AirlineView(ttk.Frame):
         Supports searching by:
         - All fields (partial or full match)
         - Multiple criteria (separated by spaces or commas)
+        - Approximate names, when the query starts with "~" (e.g. "~smyth")
         """
         # Get the search query from the search variable
         search_query = self.search_var.get().strip()
@@ -262,13 +311,46 @@ class AirlineView(ttk.Frame):
             self.refresh_treeview()
             return
         
-        # Use the SearchController to search for airlines
-        from controllers.search_controller import SearchController
-        search_controller = SearchController(self.rec_man)
-        search_results = search_controller.search_airlines(search_query)
-        
-        # Update the treeview with the results
-        self.update_treeview_with_results(search_results)
+        # Search in the background and show the best matches once they are ranked
+        self.cancel_search()
+        self.cancel_page()
+        self.search_worker.submit_ranked('airline', search_query, SEARCH_RESULT_LIMIT)
+        self._search_after_id = self.treeview.after(SEARCH_POLL_MS, self.show_search_results)
+
+    def show_search_results(self):
+        """Show the results of the background search once it is done, polling until then."""
+        self._search_after_id = None
+
+        # Safety check for destroyed widgets
+        try:
+            if not self.treeview.winfo_exists():
+                return
+        except tk.TclError:
+            return  # Widget may have been destroyed
+
+        try:
+            batches = self.search_worker.poll()
+        except Exception as e:
+            self.update_status(f"Error searching airlines: {str(e)}")
+            return
+
+        for results, done in batches:
+            for best_results, total in results:
+                self.update_treeview_with_results(best_results)
+                if len(best_results) < total:
+                    self.update_status(f"Showing the best {len(best_results)} of {total} matching airlines")
+            if done:
+                return
+
+        self._search_after_id = self.treeview.after(SEARCH_POLL_MS, self.show_search_results)
+
+    def cancel_search(self):
+        """Stop waiting for the results of a previous search."""
+        if self._search_after_id is not None:
+            self.treeview.after_cancel(self._search_after_id)
+            self._search_after_id = None
+
+        self.search_worker.cancel()
 
     def update_treeview_with_results(self, search_results):
         """
@@ -277,18 +359,180 @@ class AirlineView(ttk.Frame):
         Args:
             search_results: List of airline records to display
         """
-        # Clear the treeview
-        for item in self.treeview.get_children():
-            self.treeview.delete(item)
-        
-        # Populate the treeview with the filtered results
-        for airline in search_results:
-            self.treeview.insert("", "end", values=(airline.id, airline.company_name))
+        self.is_paged = False
+        self.update_pager()
+
+        self.grid.set_records(search_results)
 
     def refresh_treeview(self):
-        """Refresh the treeview with all airline records."""
-        all_airlines = self.rec_man.get_records_by_type('airline')
-        self.update_treeview_with_results(all_airlines)
+        """Refresh the treeview with the current page of all airline records."""
+        self.show_page(self.page_offset)
+
+    def show_page(self, offset):
+        """
+        Show the page of all airline records starting at an offset.
+        
+        Args:
+            offset: Position of the first record of the page
+        """
+        # A search or page still running must not replace the page once it finishes
+        self.cancel_search()
+        self.cancel_page()
+
+        if self.grid.sort_column is not None:
+            # Pages follow the grid's sort order, so sorting orders every airline, not just this page;
+            # the sort runs on the page worker so the window stays responsive
+            self.is_paged = True
+            self.page_worker.submit_page('airline', offset, PAGE_SIZE, self.grid.sort_column,
+                                         self.page_sort_key(self.grid.sort_column), self.grid.sort_reverse)
+            self.update_status("Sorting airlines...")
+            self._page_after_id = self.treeview.after(SEARCH_POLL_MS, self.show_sorted_page)
+            return
+
+        records, total = self.rec_man.get_page('airline', offset, PAGE_SIZE)
+        if not records and offset > 0:
+            # Records were deleted from the end, show the last page instead
+            offset = max(0, total - 1) // PAGE_SIZE * PAGE_SIZE
+            records, total = self.rec_man.get_page('airline', offset, PAGE_SIZE)
+
+        self.set_page(offset, records, total)
+
+    def show_sorted_page(self):
+        """Show the sorted page once the page worker has read it, polling until then."""
+        self._page_after_id = None
+
+        # Safety check for destroyed widgets
+        try:
+            if not self.treeview.winfo_exists():
+                return
+        except tk.TclError:
+            return  # Widget may have been destroyed
+
+        try:
+            batches = self.page_worker.poll()
+        except Exception as e:
+            self.update_status(f"Error sorting airlines: {str(e)}")
+            return
+
+        for pages, done in batches:
+            for offset, records, total in pages:
+                self.set_page(offset, records, total)
+            if done:
+                return
+
+        self._page_after_id = self.treeview.after(SEARCH_POLL_MS, self.show_sorted_page)
+
+    def cancel_page(self):
+        """Stop waiting for a sorted page requested earlier."""
+        if self._page_after_id is not None:
+            self.treeview.after_cancel(self._page_after_id)
+            self._page_after_id = None
+
+        self.page_worker.cancel()
+
+    def page_sort_key(self, column):
+        """
+        Return the function building the key every airline is sorted by for a column.
+        
+        The key only reads the record, so the page worker can call it off the Tk thread.
+        
+        Args:
+            column: Treeview column to sort by
+        """
+        index = self.treeview["columns"].index(column)
+        return lambda record_manager: lambda airline: sort_key(self.row_values(airline)[index])
+
+    def set_page(self, offset, records, total):
+        """
+        Show a page of all airline records.
+        
+        Args:
+            offset: Position of the first record of the page
+            records: Records on the page
+            total: Number of airline records
+        """
+        self.is_paged = True
+        self.page_offset = offset
+        self.page_total = total
+        self.update_pager()
+
+        # Add the page in batches, so the view is usable while it fills
+        self.grid.load(records, self.show_load_progress)
+
+    def show_load_progress(self, loaded, total):
+        """Report the progress of loading the airlines in the status bar."""
+        if loaded < total:
+            self.update_status(f"Loading airlines... {loaded} of {total}")
+        else:
+            self.update_status(f"{total} airline(s) loaded")
+
+    def on_sort(self, column, reverse):
+        """Show the first page of all airlines in a new sort order, if the view is paged."""
+        if not self.is_paged:
+            return False
+
+        self.show_page(0)
+        return True
+
+    def previous_page(self):
+        """Show the previous page of airlines."""
+        self.show_page(max(0, self.page_offset - PAGE_SIZE))
+
+    def next_page(self):
+        """Show the next page of airlines."""
+        self.show_page(self.page_offset + PAGE_SIZE)
+
+    def update_pager(self):
+        """Show the position of the current page and enable the page buttons that apply."""
+        if self.is_paged and self.page_total:
+            last = min(self.page_offset + PAGE_SIZE, self.page_total)
+            self.page_label.config(text=f"{self.page_offset + 1}–{last} of {self.page_total}")
+        else:
+            self.page_label.config(text="")
+
+        has_previous = self.is_paged and self.page_offset > 0
+        has_next = self.is_paged and self.page_offset + PAGE_SIZE < self.page_total
+        self.previous_page_button.config(state="normal" if has_previous else "disabled")
+        self.next_page_button.config(state="normal" if has_next else "disabled")
+
+    def reload_records(self):
+        """Show the records again, keeping the current filter or search."""
+        if self.search_var.get().strip():
+            self.search_item()
+        else:
+            self.refresh_treeview()
+
+    def on_records_changed(self, events):
+        """
+        Apply a batch of record changes to the grid.
+        
+        Args:
+            events: List of ChangeEvent objects published by the record manager
+        """
+        page_changed = False
+        for event in events:
+            if event.record_type == 'airline':
+                if event.action == RELOADED:
+                    # The whole collection was replaced, nothing else in the batch matters
+                    self.reload_records()
+                    return
+                elif self.is_paged and event.action in (CREATED, DELETED):
+                    # Records move between pages, so the page is read again below
+                    page_changed = True
+                elif event.action == DELETED:
+                    self.grid.remove(event.record_id)
+                else:
+                    # Skip records deleted again later in the same batch
+                    record = self.rec_man.find_record(event.record_id, 'airline')
+                    if record is None:
+                        continue
+                    if event.action == CREATED:
+                        self.grid.append(record)
+                    else:
+                        self.grid.update_record(record)
+
+        if page_changed:
+            self.refresh_treeview()
 
     def toggle_search_mode(self):
         """Toggle between search button and search entry field."""
@@ -306,6 +550,8 @@ class AirlineView(ttk.Frame):
 
     def perform_search(self):
         """Execute the search and revert to button mode."""
+        self.cancel_live_search()
+
         # Call the original search method
         self.search_item()
         
@@ -313,6 +559,33 @@ class AirlineView(ttk.Frame):
         if self.is_search_mode:
             self.toggle_search_mode()
 
+    def schedule_live_search(self, *args):
+        """Schedule a live search, restarting the delay on every keystroke."""
+        if not self.is_search_mode:
+            return
+
+        self.cancel_live_search()
+        self._live_search_after_id = self.search_entry.after(LIVE_SEARCH_DELAY_MS, self.live_search)
+
+    def cancel_live_search(self):
+        """Cancel a pending live search."""
+        if self._live_search_after_id is not None:
+            self.search_entry.after_cancel(self._live_search_after_id)
+            self._live_search_after_id = None
+
+    def live_search(self):
+        """Filter the treeview with the query typed so far."""
+        self._live_search_after_id = None
+
+        # Safety check for destroyed widgets
+        try:
+            if not self.treeview.winfo_exists():
+                return
+        except tk.TclError:
+            return  # Widget may have been destroyed
+
+        self.search_item()
+
     def handle_focus_out(self, event):
         """Handle the focus out event with a small delay to allow clicks to register."""
         if self.is_search_mode:
@@ -331,24 +604,21 @@ class AirlineView(ttk.Frame):
 
         if (result):
             if (action == "Add"):
-                self.rec_man.airlines.append(output)
-                self.treeview.insert("", "end", values=(output.id, output.company_name))
+                self.rec_man.add_record(output)
 
                 # Truncate long names to prevent status bar overflow
                 new_display = self.truncate_name(output.company_name)
 
                 self.update_status(f"New airline '{new_display}' (ID: {output.id}) has been successfully added")
             elif (action == "Edit"):
-                for a in self.rec_man.airlines:
-                    if a.id == output.id:
-                        a.company_name = output.company_name
-                        self.treeview.item(self.selected_item, text="", values=(output.id, output.company_name))
+                # Store the edited values through the record manager, which announces the change
+                self.rec_man.update_record(output)
 
-                        # Truncate long names to prevent status bar overflow
-                        old_display = self.truncate_name(original_name)
-                        new_display = self.truncate_name(output.company_name)
+                # Truncate long names to prevent status bar overflow
+                old_display = self.truncate_name(original_name)
+                new_display = self.truncate_name(output.company_name)
 
-                        if output.company_name != original_name:
-                            self.update_status(f"Airline (ID: {output.id}) successfully updated: '{old_display}' ⟶ '{new_display}'")
+                if output.company_name != original_name:
+                    self.update_status(f"Airline (ID: {output.id}) successfully updated: '{old_display}' ⟶ '{new_display}'")
 
         self.rec_man.save_to_file()
@@ -7,6 +7,8 @@ import sys
 from views.airline_view import AirlineView
 from views.client_view import ClientView
 from views.flight_view import FlightView
+from views.search_results_view import SearchResultsView
+from controllers.search_worker import SearchWorker
 
 from models import record_manager
 
@@ -59,8 +61,15 @@ class App(tk.Tk):
         # Initialize database manager
         self.rec_man = record_manager.RecordManager()
         
+        # Background search shared by every global search, so a new query cancels the previous one
+        self.global_search_worker = SearchWorker(self.rec_man)
+        
         # Initialize tracking variables
         self.current_view = None
+        self.view = None
+        
+        # Views kept alive across navigation, with the frame each is packed in
+        self.views = {}
         
         # Load the initial content
         self.load_content("Manage Clients")
@@ -158,6 +167,9 @@ class App(tk.Tk):
         # Create navigation buttons
         self.create_menu()
         
+        # Search across all record types
+        self.create_global_search()
+        
         # Spacer to push exit button to bottom
         spacer = ttk.Frame(self.menu_frame)
         spacer.pack(fill=tk.Y, expand=True)
@@ -227,6 +239,61 @@ class App(tk.Tk):
         btn_flights.pack(pady=2, fill=tk.X)
         self.nav_buttons["Manage Flights"] = btn_flights
     
+    def create_global_search(self):
+        """Create the search box that searches clients, airlines and flights at once."""
+        separator = ttk.Separator(self.menu_frame, orient='horizontal')
+        separator.pack(fill='x', pady=(15, 5))
+        
+        search_label = ttk.Label(self.menu_frame, text="Search All", style='NavLabel.TLabel')
+        search_label.pack(anchor='w', pady=5)
+        
+        self.global_search_var = tk.StringVar()
+        self.global_search_entry = ttk.Entry(
+            self.menu_frame,
+            textvariable=self.global_search_var,
+            font=(self.system_font, 11),
+            width=20
+        )
+        self.global_search_entry.pack(pady=2, fill=tk.X)
+        self.global_search_entry.bind("<Return>", lambda e: self.global_search())
+    
+    def global_search(self):
+        """Show the records of every type matching the global search box."""
+        search_query = self.global_search_var.get().strip()
+        if not search_query:
+            return
+        
+        self.hide_content()
+        
+        self.current_view = "Search Results"
+        self.view = SearchResultsView(self.content_frame, self.rec_man, search_query,
+                                      self.update_status, self.open_record, self.global_search_worker)
+        self.highlight_active_nav(None)
+    
+    def open_record(self, record_type, record_id):
+        """
+        Open the view of a record type, filtered to a single record.
+        
+        Args:
+            record_type: Type of the record ('client', 'airline', or 'flight')
+            record_id: ID of the record
+        """
+        content_type = {
+            "client": "Manage Clients",
+            "airline": "Manage Airlines",
+            "flight": "Manage Flights",
+        }[record_type]
+        
+        self.load_content(content_type)
+        
+        if self.view is not None and self.current_view == content_type:
+            # The search only filters the flat list, so leave the grouped display first
+            if isinstance(self.view, FlightView) and self.view.group_by is not None:
+                self.view.clear_grouping()
+            
+            self.view.search_var.set(f"id:{record_id}")
+            self.view.search_item()
+    
     def load_content(self, content_type):
         """
         Load the appropriate view into the content frame.
@@ -242,33 +309,63 @@ class App(tk.Tk):
         self.update_status(f"Loading {content_type}...")
         
         try:
-            # Clear any existing widgets in the right frame
-            for widget in self.content_frame.winfo_children():
-                widget.destroy()
+            # Hide the current view
+            self.hide_content()
+            self.view = None
             
-            # Load the appropriate view
-            if content_type == "Manage Clients":
-                view = ClientView(self.content_frame, self.rec_man, self.update_status)
-                self.highlight_active_nav("Manage Clients")
-                
-            elif content_type == "Manage Airlines":
-                view = AirlineView(self.content_frame, self.rec_man, self.update_status)
-                self.highlight_active_nav("Manage Airlines")
+            if content_type in self.views:
+                # Show the view built earlier, kept up to date through the change feed
+                frame, view = self.views[content_type]
+                frame.pack(fill=tk.BOTH, expand=True)
+                self.highlight_active_nav(content_type)
                 
-            elif content_type == "Manage Flights":
-                view = FlightView(self.content_frame, self.rec_man, self.update_status)
-                self.highlight_active_nav("Manage Flights")
+                # Finish showing records whose loading was abandoned when the view was hidden
+                if view.grid.load_incomplete:
+                    view.reload_records()
                 
             else:
-                self.update_status("Unknown content type")
-                return
+                # Build the view in its own frame, so it can be hidden and shown again
+                frame = ttk.Frame(self.content_frame)
+                
+                if content_type == "Manage Clients":
+                    view = ClientView(frame, self.rec_man, self.update_status)
+                    
+                elif content_type == "Manage Airlines":
+                    view = AirlineView(frame, self.rec_man, self.update_status)
+                    
+                elif content_type == "Manage Flights":
+                    view = FlightView(frame, self.rec_man, self.update_status)
+                    
+                else:
+                    frame.destroy()
+                    self.update_status("Unknown content type")
+                    return
+                
+                frame.pack(fill=tk.BOTH, expand=True)
+                self.views[content_type] = (frame, view)
+                self.highlight_active_nav(content_type)
             
+            self.view = view
             self.update_status(f"{content_type} loaded successfully")
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load {content_type}: {str(e)}")
             self.update_status(f"Error: Failed to load {content_type}")
     
+    def hide_content(self):
+        """Hide the cached views and remove any other widgets from the content frame."""
+        cached_frames = [frame for frame, view in self.views.values()]
+        
+        # Stop filling grids nobody can see
+        for frame, view in self.views.values():
+            view.grid.cancel_load()
+        
+        for widget in self.content_frame.winfo_children():
+            if widget in cached_frames:
+                widget.pack_forget()
+            else:
+                widget.destroy()
+    
     def highlight_active_nav(self, active_item):
         """Highlight the active navigation button."""
         for item, button in self.nav_buttons.items():
@@ -282,6 +379,7 @@ class App(tk.Tk):
         self.bind("<Alt-c>", lambda e: self.load_content("Manage Clients"))
         self.bind("<Alt-a>", lambda e: self.load_content("Manage Airlines"))
         self.bind("<Alt-f>", lambda e: self.load_content("Manage Flights"))
+        self.bind("<Control-f>", lambda e: self.global_search_entry.focus_set())
         self.bind("<Escape>", lambda e: self.on_closing())
     
     def update_status(self, message):
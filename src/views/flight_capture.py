@@ -8,6 +8,12 @@ from tktimepicker import constants
 from models import record_manager
 from models import flight_record
 
+# First entry of the client and airline pickers
+PLEASE_SELECT = "-- Please Select --"
+
+# Maximum number of names offered by a picker while typing
+PICKER_LIMIT = 50
+
 
 class FlightCapture(tk.Toplevel):
     def __init__(self, rec_man: record_manager.RecordManager, rec: flight_record.FlightRecord, action="Add"):
@@ -26,17 +32,16 @@ class FlightCapture(tk.Toplevel):
         self.rec = rec
         self.result = False
         self.action = action
-        self.client_names = []
-        self.airline_names = []
 
-        # Fetch reference data
-        self.client_names.append("-- Please Select --")
-        for c in self.rec_man.clients:
-            self.client_names.append(c.name)
+        # ID of the record behind each picker entry, by record type
+        self.picker_ids = {"client": {}, "airline": {}}
 
-        self.airline_names.append("-- Please Select --")
-        for c in self.rec_man.airlines:
-            self.airline_names.append(c.company_name)
+        # Fetch the first reference names; the pickers narrow them down as the user types
+        self.client_names = self.matching_names("client", "")
+        self.airline_names = self.matching_names("airline", "")
+
+        # Text each picker was last filtered by
+        self.picker_text = {}
 
         # Detect and configure system fonts
         import platform
@@ -112,6 +117,7 @@ class FlightCapture(tk.Toplevel):
 
         self.client_select = ttk.Combobox(content_frame, font=self.default_font, values=self.client_names, width=30)
         self.client_select.grid(row=0, column=1, padx=5, pady=5, sticky="we")
+        self.client_select.bind("<KeyRelease>", lambda e: self.filter_picker(self.client_select, "client"))
 
         # Airline_ID
         lbl_airline_id = ttk.Label(content_frame, text="Airline ID:", width=15, anchor="w")
@@ -122,6 +128,7 @@ class FlightCapture(tk.Toplevel):
 
         self.airline_select = ttk.Combobox(content_frame, font=self.default_font, values=self.airline_names, width=30)
         self.airline_select.grid(row=1, column=1, padx=5, pady=5, sticky="we")
+        self.airline_select.bind("<KeyRelease>", lambda e: self.filter_picker(self.airline_select, "airline"))
 
         # Date
         lbl_date = ttk.Label(content_frame, text="Date:", width=15, anchor="nw")
@@ -188,16 +195,8 @@ class FlightCapture(tk.Toplevel):
         self.txt_start_city.insert(0, self.rec.start_city)
         self.txt_end_city.insert(0, self.rec.end_city)
         
-        client_idx = 0
-        if (self.rec.client_name and self.rec.client_name != ""):
-            client_idx = self.client_names.index(self.rec.client_name)
-
-        airline_idx = 0
-        if (self.rec.airline_name and self.rec.airline_name != ""):
-            airline_idx = self.airline_names.index(self.rec.airline_name)
-
-        self.client_select.current(client_idx)
-        self.airline_select.current(airline_idx)
+        self.client_select.set(self.current_entry("client", self.rec.client_id, self.rec.client_name))
+        self.airline_select.set(self.current_entry("airline", self.rec.airline_id, self.rec.airline_name))
 
         # Set focus to the name field for immediate editing
         self.txt_client_id.focus_set()
@@ -210,13 +209,11 @@ class FlightCapture(tk.Toplevel):
             new_min = self.txt_time.minutes()
             new_date = datetime(dt.year, dt.month, dt.day, new_hr, new_min)
 
-            client_name = self.client_select.get()
-            if (client_name is None or client_name == "" or client_name == "-- Please Select --"):
+            if (self.selected_record("client", self.client_select) is None):
                 messagebox.showerror("Validation failed!", "Please select a valid Client before you continue")
                 return False
 
-            airline_name = self.airline_select.get()
-            if (airline_name is None or airline_name == "" or airline_name == "-- Please Select --"):
+            if (self.selected_record("airline", self.airline_select) is None):
                 messagebox.showerror("Validation failed!", "Please select a valid Airline before you continue")
                 return False
 
@@ -252,9 +249,7 @@ class FlightCapture(tk.Toplevel):
         new_date = datetime(dt.year, dt.month, dt.day, new_hr, new_min)
 
         self.rec.client_id = self.txt_client_id.get().strip()
-        self.rec.client_name = self.client_select.get()
         self.rec.airline_id = self.txt_airline_id.get().strip()
-        self.rec.airline_name = self.airline_select.get()
         self.rec.date = new_date
         self.rec.start_city = self.txt_start_city.get().strip()
         self.rec.end_city = self.txt_end_city.get().strip()
@@ -262,17 +257,75 @@ class FlightCapture(tk.Toplevel):
         self.resolve_ids()
 
 
+    def matching_names(self, record_type, prefix):
+        """Return the picker entries for the client or airline names starting with a prefix."""
+        records = self.rec_man.complete_names(record_type, prefix, PICKER_LIMIT)
+        entries = [self.picker_entry(record_type, r) for r in records]
+        return ([PLEASE_SELECT] if not prefix.strip() else []) + entries
+
+
+    def picker_entry(self, record_type, record):
+        """Return the picker entry of a client or airline, adding its ID if the name is shared."""
+        name = record.name if record_type == "client" else record.company_name
+        entry = name
+        if len(self.rec_man.find_records_by_name(record_type, name)) > 1:
+            entry = f"{name} (ID {record.id})"
+
+        self.picker_ids[record_type][entry] = record.id
+        return entry
+
+
+    def current_entry(self, record_type, record_id, name):
+        """Return the picker entry of the client or airline a flight refers to."""
+        try:
+            record = self.rec_man.find_record(int(record_id), record_type)
+        except (TypeError, ValueError):
+            record = None
+
+        if record is None:
+            return name or PLEASE_SELECT
+        return self.picker_entry(record_type, record)
+
+
+    def selected_record(self, record_type, picker):
+        """
+        Return the client or airline chosen in a picker.
+
+        Entries offered by the picker map straight to their record; a typed
+        name is looked up by name and only accepted if it is unique.
+
+        Returns:
+            The selected record, or None if nothing valid is selected
+        """
+        entry = picker.get()
+        record_id = self.picker_ids[record_type].get(entry)
+        if record_id is not None:
+            return self.rec_man.find_record(record_id, record_type)
+
+        records = self.rec_man.find_records_by_name(record_type, entry.strip())
+        return records[0] if len(records) == 1 else None
+
+
+    def filter_picker(self, picker, record_type):
+        """Offer only the names matching the text typed into a picker so far."""
+        typed = picker.get()
+        if typed == self.picker_text.get(record_type):
+            # Keys such as the arrows do not change the text
+            return
+
+        self.picker_text[record_type] = typed
+        picker.configure(values=self.matching_names(record_type, typed))
+
+
     def resolve_ids(self):
         """Resolve id's for combo box selections."""
-        for c in self.rec_man.clients:
-            if self.rec.client_name == c.name:
-                self.rec.client_id = c.id
-                break
-
-        for a in self.rec_man.airlines:
-            if self.rec.airline_name == a.company_name:
-                self.rec.airline_id = a.id
-                break
+        client = self.selected_record("client", self.client_select)
+        self.rec.client_id = client.id
+        self.rec.client_name = client.name
+
+        airline = self.selected_record("airline", self.airline_select)
+        self.rec.airline_id = airline.id
+        self.rec.airline_name = airline.company_name
 
 
     def cancel(self):
@@ -1,9 +1,31 @@
+import copy
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from views import flight_capture
+from views.virtual_grid import VirtualGrid, sort_key
+from controllers.search_worker import SearchWorker
+from models.change_feed import CREATED, UPDATED, DELETED, RELOADED
+from utils.text_matching import search_key
+
+# Delay after the last keystroke before a live search runs
+LIVE_SEARCH_DELAY_MS = 300
+
+# Interval at which results of a background search are collected
+SEARCH_POLL_MS = 20
+
+# Records per page when browsing all flights
+PAGE_SIZE = 1000
+
+# Display modes offered by the grouping selector, and the grouping each uses
+GROUP_MODES = {
+    "No grouping": None,
+    "Group by day": "day",
+    "Group by client": "client",
+    "Group by airline": "airline",
+}
 
 class FlightView(tk.Frame):
     parent = None
@@ -43,9 +65,23 @@ class FlightView(tk.Frame):
 
         self.rec_man = rec_man
 
+        self._live_search_after_id = None
+
+        # Flight searches run on a background thread, which also keeps the
+        # previous results so live search can refine them
+        self.search_worker = SearchWorker(rec_man)
+        self._result_stream_after_id = None
+        self._streamed_count = 0
+        self._stream_started = False
+
+        # Pages in a sort order are read on their own worker, since sorting every flight takes a while
+        self.page_worker = SearchWorker(rec_man)
+        self._page_after_id = None
+
         self.setup_button_styles
         self.create_toolbar()
         self.create_treeview()
+        self.create_group_tree()
 
     def setup_button_styles(self):
         style = ttk.Style()
@@ -53,6 +89,7 @@ class FlightView(tk.Frame):
         style.configure('Edit.TButton', font=self.button_font, width=15)
         style.configure('Delete.TButton', font=self.button_font, width=10)
         style.configure('Search.TButton', font=self.button_font, width=10)
+        style.configure('Today.TButton', font=self.button_font, width=10)
 
     def create_toolbar(self):
         """Create the toolbar with Add and Search buttons."""
@@ -75,10 +112,41 @@ class FlightView(tk.Frame):
         self.delete_button = ttk.Button(toolbar, text="❌ Delete", style='Delete.TButton', command=self.delete_item, state="disabled")
         self.delete_button.pack(side=tk.LEFT, padx=5, pady=5)
 
+        # Toggle between all flights and the flights departing today
+        self.today_button = ttk.Button(toolbar, text="📅 Today", style='Today.TButton', command=self.toggle_today_filter)
+        self.today_button.pack(side=tk.LEFT, padx=15, pady=5)
+        self.is_today_filter = False
+
+        # Switch between the flat list and the flights grouped by day, client or airline
+        self.group_var = tk.StringVar(value="No grouping")
+        self.group_select = ttk.Combobox(toolbar, textvariable=self.group_var, values=list(GROUP_MODES),
+                                         state="readonly", width=16)
+        self.group_select.pack(side=tk.LEFT, padx=5, pady=5)
+        self.group_select.bind("<<ComboboxSelected>>", lambda e: self.set_grouping(GROUP_MODES[self.group_var.get()]))
+        self.group_by = None
+
         # Search implementation
         self.search_frame = ttk.Frame(toolbar)
         self.search_frame.pack(side=tk.RIGHT, padx=5, pady=5)
 
+        # Pager for browsing all flights a page at a time
+        self.pager_frame = ttk.Frame(toolbar)
+        self.pager_frame.pack(side=tk.RIGHT, padx=5, pady=5)
+
+        self.previous_page_button = ttk.Button(self.pager_frame, text="◀", width=3, command=self.previous_page, state="disabled")
+        self.previous_page_button.pack(side=tk.LEFT)
+
+        self.page_label = ttk.Label(self.pager_frame, text="")
+        self.page_label.pack(side=tk.LEFT, padx=5)
+
+        self.next_page_button = ttk.Button(self.pager_frame, text="▶", width=3, command=self.next_page, state="disabled")
+        self.next_page_button.pack(side=tk.LEFT)
+
+        # Track the page shown; search results and filters are not paged
+        self.is_paged = True
+        self.page_offset = 0
+        self.page_total = 0
+
         # Create search variable and entry widget
         self.search_var = tk.StringVar()
         self.search_entry = ttk.Entry(
@@ -93,6 +161,9 @@ class FlightView(tk.Frame):
         self.search_entry.bind("<Escape>", lambda e: self.toggle_search_mode())
         self.search_entry.bind("<FocusOut>", self.handle_focus_out)
 
+        # Live search: re-run the search shortly after the user stops typing
+        self.search_var.trace_add("write", self.schedule_live_search)
+
         # Create a button with a magnifying glass icon
         self.search_button = ttk.Button(
             self.search_frame,
@@ -117,6 +188,7 @@ class FlightView(tk.Frame):
         """Create the treeview widget to display data."""
         treeview_frame = tk.Frame(self.parent)
         treeview_frame.pack(fill=tk.BOTH, expand=True)
+        self.treeview_frame = treeview_frame
 
         # Create a horizontal scrollbar
         self.h_scrollbar = ttk.Scrollbar(treeview_frame, orient=tk.HORIZONTAL)
@@ -155,21 +227,25 @@ class FlightView(tk.Frame):
             self.treeview.heading(col, text=display_name)
             self.treeview.column(col, width=width, minwidth=width//2, stretch=True)
 
-        # Load data
-        data = self.rec_man.get_records_by_type('flight')
-        for item in data:
-            self.display_rec(item, "insert")
-            #self.treeview.insert("", "end", values=(
-            #    item.id, item.client_id, item.airline_id, item.date,
-            #   item.start_city, item.end_city
-            #    ))
+        # Column values of flight rows by flight ID, built once and dropped when they go stale
+        self._row_cache = {}
+
+        # Only the visible rows are kept as treeview items
+        self.grid = VirtualGrid(self.treeview, self.row_values, on_sort=self.on_sort)
+
+        # Apply record changes to the grid as they are made, even while the view is hidden
+        self.rec_man.subscribe(self.on_records_changed)
+        self.treeview.bind("<Destroy>", lambda e: self.rec_man.unsubscribe(self.on_records_changed), add="+")
+
+        # Show the first page of flights
+        self.show_page(0)
 
         # Pack the treeview
         self.treeview.pack(expand=True, fill=tk.BOTH)
         self.treeview.bind('<<TreeviewSelect>>', self.select_item)
 
         # Bind to Configure event for handling resize
-        self.treeview.bind("<Configure>", self.on_treeview_configure)
+        self.treeview.bind("<Configure>", self.on_treeview_configure, add="+")
 
         # Hide scrollbar initially (will be shown if needed)
         self.h_scrollbar.pack_forget()
@@ -178,6 +254,29 @@ class FlightView(tk.Frame):
         # Initial update after UI is stable
         self.treeview.after(500, self.adjust_columns_and_scrollbar)
 
+    def create_group_tree(self):
+        """Create the tree showing the flights in groups, hidden until a grouping is chosen."""
+        self.group_frame = tk.Frame(self.parent)
+
+        self.group_tree = ttk.Treeview(self.group_frame, columns=self.treeview["columns"], show="tree headings")
+        group_scrollbar = ttk.Scrollbar(self.group_frame, orient=tk.VERTICAL, command=self.group_tree.yview)
+        self.group_tree.configure(yscrollcommand=group_scrollbar.set)
+        group_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # The tree column holds the group names, the other columns match the flat list
+        self.group_tree.column("#0", width=220, minwidth=110, stretch=False)
+        for col, width in self.column_base_widths.items():
+            self.group_tree.heading(col, text=self.treeview.heading(col, "text"))
+            self.group_tree.column(col, width=width, minwidth=width//2, stretch=True)
+
+        self.group_tree.pack(expand=True, fill=tk.BOTH)
+        self.group_tree.bind("<<TreeviewOpen>>", self.on_group_open)
+        self.group_tree.bind("<<TreeviewSelect>>", self.select_item)
+
+        # Group keys by group item ID, and the groups whose flights were inserted
+        self._group_keys = {}
+        self._filled_groups = set()
+
     def on_treeview_configure(self, event=None):
         """Handle treeview configuration changes (like resize or moving to another screen)"""
         # Use after to avoid multiple rapid updates
@@ -262,36 +361,42 @@ class FlightView(tk.Frame):
 
         self.open_child_window(rec, "Add")
 
+    def selected_flight(self):
+        """Return the flight selected in the flat list or the group tree, None if no flight is selected."""
+        if self.group_by is None:
+            return self.grid.selected_record()
+
+        item = self.group_tree.focus()
+        if not item.isdigit():
+            return None  # Nothing or a group is selected
+        return self.rec_man.find_record(int(item), "flight")
+
     def edit_item(self):
         """Handle adding a new item by opening a child window."""
-        if (self.selected_item is None):
+        selected = self.selected_flight()
+        if (selected is None):
             return
-        
-        item_data = self.treeview.item(self.selected_item)
 
-        if not item_data or len(item_data['values']) == 0:
+        row_id = int(selected.id)
+        rec = self.rec_man.find_record(row_id, "flight")
+        if rec is None:
             return
 
-        row_id = int(item_data['values'][0])
-        rec = self.rec_man.get_record_by_id(row_id, "flight")
-        self.open_child_window(rec, "Edit")
+        # Edit a copy, so background searches never see a half-edited record
+        self.open_child_window(copy.copy(rec), "Edit")
 
     def delete_item(self):
         """Handle adding a new item by opening a child window."""
-        if (self.selected_item is None):
+        selected = self.selected_flight()
+        if (selected is None):
             messagebox.showinfo("Info", "Please select a flight to delete")
             return
         
-        item_data = self.treeview.item(self.selected_item)
-        row_id = int(item_data['values'][0])
+        row_id = int(selected.id)
 
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete 'Flight ID: {row_id}'?"):
             try:
-                if not item_data or len(item_data['values']) == 0:
-                    return
-
                 if (self.rec_man.delete_record(row_id, "flight")):
-                    self.treeview.delete(self.selected_item)
                     messagebox.showinfo("Delete Successful", "Flight deleted successfully!")
                     self.update_status(f"'Flight ID: {row_id}' has been successfully deleted")
             except Exception as e:
@@ -308,19 +413,74 @@ class FlightView(tk.Frame):
         """
         # Get the search query from the search variable
         search_query = self.search_var.get().strip()
+
+        # A search replaces the today filter
+        if self.is_today_filter:
+            self.today_button.state(['!pressed'])
+            self.is_today_filter = False
         
         # If no query entered but search was triggered, show all records
         if not search_query:
             self.refresh_treeview()
             return
         
-        # Use the SearchController to search for flights
-        from controllers.search_controller import SearchController
-        search_controller = SearchController(self.rec_man)
-        search_results = search_controller.search_flights(search_query)
+        # Stop any search still streaming in; its rows stay until the new results
+        # arrive, so the rows both searches share are kept rather than re-inserted
+        self.cancel_result_stream()
+        self.cancel_page()
+
+        # Search results are not paged
+        self.is_paged = False
+        self.update_pager()
         
-        # Update the treeview with the results
-        self.update_treeview_with_results(search_results)
+        # Search in the background and stream the matching flights in as they are found
+        self.search_worker.submit('flight', search_query)
+        self._streamed_count = 0
+        self._stream_started = False
+        self._result_stream_after_id = self.treeview.after(SEARCH_POLL_MS, self.stream_results)
+
+    def stream_results(self):
+        """Insert the search results found so far and keep polling until the search is done."""
+        self._result_stream_after_id = None
+
+        # Safety check for destroyed widgets
+        try:
+            if not self.treeview.winfo_exists():
+                return
+        except tk.TclError:
+            return  # Widget may have been destroyed
+
+        try:
+            batches = self.search_worker.poll()
+        except Exception as e:
+            self.update_status(f"Error searching flights: {str(e)}")
+            return
+
+        done = False
+        for flights, done in batches:
+            if self._stream_started:
+                self.grid.extend(flights)
+            else:
+                # The first batch replaces the previous results
+                self.grid.set_records(flights)
+                self._stream_started = True
+            self._streamed_count += len(flights)
+
+        if done:
+            self.update_status(f"Found {self._streamed_count} matching flight(s)")
+            return
+
+        if batches:
+            self.update_status(f"Searching... {self._streamed_count} matching flight(s) so far")
+        self._result_stream_after_id = self.treeview.after(SEARCH_POLL_MS, self.stream_results)
+
+    def cancel_result_stream(self):
+        """Stop streaming the results of a previous search."""
+        if self._result_stream_after_id is not None:
+            self.treeview.after_cancel(self._result_stream_after_id)
+            self._result_stream_after_id = None
+
+        self.search_worker.cancel()
 
     def update_treeview_with_results(self, search_results):
         """
@@ -329,18 +489,326 @@ class FlightView(tk.Frame):
         Args:
             search_results: List of flight records to display
         """
-        # Clear the treeview
-        for item in self.treeview.get_children():
-            self.treeview.delete(item)
+        self.is_paged = False
+        self.update_pager()
+
+        # Results of an earlier search or page must not replace them
+        self.cancel_result_stream()
+        self.cancel_page()
         
-        # Populate the treeview with the filtered results
-        for flight in search_results:
-            self.display_rec(flight, "insert")
+        self.grid.set_records(search_results)
 
     def refresh_treeview(self):
-        """Refresh the treeview with all flight records."""
-        all_flights = self.rec_man.get_records_by_type('flight')
-        self.update_treeview_with_results(all_flights)
+        """Refresh the treeview with the current page of all flight records."""
+        self.show_page(self.page_offset)
+
+    def show_page(self, offset):
+        """
+        Show the page of all flight records starting at an offset.
+        
+        Args:
+            offset: Position of the first record of the page
+        """
+        # Results of an earlier search or page must not replace the page once they arrive
+        self.cancel_result_stream()
+        self.cancel_page()
+
+        if self.grid.sort_column is not None:
+            # Pages follow the grid's sort order, so sorting orders every flight, not just this page;
+            # the sort runs on the page worker so the window stays responsive
+            self.is_paged = True
+            self.page_worker.submit_page('flight', offset, PAGE_SIZE, self.grid.sort_column,
+                                         self.page_sort_key(self.grid.sort_column), self.grid.sort_reverse)
+            self.update_status("Sorting flights...")
+            self._page_after_id = self.treeview.after(SEARCH_POLL_MS, self.show_sorted_page)
+            return
+
+        records, total = self.rec_man.get_page('flight', offset, PAGE_SIZE)
+        if not records and offset > 0:
+            # Records were deleted from the end, show the last page instead
+            offset = max(0, total - 1) // PAGE_SIZE * PAGE_SIZE
+            records, total = self.rec_man.get_page('flight', offset, PAGE_SIZE)
+
+        self.set_page(offset, records, total)
+
+    def show_sorted_page(self):
+        """Show the sorted page once the page worker has read it, polling until then."""
+        self._page_after_id = None
+
+        # Safety check for destroyed widgets
+        try:
+            if not self.treeview.winfo_exists():
+                return
+        except tk.TclError:
+            return  # Widget may have been destroyed
+
+        try:
+            batches = self.page_worker.poll()
+        except Exception as e:
+            self.update_status(f"Error sorting flights: {str(e)}")
+            return
+
+        for pages, done in batches:
+            for offset, records, total in pages:
+                self.set_page(offset, records, total)
+            if done:
+                return
+
+        self._page_after_id = self.treeview.after(SEARCH_POLL_MS, self.show_sorted_page)
+
+    def cancel_page(self):
+        """Stop waiting for a sorted page requested earlier."""
+        if self._page_after_id is not None:
+            self.treeview.after_cancel(self._page_after_id)
+            self._page_after_id = None
+
+        self.page_worker.cancel()
+
+    def page_sort_key(self, column):
+        """
+        Return the function building the key every flight is sorted by for a column.
+        
+        Client and airline names are looked up in the snapshot the page
+        worker sorts, bypassing the row cache, so the key can run off the
+        Tk thread.
+        
+        Args:
+            column: Treeview column to sort by
+        """
+        index = self.treeview["columns"].index(column)
+        return lambda record_manager: lambda flight: sort_key(self.display_values(flight, record_manager)[index])
+
+    def set_page(self, offset, records, total):
+        """
+        Show a page of all flight records.
+        
+        Args:
+            offset: Position of the first record of the page
+            records: Records on the page
+            total: Number of flight records
+        """
+        self.is_paged = True
+        self.page_offset = offset
+        self.page_total = total
+        self.update_pager()
+
+        # Add the page in batches, so the view is usable while it fills
+        self.grid.load(records, self.show_load_progress)
+
+    def show_load_progress(self, loaded, total):
+        """Report the progress of loading the flights in the status bar."""
+        if loaded < total:
+            self.update_status(f"Loading flights... {loaded} of {total}")
+        else:
+            self.update_status(f"{total} flight(s) loaded")
+
+    def on_sort(self, column, reverse):
+        """Show the first page of all flights in a new sort order, if the view is paged."""
+        if not self.is_paged:
+            return False
+
+        self.show_page(0)
+        return True
+
+    def previous_page(self):
+        """Show the previous page of flights."""
+        self.show_page(max(0, self.page_offset - PAGE_SIZE))
+
+    def next_page(self):
+        """Show the next page of flights."""
+        self.show_page(self.page_offset + PAGE_SIZE)
+
+    def update_pager(self):
+        """Show the position of the current page and enable the page buttons that apply."""
+        if self.is_paged and self.page_total:
+            last = min(self.page_offset + PAGE_SIZE, self.page_total)
+            self.page_label.config(text=f"{self.page_offset + 1}–{last} of {self.page_total}")
+        else:
+            self.page_label.config(text="")
+
+        has_previous = self.is_paged and self.page_offset > 0
+        has_next = self.is_paged and self.page_offset + PAGE_SIZE < self.page_total
+        self.previous_page_button.config(state="normal" if has_previous else "disabled")
+        self.next_page_button.config(state="normal" if has_next else "disabled")
+
+    def toggle_today_filter(self):
+        """Toggle between showing all flights and only the flights departing today."""
+        if not self.is_today_filter:
+            flights = self.show_today()
+
+            self.today_button.state(['pressed'])
+            self.is_today_filter = True
+            self.update_status(f"Showing {len(flights)} flight(s) departing today")
+        else:
+            self.refresh_treeview()
+
+            self.today_button.state(['!pressed'])
+            self.is_today_filter = False
+            self.update_status("Showing all flights")
+
+    def show_today(self):
+        """Show the flights departing today and return them."""
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        flights = self.rec_man.get_flights_between(today, today + timedelta(days=1))
+        self.update_treeview_with_results(flights)
+        return flights
+
+    def reload_records(self):
+        """Show the records again, keeping the current filter or search."""
+        if self.is_today_filter:
+            self.show_today()
+        elif self.search_var.get().strip():
+            self.search_item()
+        else:
+            self.refresh_treeview()
+
+    def on_records_changed(self, events):
+        """
+        Apply a batch of record changes to the grid.
+        
+        Args:
+            events: List of ChangeEvent objects published by the record manager
+        """
+        names_changed = False
+        page_changed = False
+        for event in events:
+            if event.action == RELOADED:
+                # Every cached row may show replaced names or flights
+                self._row_cache.clear()
+                self.grid.clear_sort_keys()
+            elif event.action != CREATED:
+                self.forget_rows(event)
+
+            if event.record_type == 'flight':
+                if event.action == RELOADED:
+                    # The whole collection was replaced, nothing else in the batch matters
+                    self.reload_records()
+                    page_changed = names_changed = False
+                    break
+                elif self.is_paged and event.action in (CREATED, DELETED):
+                    # Records move between pages, so the page is read again below
+                    page_changed = True
+                elif event.action == DELETED:
+                    self.grid.remove(event.record_id)
+                else:
+                    # Skip records deleted again later in the same batch
+                    record = self.rec_man.find_record(event.record_id, 'flight')
+                    if record is None:
+                        continue
+                    if event.action == CREATED:
+                        self.grid.append(record)
+                    else:
+                        self.grid.update_record(record)
+            elif event.action in (UPDATED, RELOADED):
+                # Client and airline names show up in the flight rows
+                names_changed = True
+
+        if page_changed:
+            self.refresh_treeview()
+        elif names_changed:
+            self.grid.render()
+
+        if self.group_by is not None:
+            # Group counts and names come from the record manager, so only the nodes are rebuilt
+            self.show_groups()
+
+    def forget_rows(self, event):
+        """Drop the cached rows and sort keys a changed flight, client or airline is shown in."""
+        if event.record_type == 'flight':
+            flight_ids = [event.record_id]
+        else:
+            flight_ids = [flight.id for flight in self.rec_man.get_related_records(event.record_id, event.record_type)]
+
+        for flight_id in flight_ids:
+            self._row_cache.pop(int(flight_id), None)
+            self.grid.forget_sort_keys(flight_id)
+
+    def set_grouping(self, group_by):
+        """
+        Switch between the flat list of flights and the flights grouped.
+        
+        Args:
+            group_by: 'day', 'client' or 'airline', or None for the flat list
+        """
+        self.group_by = group_by
+        self.toggle_buttons(False)
+
+        if group_by is None:
+            self.group_frame.pack_forget()
+            self.treeview_frame.pack(fill=tk.BOTH, expand=True)
+
+            # Searching, filtering and paging apply to the flat list only
+            self.today_button.state(['!disabled'])
+            self.search_button.state(['!disabled'])
+            self.update_pager()
+        else:
+            self.treeview_frame.pack_forget()
+            self.group_frame.pack(fill=tk.BOTH, expand=True)
+
+            for button in (self.today_button, self.search_button, self.previous_page_button, self.next_page_button):
+                button.state(['disabled'])
+            self.show_groups()
+
+    def clear_grouping(self):
+        """Return to the flat list of flights, updating the grouping selector."""
+        self.group_var.set(next(label for label, group_by in GROUP_MODES.items() if group_by is None))
+        self.set_grouping(None)
+
+    def show_groups(self):
+        """Show one collapsed node per group with its number of flights, keeping open groups open."""
+        groups = self.group_tree.get_children()
+        open_groups = [item for item in groups if self.group_tree.item(item, "open")]
+        if groups:
+            self.group_tree.delete(*groups)
+        self._group_keys.clear()
+        self._filled_groups.clear()
+
+        groups = [(self.group_label(key), key, count) for key, count in self.rec_man.get_flight_groups(self.group_by)]
+        if self.group_by != "day":
+            # Days are in date order already, clients and airlines are shown by name
+            groups.sort(key=lambda group: search_key(group[0]))
+
+        for label, key, count in groups:
+            item = f"group:{key}"
+            self._group_keys[item] = key
+            self.group_tree.insert("", tk.END, iid=item, text=f"{label} ({count})")
+
+            # Placeholder row, so the group can be expanded before its flights are inserted
+            self.group_tree.insert(item, tk.END, iid=f"{item}:pending")
+
+        for item in open_groups:
+            if item in self._group_keys:
+                self.fill_group(item)
+                self.group_tree.item(item, open=True)
+
+        total = sum(count for label, key, count in groups)
+        self.update_status(f"Showing {total} flight(s) in {len(groups)} group(s)")
+
+    def group_label(self, key):
+        """Return the name shown for a group: its departure day, client name or airline name."""
+        if self.group_by == "day":
+            return key.strftime("%a %d %b %Y")
+
+        record = self.rec_man.find_record(key, self.group_by) if key > 0 else None
+        if record is None:
+            return f"(No {self.group_by})"
+        return (record.name if self.group_by == "client" else record.company_name) or ""
+
+    def on_group_open(self, event):
+        """Insert the flights of a group the first time it is expanded."""
+        item = self.group_tree.focus()
+        if item in self._group_keys:
+            self.fill_group(item)
+
+    def fill_group(self, item):
+        """Replace the placeholder row of a group with its flights."""
+        if item in self._filled_groups:
+            return
+
+        self._filled_groups.add(item)
+        self.group_tree.delete(*self.group_tree.get_children(item))
+        for flight in self.rec_man.get_flights_in_group(self.group_by, self._group_keys[item]):
+            self.group_tree.insert(item, tk.END, iid=str(flight.id), values=self.row_values(flight))
 
     def toggle_search_mode(self):
         """Toggle between search button and search entry field."""
@@ -358,6 +826,8 @@ class FlightView(tk.Frame):
 
     def perform_search(self):
         """Execute the search and revert to button mode."""
+        self.cancel_live_search()
+
         # Call the original search method
         self.search_item()
         
@@ -365,6 +835,33 @@ class FlightView(tk.Frame):
         if self.is_search_mode:
             self.toggle_search_mode()
 
+    def schedule_live_search(self, *args):
+        """Schedule a live search, restarting the delay on every keystroke."""
+        if not self.is_search_mode:
+            return
+
+        self.cancel_live_search()
+        self._live_search_after_id = self.search_entry.after(LIVE_SEARCH_DELAY_MS, self.live_search)
+
+    def cancel_live_search(self):
+        """Cancel a pending live search."""
+        if self._live_search_after_id is not None:
+            self.search_entry.after_cancel(self._live_search_after_id)
+            self._live_search_after_id = None
+
+    def live_search(self):
+        """Filter the treeview with the query typed so far."""
+        self._live_search_after_id = None
+
+        # Safety check for destroyed widgets
+        try:
+            if not self.treeview.winfo_exists():
+                return
+        except tk.TclError:
+            return  # Widget may have been destroyed
+
+        self.search_item()
+
     def handle_focus_out(self, event):
         """Handle the focus out event with a small delay to allow clicks to register."""
         if self.is_search_mode:
@@ -375,27 +872,42 @@ class FlightView(tk.Frame):
     def resolve_references(self, rec):
         """Resolve dependencies for name values."""
         if (int(rec.client_id) > 0):
-            client_rec = self.rec_man.get_record_by_id(rec.client_id, "client")
-            rec.client_name = client_rec.name or ""
+            client_rec = self.rec_man.find_record(int(rec.client_id), "client")
+            rec.client_name = (client_rec.name or "") if client_rec else ""
         else:
             rec.client_name = ""
 
         if (int(rec.airline_id) > 0):
-            airline_rec = self.rec_man.get_record_by_id(rec.airline_id, "airline")
-            rec.airline_name = airline_rec.company_name or ""
+            airline_rec = self.rec_man.find_record(int(rec.airline_id), "airline")
+            rec.airline_name = (airline_rec.company_name or "") if airline_rec else ""
         else:
             rec.airline_name = ""
 
         return rec
 
-    def display_rec(self, rec, action):
-        """Display the record on the grid after resolving dependencies for name values."""
-        rec = self.resolve_references(rec)
+    def row_values(self, rec):
+        """Return the column values of a flight row, from the row cache where possible."""
+        values = self._row_cache.get(int(rec.id))
+        if values is None:
+            values = self._row_cache[int(rec.id)] = self.display_values(rec)
+        return values
 
-        if (action == "update"):
-            self.treeview.item(self.selected_item, text="", values=(rec.id, rec.client_name, rec.airline_name, rec.date, rec.start_city, rec.end_city))
-        else:
-            self.treeview.insert("", "end", values=(rec.id, rec.client_name, rec.airline_name, rec.date, rec.start_city, rec.end_city))
+    def display_values(self, rec, rec_man=None):
+        """
+        Build the column values of a flight row, looking up the client and airline names.
+        
+        Args:
+            rec: Flight record
+            rec_man: RecordManager the names are looked up in, None for the view's own
+        """
+        if rec_man is None:
+            rec_man = self.rec_man
+
+        client = rec_man.find_record(int(rec.client_id), "client") if int(rec.client_id) > 0 else None
+        airline = rec_man.find_record(int(rec.airline_id), "airline") if int(rec.airline_id) > 0 else None
+
+        return (rec.id, (client.name or "") if client else "", (airline.company_name or "") if airline else "",
+                rec.date, rec.start_city, rec.end_city)
 
     def open_child_window(self, rec, action):
         """Open a modal child window with 'OK' and 'Cancel' buttons."""
@@ -412,38 +924,31 @@ class FlightView(tk.Frame):
 
         if (result):
             if (action == "Add"):
-                self.rec_man.flights.append(output)
-                self.display_rec(output, "insert")
+                self.rec_man.add_record(output)
 
                 self.update_status(f"New flight (ID: {output.id}) has been successfully added")
             elif (action == "Edit"):
-                for a in self.rec_man.flights:
-                    if a.id == output.id:
-                        a.client_id = output.client_id
-                        a.airline_id = output.airline_id
-                        a.date = output.date
-                        a.start_city = output.start_city
-                        a.end_city = output.end_city
-                        self.display_rec(output, "update")
-
-                        # Check which fields have changed
-                        original_values = [
-                            original_client_id, original_airline_id, original_airline_id, 
-                            original_date, original_start_city, original_end_city
-                        ]
-                        new_values = [
-                            output.client_id, output.airline_id, output.airline_id, 
-                            output.date, output.start_city, output.end_city
-                            ]
-                        
-                        # Get a list of changed fields
-                        changed_fields = [i for i, (orig, new) in enumerate(zip(original_values, new_values)) if orig != new]
-
-                        if not changed_fields:
-                            # No fields were changed, no status update
-                            pass
-
-                        else:
-                            self.update_status(f"'Flight ID: {output.id}' has been successfully updated")
+                # Store the edited values through the record manager, which announces the change
+                self.rec_man.update_record(output)
+
+                # Check which fields have changed
+                original_values = [
+                    original_client_id, original_airline_id, original_airline_id, 
+                    original_date, original_start_city, original_end_city
+                ]
+                new_values = [
+                    output.client_id, output.airline_id, output.airline_id, 
+                    output.date, output.start_city, output.end_city
+                    ]
+                
+                # Get a list of changed fields
+                changed_fields = [i for i, (orig, new) in enumerate(zip(original_values, new_values)) if orig != new]
+
+                if not changed_fields:
+                    # No fields were changed, no status update
+                    pass
+
+                else:
+                    self.update_status(f"'Flight ID: {output.id}' has been successfully updated")
 
         self.rec_man.save_to_file()
@@ -0,0 +1,158 @@
+import tkinter as tk
+from tkinter import ttk
+
+from controllers.search_worker import SearchWorker
+
+# Group headings of the results, by record type
+GROUP_TITLES = {
+    "client": "Clients",
+    "airline": "Airlines",
+    "flight": "Flights",
+}
+
+# Interval between polls of the background search, in milliseconds
+SEARCH_POLL_MS = 20
+
+class SearchResultsView(ttk.Frame):
+    """
+    Grouped results of a search across clients, airlines and flights.
+    Double-clicking a record opens it in its own view.
+    """
+    parent = None
+    rec_man = None
+
+    def __init__(self, parent, rec_man, search_query, update_status=None, open_record=None, search_worker=None):
+        super(SearchResultsView, self).__init__()
+
+        self.parent = parent
+        self.rec_man = rec_man
+        self.search_query = search_query
+
+        # Store the update_status function
+        self.update_status = update_status or (lambda msg: None)
+
+        # Called with (record_type, record_id) when a record is double-clicked
+        self.open_record = open_record or (lambda record_type, record_id: None)
+
+        # Configure bold font
+        import tkinter.font as tkfont
+
+        self.bold_font = tkfont.Font(font=tkfont.nametofont("TkDefaultFont"))
+        self.bold_font.configure(weight="bold", size=14)
+
+        # Search on a background thread, so large collections do not block the event loop;
+        # the app passes one worker for every results view, so a new search cancels the last
+        self.search_worker = search_worker or SearchWorker(rec_man)
+        self._result_stream_after_id = None
+
+        self.create_header()
+        self.create_treeview()
+        self.show_results()
+
+    def create_header(self):
+        """Create the title showing the query."""
+        header = ttk.Frame(self.parent)
+        header.pack(fill=tk.X)
+
+        label = ttk.Label(header, text=f'Search Results for "{self.search_query}"', font=self.bold_font)
+        label.pack(pady=5)
+
+        # Add a separator
+        separator = ttk.Separator(header, orient='horizontal')
+        separator.pack(fill='x', pady=(10, 5))
+
+    def create_treeview(self):
+        """Create the treeview listing the matching records under one heading per type."""
+        treeview_frame = ttk.Frame(self.parent)
+        treeview_frame.pack(fill=tk.BOTH, expand=True)
+
+        self.treeview = ttk.Treeview(treeview_frame, columns=("id", "details"), show="tree headings")
+
+        self.treeview.heading("#0", text="Type")
+        self.treeview.column("#0", width=140, stretch=False)
+        self.treeview.heading("id", text="ID")
+        self.treeview.column("id", width=70, minwidth=70//2, stretch=False)
+        self.treeview.heading("details", text="Details")
+        self.treeview.column("details", stretch=True)
+
+        scrollbar = ttk.Scrollbar(treeview_frame, orient=tk.VERTICAL, command=self.treeview.yview)
+        self.treeview.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Pack the treeview
+        self.treeview.pack(expand=True, fill=tk.BOTH)
+        self.treeview.bind("<Double-1>", self.open_selected)
+        self.treeview.bind("<Return>", self.open_selected)
+        self.treeview.bind("<Destroy>", lambda e: self.cancel_result_stream(), add="+")
+
+    def show_results(self):
+        """Start the search and list the matching records of each type as they arrive."""
+        # Record type and ID of each record row
+        self.row_records = {}
+        self._found_count = 0
+
+        self.search_worker.submit_all(self.search_query)
+        self.update_status(f"Searching for '{self.search_query}'...")
+        self._result_stream_after_id = self.treeview.after(SEARCH_POLL_MS, self.stream_results)
+
+    def stream_results(self):
+        """Insert the record types searched so far and keep polling until the search is done."""
+        self._result_stream_after_id = None
+
+        try:
+            batches = self.search_worker.poll()
+        except Exception as e:
+            self.update_status(f"Error searching records: {str(e)}")
+            return
+
+        done = False
+        for groups, done in batches:
+            for record_type, records in groups:
+                self.add_group(record_type, records)
+
+        if not done:
+            self._result_stream_after_id = self.treeview.after(SEARCH_POLL_MS, self.stream_results)
+        elif self._found_count:
+            self.update_status(f"Found {self._found_count} record(s) matching '{self.search_query}'")
+        else:
+            self.update_status(f"No records match '{self.search_query}'")
+
+    def add_group(self, record_type, records):
+        """List the matching records of one type under its heading."""
+        group = self.treeview.insert("", "end", text=f"{GROUP_TITLES[record_type]} ({len(records)})", open=True)
+        for record in records:
+            row = self.treeview.insert(group, "end", values=(record.id, self.describe(record_type, record)))
+            self.row_records[row] = (record_type, record.id)
+
+        self._found_count += len(records)
+
+    def cancel_result_stream(self):
+        """Stop polling for results and cancel the background search."""
+        if self._result_stream_after_id is not None:
+            self.treeview.after_cancel(self._result_stream_after_id)
+            self._result_stream_after_id = None
+
+        self.search_worker.cancel()
+
+    def describe(self, record_type, record):
+        """Return a one-line summary of a record."""
+        if record_type == "client":
+            return " · ".join(part for part in (record.name, record.city, record.country, record.phone_number)
+                              if part)
+        elif record_type == "airline":
+            return record.company_name
+
+        client = self.rec_man.find_record(record.client_id, "client")
+        airline = self.rec_man.find_record(record.airline_id, "airline")
+        return " · ".join([
+            client.name if client is not None else "",
+            airline.company_name if airline is not None else "",
+            f"{record.start_city} → {record.end_city}",
+            str(record.date),
+        ])
+
+    def open_selected(self, event=None):
+        """Open the selected record in its own view."""
+        row = self.treeview.focus()
+        if row in self.row_records:
+            self.open_record(*self.row_records[row])
@@ -0,0 +1,418 @@
+import tkinter as tk
+from tkinter import ttk
+from datetime import datetime
+
+from utils.text_matching import search_key
+
+# Rows materialised below the visible window, so it stays filled while the height settles
+BUFFER_ROWS = 5
+
+# Height of the treeview heading, subtracted when working out how many rows fit
+HEADING_HEIGHT = 25
+
+# Rows scrolled per mouse wheel notch
+WHEEL_ROWS = 3
+
+# Records added to the grid per step of a background load, a quarter of a view's page
+LOAD_BATCH_SIZE = 250
+
+# Marks appended to the heading of the sorted column
+SORT_ARROWS = {False: " ▲", True: " ▼"}
+
+
+def sort_key(value):
+    """
+    Return the key a column value is sorted by.
+
+    Numbers and dates sort by value, everything else by its accent- and
+    case-insensitive search key; numbers and dates come before text.
+    """
+    if isinstance(value, (int, float, datetime)):
+        return (0, value)
+    return (1, search_key(value if value is not None else ""))
+
+
+class VirtualGrid:
+    """
+    Shows a long list of records in a Treeview, keeping only the visible
+    rows (plus a small buffer) as Treeview items.
+
+    The grid owns the vertical scrollbar, which scrolls over the whole
+    record list; scrolling re-materialises the window of rows instead of
+    moving through items Tk already holds. Items are identified by the
+    record ID, so the Treeview's focus() and item() keep working on the
+    rows that are shown.
+
+    Showing a new window, whether after scrolling or for a new list of
+    records, only applies the difference to the items already shown: rows
+    that left are deleted, new rows inserted, kept rows moved into place
+    and their values updated only if they changed.
+
+    Clicking a column heading sorts the records by that column, clicking
+    it again reverses the order. Sort keys are computed once per record
+    and column and kept until the record changes, and sorting is stable,
+    so equal rows keep their previous order. When the records are one page
+    of a longer list, the on_sort callback can show the first page of the
+    whole list in the new order instead, sorting it off the Tk thread.
+    """
+
+    def __init__(self, treeview, row_values, buffer_rows=BUFFER_ROWS, on_sort=None):
+        """
+        Attach a virtual grid to a Treeview.
+
+        Args:
+            treeview: Treeview to display the records in (not yet packed)
+            row_values: Function returning the column values of a record
+            buffer_rows: Number of rows materialised below the visible window
+            on_sort: Function called with (column, reverse) when the sort order changes,
+                returning True if it showed the records again in the new order
+        """
+        self.treeview = treeview
+        self.row_values = row_values
+        self.buffer_rows = buffer_rows
+        self.on_sort = on_sort
+
+        self.records = []
+        self.top = 0
+
+        # Position of every record in the list, by item ID
+        self._positions = {}
+
+        # Values of the rows materialised as items, by item ID
+        self._shown = {}
+
+        # Selected record ID, kept while its row is scrolled out of the window
+        self._selected_id = None
+
+        # Pending step of a background load
+        self._load_after_id = None
+
+        # True once a load was abandoned before all its records were added
+        self.load_incomplete = False
+
+        # Sorted column and direction, None while the records keep their given order
+        self.sort_column = None
+        self.sort_reverse = False
+
+        # Sort keys by column, then item ID, with the record they were computed for
+        self._sort_keys = {}
+
+        # Key functions by column, kept so callers caching by key function see the same one
+        self._key_functions = {}
+
+        self._headings = {}
+        for column in self.treeview["columns"]:
+            self._headings[column] = self.treeview.heading(column, "text")
+            self.treeview.heading(column, command=lambda c=column: self.toggle_sort(c))
+
+        self.scrollbar = ttk.Scrollbar(treeview.master, orient=tk.VERTICAL, command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.treeview.bind("<Configure>", lambda e: self.render(), add="+")
+        self.treeview.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.treeview.bind("<Button-4>", lambda e: self.scroll(-WHEEL_ROWS))
+        self.treeview.bind("<Button-5>", lambda e: self.scroll(WHEEL_ROWS))
+        self.treeview.bind("<Up>", lambda e: self.move_focus(-1))
+        self.treeview.bind("<Down>", lambda e: self.move_focus(1))
+        self.treeview.bind("<Prior>", lambda e: self.move_focus(-self.page_size()))
+        self.treeview.bind("<Next>", lambda e: self.move_focus(self.page_size()))
+        self.treeview.bind("<Home>", lambda e: self.move_focus(-len(self.records)))
+        self.treeview.bind("<End>", lambda e: self.move_focus(len(self.records)))
+
+    def set_records(self, records):
+        """Show a new list of records, scrolled to the top."""
+        self.cancel_load()
+        self.load_incomplete = False
+        self.records = list(records)
+        self._apply_sort()
+        self.top = 0
+        self.render()
+
+    def load(self, records, progress=None, batch_size=LOAD_BATCH_SIZE):
+        """
+        Show a new list of records, adding them in batches scheduled with after().
+
+        The first rows appear straight away and the window stays responsive
+        while the rest are added. Loading stops if the treeview is destroyed
+        or another list of records is shown.
+
+        Args:
+            records: Records to show
+            progress: Function called with (loaded, total) after every batch
+            batch_size: Number of records added per batch
+        """
+        records = tuple(records)
+        self.set_records(records[:batch_size])
+        if progress is not None:
+            progress(len(self.records), len(records))
+
+        if len(records) > batch_size:
+            self._load_after_id = self.treeview.after(1, self._load_batch, records, batch_size,
+                                                      batch_size, progress)
+
+    def _load_batch(self, records, start, batch_size, progress):
+        """Add the next batch of a background load and schedule the one after it."""
+        self._load_after_id = None
+
+        # Safety check for destroyed widgets
+        try:
+            if not self.treeview.winfo_exists():
+                return
+        except tk.TclError:
+            return  # Widget may have been destroyed
+
+        end = min(start + batch_size, len(records))
+        self.extend(records[start:end])
+        if progress is not None:
+            progress(end, len(records))
+
+        if end < len(records):
+            self._load_after_id = self.treeview.after(1, self._load_batch, records, end, batch_size, progress)
+
+    def cancel_load(self):
+        """Stop a background load, keeping the records added so far and marking the load incomplete."""
+        if self._load_after_id is not None:
+            self.treeview.after_cancel(self._load_after_id)
+            self._load_after_id = None
+            self.load_incomplete = True
+
+    @property
+    def loading(self):
+        """True while a background load is adding records."""
+        return self._load_after_id is not None
+
+    def extend(self, records):
+        """Add records to the end of the list, or in sort order while the list is sorted."""
+        if self.sort_column is not None:
+            self.records.extend(records)
+            self._apply_sort()
+        else:
+            for record in records:
+                self._positions[str(record.id)] = len(self.records)
+                self.records.append(record)
+        self.render()
+
+    def append(self, record):
+        """Add a record to the end of the list, or in sort order while the list is sorted."""
+        self.extend([record])
+
+    def update_record(self, record):
+        """Show the current values of an edited record."""
+        # Forget the keys even if the record is not listed, they may order other pages
+        self.forget_sort_keys(record.id)
+        position = self._positions.get(str(record.id))
+        if position is None:
+            return
+
+        # The row stays where it is, so edited records do not jump away while sorted
+        self.records[position] = record
+        if str(record.id) in self._shown:
+            values = self.row_values(record)
+            if values != self._shown[str(record.id)]:
+                self.treeview.item(str(record.id), values=values)
+                self._shown[str(record.id)] = values
+
+    def remove(self, record_id):
+        """Remove a record from the list."""
+        position = self._positions.pop(str(record_id), None)
+        if position is None:
+            return
+
+        del self.records[position]
+        for record in self.records[position:]:
+            self._positions[str(record.id)] -= 1
+
+        self.forget_sort_keys(record_id)
+        if self._shown.pop(str(record_id), None) is not None:
+            self.treeview.delete(str(record_id))
+        if self._selected_id == str(record_id):
+            self._selected_id = None
+        self.render()
+
+    def forget_sort_keys(self, record_id):
+        """Drop the cached sort keys of a record whose shown values changed."""
+        for keys in self._sort_keys.values():
+            keys.pop(str(record_id), None)
+
+    def clear_sort_keys(self):
+        """Drop every cached sort key."""
+        self._sort_keys.clear()
+
+    def toggle_sort(self, column):
+        """Sort by a column, reversing the order if the records are already sorted by it."""
+        self.sort_by(column, not self.sort_reverse if column == self.sort_column else False)
+
+    def sort_by(self, column, reverse=False):
+        """
+        Sort the records by a column, keeping the selected record in view.
+
+        Args:
+            column: Treeview column to sort by
+            reverse: True to sort in descending order
+        """
+        if self.sort_column is not None:
+            self.treeview.heading(self.sort_column, text=self._headings[self.sort_column])
+        self.treeview.heading(column, text=self._headings[column] + SORT_ARROWS[reverse])
+
+        self.sort_column = column
+        self.sort_reverse = reverse
+        if self.on_sort is not None and self.on_sort(column, reverse):
+            return
+        self._apply_sort()
+
+        position = self._positions.get(self.selected_id)
+        if position is not None:
+            self.see(position)
+        else:
+            self.top = 0
+            self.render()
+
+    def column_sort_key(self, column):
+        """
+        Return the function computing the sort key of a record for a column.
+
+        Keys are cached like those of the grid's own sorting, and the same
+        function is returned for a column every time.
+
+        Args:
+            column: Treeview column to sort by, None for no sorting
+
+        Returns:
+            Key function taking a record, None if column is None
+        """
+        if column is None:
+            return None
+
+        function = self._key_functions.get(column)
+        if function is None:
+            index = self.treeview["columns"].index(column)
+
+            def function(record):
+                keys = self._sort_keys.setdefault(column, {})
+                item = str(record.id)
+                entry = keys.get(item)
+                if entry is None or entry[0] is not record:
+                    entry = keys[item] = (record, sort_key(self.row_values(record)[index]))
+                return entry[1]
+
+            self._key_functions[column] = function
+
+        return function
+
+    def _apply_sort(self):
+        """Stable-sort the records by the sorted column and index their positions."""
+        if self.sort_column is not None:
+            self.records.sort(key=self.column_sort_key(self.sort_column), reverse=self.sort_reverse)
+
+        self._positions = {str(record.id): i for i, record in enumerate(self.records)}
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def selected_id(self):
+        """ID of the selected record as a string, None if nothing is selected."""
+        return self.treeview.focus() or self._selected_id
+
+    def selected_record(self):
+        """Return the selected record, None if nothing is selected."""
+        position = self._positions.get(self.selected_id)
+        return self.records[position] if position is not None else None
+
+    def select(self, record_id):
+        """Select a record, scrolling its row into view."""
+        position = self._positions.get(str(record_id))
+        if position is None:
+            return
+
+        self.see(position)
+        self._selected_id = str(record_id)
+        self.treeview.selection_set(str(record_id))
+        self.treeview.focus(str(record_id))
+
+    def see(self, position):
+        """Scroll the least needed to show the record at a position."""
+        if position < self.top:
+            self.top = position
+        elif position >= self.top + self.page_size():
+            self.top = position - self.page_size() + 1
+        self.render()
+
+    def page_size(self):
+        """Return the number of rows that fit in the treeview."""
+        height = self.treeview.winfo_height()
+        if height <= 1:
+            # Not laid out yet, use the requested number of rows
+            return int(self.treeview.cget("height"))
+
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        return max(1, (height - HEADING_HEIGHT) // row_height)
+
+    def render(self):
+        """Materialise the rows of the current window and update the scrollbar."""
+        focused = self.treeview.focus()
+        if focused:
+            self._selected_id = focused
+
+        page = self.page_size()
+        self.top = max(0, min(self.top, len(self.records) - page))
+        window = self.records[self.top:self.top + page + self.buffer_rows]
+
+        # Delete the rows that left the window
+        wanted = {str(record.id) for record in window}
+        stale = [item for item in self._shown if item not in wanted]
+        if stale:
+            self.treeview.delete(*stale)
+            for item in stale:
+                del self._shown[item]
+
+        # Insert the new rows, and move and update the kept ones only where needed
+        for position, record in enumerate(window):
+            item = str(record.id)
+            values = self.row_values(record)
+            if item not in self._shown:
+                self.treeview.insert("", position, iid=item, values=values)
+            else:
+                if self.treeview.index(item) != position:
+                    self.treeview.move(item, "", position)
+                if values != self._shown[item]:
+                    self.treeview.item(item, values=values)
+            self._shown[item] = values
+
+        if self._selected_id in self._shown and self.treeview.selection() != (self._selected_id,):
+            self.treeview.selection_set(self._selected_id)
+            self.treeview.focus(self._selected_id)
+
+        if self.records:
+            self.scrollbar.set(self.top / len(self.records), min(1.0, (self.top + page) / len(self.records)))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll(self, rows):
+        """Scroll the window by a number of rows."""
+        self.top += rows
+        self.render()
+
+    def yview(self, *args):
+        """Scrollbar command: move to a fraction of the list or scroll by units or pages."""
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * len(self.records))
+            self.render()
+        elif args[0] == "scroll":
+            step = self.page_size() if args[2] == "pages" else 1
+            self.scroll(int(args[1]) * step)
+
+    def on_mouse_wheel(self, event):
+        """Scroll the window with the mouse wheel."""
+        self.scroll(-WHEEL_ROWS if event.delta > 0 else WHEEL_ROWS)
+        return "break"
+
+    def move_focus(self, rows):
+        """Move the selection by a number of rows, scrolling the window to follow it."""
+        if not self.records:
+            return "break"
+
+        position = self._positions.get(self.selected_id)
+        position = 0 if position is None else max(0, min(position + rows, len(self.records) - 1))
+        self.select(self.records[position].id)
+        return "break"
@@ -0,0 +1,104 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
+
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+from controllers.parallel_search import ParallelFlightSearch, FlightColumns
+from controllers.search_controller import SearchController
+from models.record_manager import RecordManager
+
+class DummyRecord:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+class TestParallelFlightSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = RecordManager(filename="test_data.json")
+        self.manager.clients = [
+            DummyRecord(id=1, type="client", name="John Smith"),
+            DummyRecord(id=2, type="client", name="Alice"),
+        ]
+        self.manager.airlines = [DummyRecord(id=5, type="airline", company_name="SkyHigh Airways")]
+        self.manager.flights = [
+            DummyRecord(id=i, type="flight", client_id=1 + i % 2, airline_id=5,
+                        start_city="London" if i % 3 else "Oslo", end_city="Paris",
+                        date=datetime(2025, 6, 1 + i % 28, 9, 30))
+            for i in range(100, 200)
+        ]
+        self.parallel = ParallelFlightSearch(threshold=10, chunk_size=7, max_workers=2)
+
+    def tearDown(self):
+        self.parallel.close()
+
+    def search(self, query):
+        return list(self.parallel.iter_search(SearchController(self.manager), query))
+
+    def test_matches_serial_search(self):
+        serial = SearchController(self.manager)
+        for query in ["smith", "oslo", "client:alice", "date>=2025-06-20 from:london",
+                      "2025-06-05", "airline:5 id:150..170", "14", "nowhere"]:
+            self.assertEqual(self.search(query), serial.search_flights(query), query)
+
+    def test_date_bounds_match_serial_search(self):
+        # Both paths must agree on microseconds and on the midnight boundary
+        for i, flight in enumerate(self.manager.flights[:10]):
+            flight.date = datetime(2025, 6, 20, 0, 0, 0, 500 * i)
+        self.manager.flights[10].date = datetime(2025, 6, 19, 23, 59, 59, 999999)
+        serial = SearchController(self.manager)
+        for query in ["date<2025-06-20", "date>=2025-06-20", "date:2025-06-20", "date<=2025-06-19",
+                      "date>2025-06-19t23:59"]:
+            self.assertEqual(self.search(query), serial.search_flights(query), query)
+
+    def test_query_is_planned_once(self):
+        controller = SearchController(self.manager)
+        with patch.object(controller, "plan_search", wraps=controller.plan_search) as plan_search:
+            results = list(self.parallel.iter_search(controller, "id:150..155"))
+        self.assertEqual(len(results), 6)
+        self.assertEqual(plan_search.call_count, 1)
+
+    def test_results_keep_storage_order(self):
+        ids = [f.id for f in self.search("paris")]
+        self.assertEqual(ids, list(range(100, 200)))
+
+    def test_small_candidate_sets_run_serially(self):
+        controller = SearchController(self.manager)
+        results = list(self.parallel.iter_search(controller, "id:150..155"))
+        self.assertEqual([f.id for f in results], [150, 151, 152, 153, 154, 155])
+        self.assertIsNone(self.parallel._columns)
+
+    def test_completed_search_is_remembered(self):
+        controller = SearchController(self.manager)
+        results = list(self.parallel.iter_search(controller, "smith"))
+        self.assertEqual(controller.search_flights("smith"), results)
+
+    def test_warm_queries_skip_the_pool(self):
+        controller = SearchController(self.manager)
+        results = list(self.parallel.iter_search(controller, "smith"))
+        with patch("controllers.parallel_search.get_executor") as get_executor:
+            self.assertEqual(list(self.parallel.iter_search(controller, "smith")), results)
+            refined = list(self.parallel.iter_search(controller, "smith oslo"))
+            get_executor.assert_not_called()
+        self.assertEqual(refined, controller.search_flights("smith oslo"))
+
+    def test_columns_follow_data_version(self):
+        self.search("smith")
+        columns = self.parallel._columns
+        self.manager.add_record(DummyRecord(id=200, type="flight", client_id=1, airline_id=5,
+                                            start_city="Rome", end_city="Paris",
+                                            date=datetime(2025, 7, 1)))
+        self.assertEqual([f.id for f in self.search("rome")], [200])
+        self.assertIsNot(self.parallel._columns, columns)
+
+    def test_partitions(self):
+        columns = FlightColumns(self.manager)
+        partitions = columns.partitions(40)
+        self.assertEqual([first for _, _, first in partitions], [0, 40, 80])
+        self.assertEqual(partitions[-1][1], columns.offsets[-1])
+        columns.close()
+
+if __name__ == '__main__':
+    unittest.main()
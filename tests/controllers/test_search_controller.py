@@ -4,9 +4,10 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import patch
 from datetime import datetime
 from controllers.search_controller import SearchController
+from models.record_manager import RecordManager
 
 class DummyRecord:
     def __init__(self, **kwargs):
@@ -15,20 +16,19 @@ class DummyRecord:
 class TestSearchController(unittest.TestCase):
 
     def setUp(self):
-        # Setup dummy data
-        self.dummy_clients = [
-            DummyRecord(id=1, name="Kevin", country="UK", phone_number="12345"),
-            DummyRecord(id=2, name="Alice", country="USA", phone_number="67890"),
+        self.manager = RecordManager(filename="test_data.json")
+        self.manager.clients = [
+            DummyRecord(id=1, type="client", name="Kevin", country="UK", phone_number="12345"),
+            DummyRecord(id=2, type="client", name="Alice", country="USA", phone_number="67890"),
         ]
-
-        self.dummy_airlines = [
-            DummyRecord(id=10, company_name="SkyHigh Airways"),
-            DummyRecord(id=11, company_name="TestFlights Ltd"),
+        self.manager.airlines = [
+            DummyRecord(id=10, type="airline", company_name="SkyHigh Airways"),
+            DummyRecord(id=11, type="airline", company_name="TestFlights Ltd"),
         ]
-
-        self.dummy_flights = [
+        self.manager.flights = [
             DummyRecord(
                 id=100,
+                type="flight",
                 client_id=1,
                 airline_id=10,
                 start_city="London",
@@ -37,6 +37,7 @@ class TestSearchController(unittest.TestCase):
             ),
             DummyRecord(
                 id=101,
+                type="flight",
                 client_id=2,
                 airline_id=11,
                 start_city="New York",
@@ -45,22 +46,7 @@ class TestSearchController(unittest.TestCase):
             )
         ]
 
-        # Mock record manager
-        self.mock_record_manager = MagicMock()
-        self.mock_record_manager.get_records_by_type.side_effect = lambda record_type: {
-            "client": self.dummy_clients,
-            "airline": self.dummy_airlines,
-            "flight": self.dummy_flights
-        }[record_type]
-
-        self.mock_record_manager.get_record_by_id.side_effect = lambda record_id, record_type: {
-            (1, "client"): self.dummy_clients[0],
-            (2, "client"): self.dummy_clients[1],
-            (10, "airline"): self.dummy_airlines[0],
-            (11, "airline"): self.dummy_airlines[1]
-        }[(record_id, record_type)]
-
-        self.controller = SearchController(record_manager=self.mock_record_manager)
+        self.controller = SearchController(record_manager=self.manager)
 
     def test_parse_search_query(self):
         query = "Kevin, UK"
@@ -102,5 +88,220 @@ class TestSearchController(unittest.TestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0].id, 100)
 
+    def test_search_results_are_cached(self):
+        first = self.controller.search_clients("Kevin")
+        with patch.object(SearchController, "run_search") as run_search:
+            second = SearchController(record_manager=self.manager).search_clients("kevin")
+        run_search.assert_not_called()
+        self.assertEqual(first, second)
+
+    def test_cache_invalidated_by_version(self):
+        self.controller.search_clients("Kevin")
+        self.manager.add_record(DummyRecord(id=3, type="client", name="Kevin B", country="UK", phone_number="555"))
+        results = self.controller.search_clients("Kevin")
+        self.assertEqual(len(results), 2)
+        self.assertEqual(len(self.controller.cache), 1)
+
+    def test_normalise_terms(self):
+        self.assertEqual(self.controller.normalise_terms(["UK", "kevin", "uk"]), ("kevin", "uk"))
+
+    def test_refines(self):
+        self.assertTrue(self.controller.refines("client", ("kev",), ("kevi",)))
+        self.assertTrue(self.controller.refines("client", ("kev",), ("kev", "uk")))
+        self.assertFalse(self.controller.refines("client", ("kevin",), ("kev",)))
+        self.assertTrue(self.controller.refines("flight", ("from:lon",), ("from:london",)))
+        self.assertFalse(self.controller.refines("flight", ("id:1",), ("id:12",)))
+
+    def test_search_incremental_filters_previous_results(self):
+        self.controller.search_incremental("client", "K")
+        with patch.object(self.manager, "get_records_by_type") as get_records_by_type:
+            results = self.controller.search_incremental("client", "Kev")
+        self.assertEqual([c.id for c in results], [1])
+        get_records_by_type.assert_not_called()
+
+    def test_search_incremental_broadened_query(self):
+        self.controller.search_incremental("client", "Kevin")
+        results = self.controller.search_incremental("client", "i")
+        self.assertEqual(len(results), 2)
+
+    def test_parse_search_query_qualifiers(self):
+        terms = self.controller.parse_search_query('client: smith from:"New York" id:120..180')
+        self.assertEqual(terms, ["client:smith", "from:New York", "id:120..180"])
+
+    def test_parse_search_query_unknown_qualifiers(self):
+        self.assertEqual(self.controller.parse_search_query("note: london"), ["note:", "london"])
+        self.assertEqual(self.controller.parse_search_query("to: paris", "client"), ["to:", "paris"])
+        self.assertEqual(self.controller.parse_search_query("to: paris", "flight"), ["to:paris"])
+
+    def test_parse_predicates(self):
+        predicates = self.controller.parse_predicates("flight", ("id:120..180", "to:paris", "14:00"))
+        self.assertEqual((predicates[0].field, predicates[0].low, predicates[0].high), ("id", 120, 180))
+        self.assertEqual((predicates[1].field, predicates[1].value), ("to", "paris"))
+        self.assertIsNone(predicates[2].field)
+
+    def test_search_flights_by_qualifiers(self):
+        results = self.controller.search_flights("from:london to:barcelona")
+        self.assertEqual([f.id for f in results], [100])
+        results = self.controller.search_flights("to:london")
+        self.assertEqual(results, [])
+
+class TestSearchPlanner(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = RecordManager(filename="test_data.json")
+        self.manager.clients = [
+            DummyRecord(id=1, type="client", name="John Smith", country="UK", phone_number="12345"),
+            DummyRecord(id=2, type="client", name="Alice", country="USA", phone_number="67890"),
+        ]
+        self.manager.airlines = [DummyRecord(id=5, type="airline", company_name="SkyHigh Airways")]
+        self.manager.flights = [
+            DummyRecord(id=i, type="flight", client_id=1 + i % 2, airline_id=5,
+                        start_city="London", end_city="Paris",
+                        date=datetime(2025, 6, 1 + i % 28, 9, 30))
+            for i in range(100, 200)
+        ]
+        self.controller = SearchController(record_manager=self.manager)
+
+    def test_id_range(self):
+        results = self.controller.search_flights("id:120..129")
+        self.assertEqual([f.id for f in results], list(range(120, 130)))
+
+    def test_client_name_qualifier(self):
+        results = self.controller.search_flights("client:smith id:120..129")
+        self.assertEqual([f.id for f in results], [120, 122, 124, 126, 128])
+
+    def test_airline_id_qualifier(self):
+        results = self.controller.search_flights("airline:5 to:paris")
+        self.assertEqual(len(results), 100)
+        self.assertEqual(self.controller.search_flights("airline:6"), [])
+
+    def test_plan_uses_most_selective_index(self):
+        predicates = self.controller.parse_predicates("flight", ("client:smith", "id:150", "london"))
+        candidates, remaining = self.controller.plan_search("flight", predicates)
+        self.assertEqual([f.id for f in candidates], [150])
+        self.assertEqual([p.term for p in remaining], ["client:smith", "london"])
+
+    def test_flight_names_use_id_index(self):
+        with patch.object(self.manager, "get_record_by_id", side_effect=AssertionError("linear scan")):
+            self.assertEqual(len(self.controller.search_flights("smith")), 50)
+            self.assertEqual(len(self.controller.search_all("skyhigh")["flight"]), 20)
+        self.manager.flights[0].client_id = 99
+        self.assertEqual(self.controller.client_name(self.manager.flights[0]), "")
+
+    def test_date_qualifier_uses_period(self):
+        results = self.controller.search_flights("date:2025-06-05")
+        self.assertEqual([f.id for f in results], [116, 144, 172])
+
+    def test_date_comparisons(self):
+        results = self.controller.search_flights("date>=2025-06-27 date<2025-06-28")
+        self.assertEqual([f.id for f in results], [110, 138, 166, 194])
+        results = self.controller.search_flights("date>2025-06-27 id<=130")
+        self.assertEqual([f.id for f in results], [111])
+
+    def test_date_range_refines(self):
+        self.assertTrue(self.controller.refines("flight", ("date>=2025-06",), ("date:2025-06-05",)))
+        self.assertFalse(self.controller.refines("flight", ("date:2025-06-05",), ("date>=2025-06",)))
+
+    def test_fuzzy_search(self):
+        results = self.controller.search("client", "smyth", mode="fuzzy")
+        self.assertEqual([c.id for c in results], [1])
+        self.assertEqual(self.controller.search_fuzzy("airline", "skyhi airways"), self.manager.airlines)
+        self.assertEqual(self.controller.search_fuzzy("client", "smyth", max_distance=0), [])
+
+    def test_fuzzy_search_follows_edits(self):
+        self.manager.add_record(DummyRecord(id=3, type="client", name="Jane Smithe"))
+        results = self.controller.search_incremental("client", "~smith")
+        self.assertEqual([c.id for c in results], [1, 3])
+
+    def test_phonetic_search(self):
+        self.assertEqual([c.id for c in self.controller.search("client", "Smyth", mode="phonetic")], [1])
+        self.assertEqual(self.controller.search_phonetic("client", "jon schmidt"), [self.manager.clients[0]])
+        self.assertEqual(self.controller.search_phonetic("client", "alice smith"), [])
+
+    def test_phonetic_search_follows_edits(self):
+        client = self.manager.clients[1]
+        self.assertEqual(self.controller.search_incremental("client", "%smyth"), [self.manager.clients[0]])
+        client.name = "Alice Smythe"
+        self.manager.update_record(client)
+        self.assertEqual([c.id for c in self.controller.search_incremental("client", "%smith")], [1, 2])
+
+    def test_phone_qualifier_ignores_formatting(self):
+        self.manager.clients[1].phone_number = "+44 (20) 7946-0958"
+        self.manager.update_record(self.manager.clients[1])
+        self.assertEqual(self.controller.search_clients('phone:"7946 0958"'), [self.manager.clients[1]])
+        self.assertEqual(self.controller.search_clients("phone:20"), [])
+        self.assertEqual(self.controller.search_clients("(20)7946"), [self.manager.clients[1]])
+
+    def test_phone_refines_by_ending(self):
+        self.assertTrue(self.controller.refines("client", ("phone:0958",), ("phone:60958",)))
+        self.assertFalse(self.controller.refines("client", ("phone:0958",), ("phone:09581",)))
+
+    def test_ranked_search_prefers_better_matches(self):
+        self.manager.add_record(DummyRecord(id=3, type="client", name="Al", country="UK", phone_number="1"))
+        self.manager.add_record(DummyRecord(id=4, type="client", name="Sam", country="Algeria", phone_number="2"))
+        results = self.controller.search_ranked("client", "al")
+        self.assertEqual([c.id for c in results], [3, 2, 4])
+
+    def test_ranked_search_limit(self):
+        results = self.controller.search_ranked("flight", "smith", limit=3)
+        self.assertEqual([f.id for f in results], [100, 102, 104])
+        results = self.controller.search_ranked("flight", "date:2025-06-05 paris", limit=2)
+        self.assertEqual([f.id for f in results], [116, 144])
+
+    def test_match_quality(self):
+        self.assertEqual(SearchController.match_quality("john smith", "john smith"), 3)
+        self.assertEqual(SearchController.match_quality("john smith", "smi"), 2)
+        self.assertEqual(SearchController.match_quality("john smith", "mit"), 1)
+        self.assertEqual(SearchController.match_quality("john smith", "x"), 0)
+
+    def test_iter_search_yields_progressively(self):
+        stream = self.controller.iter_search_incremental("flight", "client:smith")
+        self.assertEqual([next(stream).id, next(stream).id], [100, 102])
+        stream.close()
+        self.assertIsNone(self.controller._last_search)
+        self.assertEqual(len(self.controller.cache), 0)
+
+    def test_iter_search_completed_is_remembered(self):
+        results = list(self.controller.iter_search_incremental("flight", "client:smith"))
+        self.assertEqual(len(results), 50)
+        self.assertEqual(self.controller._last_search[3], results)
+        self.assertEqual(self.controller.search_flights("client:smith"), results)
+
+    def test_search_all_groups_results(self):
+        results = self.controller.search_all("smith", limit=3)
+        self.assertEqual(set(results), {"client", "airline", "flight"})
+        self.assertEqual([c.id for c in results["client"]], [1])
+        self.assertEqual(results["airline"], [])
+        self.assertEqual([f.id for f in results["flight"]], [100, 102, 104])
+
+    def test_search_all_modes_and_empty_query(self):
+        results = self.controller.search_all("%smyth")
+        self.assertEqual([c.id for c in results["client"]], [1])
+        self.assertEqual(results["flight"], [])
+        self.assertEqual(self.controller.search_all("  "), {"client": [], "airline": [], "flight": []})
+
+    def test_search_ignores_accents(self):
+        self.manager.add_record(DummyRecord(id=3, type="client", name="José Müller", country="España",
+                                            phone_number="3"))
+        self.assertEqual([c.id for c in self.controller.search_clients("jose mULLER")], [3])
+        self.assertEqual([c.id for c in self.controller.search_clients("name:Jösé country:espana")], [3])
+        self.assertEqual([c.id for c in self.controller.search_ranked("client", "muller")], [3])
+
+    def test_search_keys_follow_edits(self):
+        flight = self.manager.flights[0]
+        self.assertEqual(self.controller.search_flights("to:zurich"), [])
+        flight.end_city = "Zürich"
+        self.manager.update_record(flight)
+        self.assertEqual(self.controller.search_flights("to:zurich"), [flight])
+        self.assertEqual(self.controller.search_flights("ZÜRICH id:100"), [flight])
+
+    def test_unknown_search_mode(self):
+        with self.assertRaises(ValueError):
+            self.controller.search("client", "smith", mode="sounds")
+        with self.assertRaises(ValueError):
+            self.controller.search_fuzzy("flight", "london")
+        with self.assertRaises(ValueError):
+            self.controller.search_phonetic("airline", "skyhigh")
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,98 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
+
+import unittest
+from datetime import datetime
+from controllers.search_worker import SearchWorker
+from models.record_manager import RecordManager
+
+class DummyRecord:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+class TestSearchWorker(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = RecordManager(filename="test_data.json")
+        self.manager.clients = [DummyRecord(id=1, type="client", name="John Smith", country="UK", phone_number="1")]
+        self.manager.airlines = [DummyRecord(id=5, type="airline", company_name="SkyHigh Airways")]
+        self.manager.flights = [
+            DummyRecord(id=i, type="flight", client_id=1, airline_id=5,
+                        start_city="London", end_city="Paris" if i % 2 else "Rome",
+                        date=datetime(2025, 6, 1, 9, 30))
+            for i in range(250)
+        ]
+        self.worker = SearchWorker(self.manager, batch_size=50)
+
+    def collect(self):
+        self.worker._thread.join()
+        return self.worker.poll()
+
+    def test_results_arrive_in_batches(self):
+        self.worker.submit("flight", "paris")
+        batches = self.collect()
+        self.assertEqual([len(records) for records, _ in batches], [50, 50, 25])
+        self.assertEqual([done for _, done in batches], [False, False, True])
+        self.assertEqual(batches[0][0][0].id, 1)
+
+    def test_superseded_query_is_discarded(self):
+        self.worker.submit("flight", "paris")
+        self.worker.submit("flight", "rome")
+        batches = self.collect()
+        flights = [f for records, _ in batches for f in records]
+        self.assertEqual(len(flights), 125)
+        self.assertTrue(all(f.end_city == "Rome" for f in flights))
+
+    def test_search_all_arrives_per_type(self):
+        self.worker.submit_all("london", limit=10)
+        batches = self.collect()
+        groups = [group for records, _ in batches for group in records]
+        self.assertEqual([record_type for record_type, _ in groups], ["client", "airline", "flight"])
+        self.assertEqual([len(records) for _, records in groups], [0, 0, 10])
+        self.assertTrue(batches[-1][1])
+
+    def test_ranked_search_arrives_in_one_batch(self):
+        self.worker.submit_ranked("flight", "paris", 10)
+        batches = self.collect()
+        (best, total), = [result for results, _ in batches for result in results]
+        self.assertEqual((len(best), total), (10, 125))
+        self.assertTrue(batches[-1][1])
+
+    def test_sorted_pages_are_read_in_the_background(self):
+        built = []
+        def sort_key_for(snapshot):
+            built.append(snapshot)
+            return lambda flight: -flight.id
+
+        self.worker.submit_page("flight", 0, 100, "id", sort_key_for, reverse=True)
+        (offset, records, total), = [page for pages, _ in self.collect() for page in pages]
+        self.assertEqual((offset, records[0].id, total), (0, 0, 250))
+
+        # Further pages reuse the key, and an offset past the end reads the last page
+        self.worker.submit_page("flight", 300, 100, "id", sort_key_for, reverse=True)
+        (offset, records, total), = [page for pages, _ in self.collect() for page in pages]
+        self.assertEqual((offset, [f.id for f in records][:2], len(records)), (200, [200, 201], 50))
+        self.assertEqual(built, [self.manager.snapshot()])
+
+    def test_cancel(self):
+        self.worker.submit("flight", "paris")
+        self.worker.cancel()
+        self.assertEqual(self.collect(), [])
+
+    def test_errors_are_raised_on_poll(self):
+        self.worker.submit("hotel", "paris")
+        with self.assertRaises(ValueError):
+            self.collect()
+
+    def test_searches_a_snapshot(self):
+        self.worker.submit("flight", "london")
+        self.manager.flights.append(DummyRecord(id=999, type="flight", client_id=1, airline_id=5,
+                                                start_city="London", end_city="Oslo",
+                                                date=datetime(2025, 6, 2)))
+        flights = [f for records, _ in self.collect() for f in records]
+        self.assertEqual(len(flights), 250)
+
+if __name__ == '__main__':
+    unittest.main()
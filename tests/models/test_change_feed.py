@@ -0,0 +1,48 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+
+import unittest
+from models.change_feed import ChangeFeed, ChangeEvent, CREATED, UPDATED, DELETED
+
+class TestChangeFeed(unittest.TestCase):
+
+    def setUp(self):
+        self.feed = ChangeFeed()
+        self.batches = []
+        self.feed.subscribe(self.batches.append)
+
+    def test_events_outside_transaction_are_delivered_at_once(self):
+        self.feed.publish(ChangeEvent(CREATED, "client", 1))
+        self.feed.publish(ChangeEvent(DELETED, "client", 1))
+        self.assertEqual([[e.action for e in batch] for batch in self.batches], [[CREATED], [DELETED]])
+
+    def test_transaction_delivers_one_batch(self):
+        with self.feed:
+            self.feed.publish(ChangeEvent(CREATED, "client", 1))
+            with self.feed:
+                self.feed.publish(ChangeEvent(UPDATED, "client", 1))
+            self.assertEqual(self.batches, [])
+        self.assertEqual(len(self.batches), 1)
+        self.assertEqual([(e.action, e.record_id) for e in self.batches[0]], [(CREATED, 1), (UPDATED, 1)])
+
+    def test_transaction_delivers_changes_made_before_an_error(self):
+        with self.assertRaises(ValueError):
+            with self.feed:
+                self.feed.publish(ChangeEvent(CREATED, "airline", 2))
+                raise ValueError("failed")
+        self.assertEqual(len(self.batches), 1)
+
+    def test_empty_transaction_delivers_nothing(self):
+        with self.feed:
+            pass
+        self.assertEqual(self.batches, [])
+
+    def test_unsubscribe(self):
+        self.feed.unsubscribe(self.batches.append)
+        self.feed.publish(ChangeEvent(CREATED, "flight", 3))
+        self.assertEqual(self.batches, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
+
+import unittest
+from datetime import datetime
+from models.indexes import PrimaryIndex, HashIndex, SearchKeyIndex, SortedIndex, PrefixIndex, BKTree
+from utils.text_matching import name_keys, search_key
+
+class DummyFlight:
+    def __init__(self, id, client_id):
+        self.id = id
+        self.client_id = client_id
+
+class TestPrimaryIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = PrimaryIndex()
+        for flight in [DummyFlight(3, 1), DummyFlight(1, 2), DummyFlight(2, 1)]:
+            self.index.add(flight)
+
+    def test_get(self):
+        self.assertEqual(self.index.get(1).client_id, 2)
+        self.assertIsNone(self.index.get(9))
+
+    def test_in_order_keeps_storage_order(self):
+        records = self.index.in_order({1, 2, 3, 9})
+        self.assertEqual([r.id for r in records], [3, 1, 2])
+
+    def test_position(self):
+        records = [DummyFlight(3, 1), DummyFlight(1, 2), DummyFlight(2, 1)]
+        self.assertEqual([self.index.position(records, i) for i in (3, 1, 2, 9)], [0, 1, 2, None])
+        self.index.discard(1)
+        self.assertEqual(self.index.position([records[0], records[2]], 2), 1)
+
+    def test_discard(self):
+        self.index.discard(3)
+        self.assertIsNone(self.index.get(3))
+        self.assertEqual(len(self.index), 2)
+
+class TestHashIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = HashIndex(lambda r: [r.client_id])
+        self.flights = [DummyFlight(1, 1), DummyFlight(2, 1), DummyFlight(3, 2)]
+        for flight in self.flights:
+            self.index.add(flight)
+
+    def test_get(self):
+        self.assertEqual(self.index.get(1), {1, 2})
+        self.assertEqual(self.index.count(2), 1)
+        self.assertEqual(self.index.get(5), set())
+
+    def test_update_after_edit_in_place(self):
+        self.flights[0].client_id = 2
+        self.index.update(self.flights[0])
+        self.assertEqual(self.index.get(1), {2})
+        self.assertEqual(self.index.get(2), {1, 3})
+
+    def test_discard_removes_empty_keys(self):
+        self.index.discard(3)
+        self.assertNotIn(2, self.index.keys())
+
+class TestSortedIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = SortedIndex(lambda r: r.date)
+        self.flights = [DummyFlight(i, 1) for i in range(1, 5)]
+        for day, flight in zip([20, 5, 12, 5], self.flights):
+            flight.date = datetime(2025, 6, day)
+        self.index.add_all(self.flights)
+
+    def test_range(self):
+        self.assertEqual(self.index.range(datetime(2025, 6, 5), datetime(2025, 6, 20)), [2, 4, 3])
+        self.assertEqual(self.index.range(datetime(2025, 6, 13)), [1])
+        self.assertEqual(self.index.range(None, datetime(2025, 6, 1)), [])
+
+    def test_range_limit(self):
+        self.assertEqual(self.index.range(datetime(2025, 6, 6), limit=1), [3])
+        self.assertEqual(self.index.range(limit=0), [])
+
+    def test_count(self):
+        self.assertEqual(self.index.count(datetime(2025, 6, 5), datetime(2025, 6, 6)), 2)
+        self.assertEqual(len(self.index), 4)
+
+    def test_add_and_update(self):
+        new_flight = DummyFlight(5, 1)
+        new_flight.date = datetime(2025, 6, 1)
+        self.index.add(new_flight)
+        self.flights[0].date = datetime(2025, 5, 1)
+        self.index.update(self.flights[0])
+        self.assertEqual(self.index.range(), [1, 5, 2, 4, 3])
+
+    def test_discard(self):
+        self.index.discard(2)
+        self.assertEqual(self.index.range(), [4, 3, 1])
+
+class DummyClient:
+    def __init__(self, id, name):
+        self.id = id
+        self.name = name
+
+class TestSearchKeyIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = SearchKeyIndex(lambda r: {"name": search_key(r.name)})
+        self.index.add_all([DummyClient(1, "José"), DummyClient(2, "Zoë")])
+
+    def test_get(self):
+        self.assertEqual(self.index.get(1), {"name": "jose"})
+        self.assertIsNone(self.index.get(3))
+        self.assertEqual(len(self.index), 2)
+
+    def test_update_after_edit_in_place(self):
+        client = DummyClient(2, "Chloë")
+        self.index.update(client)
+        self.assertEqual(self.index.get(2), {"name": "chloe"})
+
+    def test_discard(self):
+        self.index.discard(1)
+        self.assertIsNone(self.index.get(1))
+        self.index.discard(1)
+        self.assertEqual(len(self.index), 1)
+
+class TestPrefixIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = PrefixIndex(lambda r: name_keys(r.name))
+        self.index.add_all([
+            DummyClient(1, "John Smith"),
+            DummyClient(2, "Jane Smyth"),
+            DummyClient(3, "Alice Johnson"),
+        ])
+
+    def test_complete_matches_any_word(self):
+        self.assertEqual(self.index.complete("jo"), [1, 3])
+        self.assertEqual(self.index.complete("sm"), [1, 2])
+        self.assertEqual(self.index.complete("x"), [])
+
+    def test_complete_limit(self):
+        self.assertEqual(self.index.complete("", limit=2), [3, 2])
+        self.assertEqual(self.index.complete("j", limit=1), [2])
+
+    def test_update_and_discard(self):
+        self.index.update(DummyClient(2, "Jane Doe"))
+        self.assertEqual(self.index.complete("sm"), [1])
+        self.index.discard(1)
+        self.assertEqual(self.index.complete("sm"), [])
+        self.assertEqual(len(self.index), 2)
+
+class TestBKTree(unittest.TestCase):
+
+    def setUp(self):
+        self.index = BKTree(lambda r: name_keys(r.name))
+        self.index.add_all([
+            DummyClient(1, "John Smith"),
+            DummyClient(2, "Jane Smyth"),
+            DummyClient(3, "Alice Schmidt"),
+            DummyClient(4, "Bob Jones"),
+        ])
+
+    def test_search_ranks_by_distance(self):
+        self.assertEqual(self.index.search("smith", 1), [(0, 1), (1, 2)])
+        self.assertEqual(self.index.search("smith", 0), [(0, 1)])
+
+    def test_search_whole_name(self):
+        self.assertEqual(self.index.search("jon smith", 1), [(1, 1)])
+
+    def test_discard(self):
+        self.index.discard(1)
+        self.assertEqual(self.index.search("smith", 1), [(1, 2)])
+        self.assertEqual(len(self.index), 3)
+
+    def test_update(self):
+        client = DummyClient(4, "Bob Smith")
+        self.index.update(client)
+        self.assertEqual(self.index.search("jones", 1), [])
+        self.assertIn((0, 4), self.index.search("smith", 0))
+
+    def test_empty_tree(self):
+        self.assertEqual(BKTree(lambda r: name_keys(r.name)).search("smith", 2), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,14 +3,18 @@ import os
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
 
+import threading
+import time
 import unittest
 from datetime import datetime, timedelta
 from models.record_manager import RecordManager
+from models.change_feed import CREATED, UPDATED, RELOADED
 
 class DummyClient:
-    def __init__(self, id, name):
+    def __init__(self, id, name, phone_number=""):
         self.id = id
         self.name = name
+        self.phone_number = phone_number
         self.type = "client"
     def to_dict(self):
         return {"id": self.id, "name": self.name, "type": self.type}
@@ -84,5 +88,173 @@ class TestRecordManager(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(len(self.manager.flights), 0)
 
+    def test_add_record_bumps_version(self):
+        version = self.manager.version
+        self.manager.add_record(DummyClient(2, "Alice"))
+        self.assertEqual(len(self.manager.clients), 2)
+        self.assertGreater(self.manager.version, version)
+
+    def test_update_record(self):
+        version = self.manager.version
+        self.assertTrue(self.manager.update_record(DummyClient(1, "Kevin B")))
+        self.assertEqual(self.manager.get_record_by_id(1, "client").name, "Kevin B")
+        self.assertGreater(self.manager.version, version)
+        self.assertFalse(self.manager.update_record(DummyClient(9, "Nobody")))
+
+    def test_changes_are_published(self):
+        batches = []
+        self.manager.subscribe(batches.append)
+        self.manager.add_record(DummyClient(2, "Alice"))
+        self.manager.update_record(DummyClient(2, "Alice B"))
+        self.assertEqual([[(e.action, e.record_type, e.record_id) for e in batch] for batch in batches],
+                         [[(CREATED, "client", 2)], [(UPDATED, "client", 2)]])
+
+        self.manager.unsubscribe(batches.append)
+        self.manager.add_record(DummyClient(3, "Bob"))
+        self.assertEqual(len(batches), 2)
+
+    def test_from_json_publishes_one_batch(self):
+        batches = []
+        self.manager.subscribe(batches.append)
+        self.manager.from_json({"clients": [], "airlines": [], "flights": []})
+        self.assertEqual(len(batches), 1)
+        self.assertEqual([(e.action, e.record_type) for e in batches[0]],
+                         [(RELOADED, "client"), (RELOADED, "airline"), (RELOADED, "flight")])
+
+    def test_get_page(self):
+        self.manager.clients = [DummyClient(i, f"Client {i % 3}") for i in range(1, 11)]
+        page, total = self.manager.get_page("client", 3, 4)
+        self.assertEqual(([c.id for c in page], total), ([4, 5, 6, 7], 10))
+        page, total = self.manager.get_page("client", 8, 4)
+        self.assertEqual(([c.id for c in page], total), ([9, 10], 10))
+
+        by_name = lambda c: c.name
+        odd = lambda c: c.id % 2 == 1
+        page, total = self.manager.get_page("client", 0, 3, sort_key=by_name, filter=odd)
+        self.assertEqual(([c.id for c in page], total), ([3, 9, 1], 5))
+        page, total = self.manager.get_page("client", 3, 3, sort_key=by_name, filter=odd)
+        self.assertEqual([c.id for c in page], [7, 5])
+        page, total = self.manager.get_page("client", 0, 3, sort_key=by_name, filter=odd, reverse=True)
+        self.assertEqual([c.id for c in page], [5, 1, 7])
+
+        self.manager.add_record(DummyClient(11, "Client 0"))
+        page, total = self.manager.get_page("client", 0, 3, sort_key=by_name, filter=odd)
+        self.assertEqual(([c.id for c in page], total), ([3, 9, 11], 6))
+
+        with self.assertRaises(ValueError):
+            self.manager.get_page("client", -1, 3)
+
+    def test_get_flights_between(self):
+        start = datetime(2025, 6, 1)
+        self.manager.flights = [
+            DummyFlight(i, 1, 1, start + timedelta(days=i), "London", "Paris") for i in range(1, 11)
+        ]
+        flights = self.manager.get_flights_between(start + timedelta(days=3), start + timedelta(days=6))
+        self.assertEqual([f.id for f in flights], [3, 4, 5])
+
+    def test_flight_index_follows_mutations(self):
+        start = datetime(2025, 6, 1)
+        self.manager.get_flights_between()
+        self.manager.add_record(DummyFlight(2, 1, 1, start, "Paris", "Rome"))
+        moved = self.manager.get_record_by_id(1, "flight")
+        moved.date = start - timedelta(days=1)
+        self.manager.update_record(moved)
+        self.assertEqual([f.id for f in self.manager.get_flights_between()], [1, 2])
+        self.manager.delete_record(2, "flight")
+        self.assertEqual([f.id for f in self.manager.get_flights_between(start)], [])
+
+    def test_flight_groups(self):
+        start = datetime(2025, 6, 1, 9, 0)
+        self.manager.flights = [
+            DummyFlight(1, 1, 2, start + timedelta(hours=5), "London", "Paris"),
+            DummyFlight(2, 2, 2, start, "Paris", "Rome"),
+            DummyFlight(3, 1, 1, start + timedelta(days=1), "Rome", "Oslo"),
+        ]
+        self.assertEqual(self.manager.get_flight_groups("day"),
+                         [(start.date(), 2), ((start + timedelta(days=1)).date(), 1)])
+        self.assertEqual(self.manager.get_flight_groups("client"), [(1, 2), (2, 1)])
+        self.assertEqual([f.id for f in self.manager.get_flights_in_group("day", start.date())], [2, 1])
+
+        self.manager.delete_record(2, "flight")
+        self.assertEqual(self.manager.get_flight_groups("airline"), [(1, 1), (2, 1)])
+        with self.assertRaises(ValueError):
+            self.manager.get_flight_groups("city")
+
+    def test_get_upcoming_flights(self):
+        now = datetime(2025, 6, 1, 12, 0)
+        self.manager.flights = [
+            DummyFlight(i, 1, 1, now + timedelta(hours=10 * (i - 3)), "London", "Paris") for i in range(1, 8)
+        ]
+        self.assertEqual([f.id for f in self.manager.get_upcoming_flights(2, now)], [3, 4])
+        upcoming = self.manager.get_upcoming_flights(10, now, within=timedelta(hours=24))
+        self.assertEqual([f.id for f in upcoming], [3, 4, 5])
+
+    def test_find_clients_by_phone(self):
+        self.manager.clients = [
+            DummyClient(1, "Alice", "+44 (20) 7946-0958"),
+            DummyClient(2, "Bob", "020 7946 0958"),
+            DummyClient(3, "Carol", "555 1234"),
+        ]
+        self.assertEqual([c.id for c in self.manager.find_clients_by_phone("79460958")], [1, 2])
+        self.assertEqual([c.id for c in self.manager.find_clients_by_phone("0044 20 7946 0958", 10)], [1, 2])
+        self.assertEqual([c.id for c in self.manager.find_clients_by_phone("234")], [3])
+        self.assertEqual(self.manager.find_clients_by_phone("+"), [])
+
+    def test_find_records_by_name(self):
+        self.manager.clients = [DummyClient(1, "Kevin"), DummyClient(2, "Alice"), DummyClient(3, "Kevin")]
+        self.assertEqual([c.id for c in self.manager.find_records_by_name("client", "Kevin")], [1, 3])
+        self.assertEqual(self.manager.find_records_by_name("client", "kevin"), [])
+        self.assertEqual([a.id for a in self.manager.find_records_by_name("airline", "SkyHigh")], [1])
+
+        client = self.manager.clients[2]
+        client.name = "Kevin Jones"
+        self.manager.update_record(client)
+        self.assertEqual([c.id for c in self.manager.find_records_by_name("client", "Kevin")], [1])
+
+    def test_complete_names(self):
+        self.manager.clients = [DummyClient(1, "Zoë Adams"), DummyClient(2, "Adam Smith"), DummyClient(3, "Bob")]
+        self.assertEqual([c.id for c in self.manager.complete_names("client", "ADA")], [2, 1])
+        self.assertEqual([c.id for c in self.manager.complete_names("client", "zoe", 5)], [1])
+        self.assertEqual([a.id for a in self.manager.complete_names("airline", "sky")], [1])
+
+        self.manager.add_record(DummyClient(4, "Adele"))
+        self.assertEqual([c.id for c in self.manager.complete_names("client", "ad", 2)], [2, 1])
+        self.assertEqual([c.id for c in self.manager.complete_names("client", "ade")], [4])
+
+    def test_snapshot_is_read_only_copy(self):
+        self.manager.clients = [DummyClient(1, "Alice")]
+        snapshot = self.manager.snapshot()
+        self.assertIs(self.manager.snapshot(), snapshot)
+        self.assertEqual(snapshot.find_record(1, "client").name, "Alice")
+        with self.assertRaises(AttributeError):
+            snapshot.add_record(DummyClient(2, "Bob"))
+
+        self.manager.add_record(DummyClient(2, "Bob"))
+        self.assertEqual(len(snapshot.clients), 1)
+        self.assertIsNot(self.manager.snapshot(), snapshot)
+        self.assertEqual(len(self.manager.snapshot().clients), 2)
+
+    def test_snapshot_builds_each_index_once(self):
+        snapshot = self.manager.snapshot()
+        record_type, factory = snapshot._index_specs["client_by_id"]
+        builds = []
+
+        def slow_factory():
+            builds.append(threading.current_thread())
+            time.sleep(0.05)
+            return factory()
+
+        snapshot._index_specs = dict(snapshot._index_specs, client_by_id=(record_type, slow_factory))
+        indexes = []
+        threads = [threading.Thread(target=lambda: indexes.append(snapshot.get_index("client_by_id")))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(builds), 1)
+        self.assertTrue(all(index is indexes[0] for index in indexes))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,43 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from models.search_keys import record_search_keys
+
+class TestSearchKeys(unittest.TestCase):
+
+    def test_client_keys(self):
+        client = SimpleNamespace(id=7, name="Zoë Dupré", city="Zürich", country="Schweiz",
+                                 phone_number="+41 44 123")
+        self.assertEqual(record_search_keys("client", client), {
+            "id": "7",
+            "name": "zoe dupre",
+            "city": "zurich",
+            "country": "schweiz",
+            "phone": "+41 44 123",
+        })
+
+    def test_airline_keys(self):
+        airline = SimpleNamespace(id=3, company_name="Líneas Aéreas")
+        self.assertEqual(record_search_keys("airline", airline), {"id": "3", "name": "lineas aereas"})
+
+    def test_flight_keys(self):
+        flight = SimpleNamespace(id=100, client_id=1, airline_id=3, start_city="São Paulo",
+                                 end_city="Genève", date=datetime(2025, 6, 1, 9, 30))
+        keys = record_search_keys("flight", flight)
+        self.assertEqual(keys["from"], "sao paulo")
+        self.assertEqual(keys["to"], "geneve")
+        self.assertEqual(keys["date"], "2025-06-01t09:30:00")
+        self.assertEqual((keys["client_id"], keys["airline_id"]), ("1", "3"))
+
+    def test_missing_fields_are_empty(self):
+        keys = record_search_keys("client", SimpleNamespace(id=1, name="Al", phone_number="1"))
+        self.assertEqual((keys["city"], keys["country"]), ("", ""))
+        self.assertEqual(record_search_keys("flight", SimpleNamespace(id=1))["date"], "")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+
+import unittest
+from utils.lru_cache import LRUCache
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_get_missing_returns_default(self):
+        cache = LRUCache(2)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("a", []), [])
+
+    def test_put_and_get(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIn("a", cache)
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_clear(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_new_version_drops_entries(self):
+        cache = LRUCache(2)
+        cache.set_version(1)
+        cache.put("a", 1)
+        cache.set_version(1)
+        self.assertIn("a", cache)
+        cache.set_version(2)
+        self.assertEqual((len(cache), cache.version), (0, 2))
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+
+if __name__ == '__main__':
+    unittest.main()
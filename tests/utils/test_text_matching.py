@@ -0,0 +1,61 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+
+import unittest
+from utils.text_matching import (search_key, normalise_name, name_keys, edit_distance, soundex, phonetic_keys,
+                                 phone_digits, phone_suffixes)
+
+class TestTextMatching(unittest.TestCase):
+
+    def test_search_key(self):
+        self.assertEqual(search_key("Zürich"), "zurich")
+        self.assertEqual(search_key("São Paulo"), "sao paulo")
+        self.assertEqual(search_key("Straße"), "strasse")
+        self.assertEqual(search_key("ＡＢＣ"), "abc")
+
+    def test_accented_names_match_plain(self):
+        self.assertEqual(normalise_name("Zoë O'Brién"), "zoe o brien")
+        self.assertEqual(soundex("Müller"), soundex("Muller"))
+
+    def test_normalise_name(self):
+        self.assertEqual(normalise_name("  O'Brien,  Kevin "), "o brien kevin")
+        self.assertEqual(normalise_name("--"), "")
+
+    def test_name_keys(self):
+        self.assertEqual(name_keys("John J Smith"), ["john j smith", "john", "smith"])
+        self.assertEqual(name_keys(""), [])
+
+    def test_edit_distance(self):
+        self.assertEqual(edit_distance("smith", "smyth"), 1)
+        self.assertEqual(edit_distance("kitten", "sitting"), 3)
+        self.assertEqual(edit_distance("", "abc"), 3)
+        self.assertEqual(edit_distance("abc", "abc"), 0)
+
+    def test_soundex(self):
+        self.assertEqual(soundex("Robert"), "r163")
+        self.assertEqual(soundex("Rupert"), "r163")
+        self.assertEqual(soundex("Ashcraft"), "a261")
+        self.assertEqual(soundex("Tymczak"), "t522")
+        self.assertEqual(soundex("Lee"), "l000")
+        self.assertEqual(soundex("123"), "")
+
+    def test_sound_alike_names_share_code(self):
+        self.assertEqual(soundex("Smith"), soundex("Smyth"))
+        self.assertEqual(soundex("Smith"), soundex("Schmidt"))
+
+    def test_phonetic_keys(self):
+        self.assertEqual(phonetic_keys("John Smith-Smyth"), ["j500", "s530"])
+
+    def test_phone_digits(self):
+        self.assertEqual(phone_digits("+44 (20) 7946-0958"), "442079460958")
+        self.assertEqual(phone_digits(None), "")
+
+    def test_phone_suffixes(self):
+        self.assertEqual(phone_suffixes("01-234 56"), ["0123456", "123456", "23456", "3456"])
+        self.assertEqual(phone_suffixes("555"), ["555"])
+        self.assertEqual(phone_suffixes(""), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../s
 import unittest
 import tkinter as tk
 from views.airline_view import AirlineView
+from models.record_manager import RecordManager
 
 class DummyAirline:
     def __init__(self, id, company_name):
@@ -32,6 +33,16 @@ class DummyRecordManager:
         return True
     def save_to_file(self):
         pass
+    def snapshot(self):
+        manager = RecordManager(filename="test_data.json")
+        manager.airlines = list(self.airlines)
+        return manager.snapshot()
+    def get_page(self, record_type, offset=0, limit=None, sort_key=None, filter=None, reverse=False):
+        return self.airlines[offset:offset + limit], len(self.airlines)
+    def subscribe(self, callback):
+        pass
+    def unsubscribe(self, callback):
+        pass
 
 class TestAirlineView(unittest.TestCase):
 
@@ -53,6 +64,9 @@ class TestAirlineView(unittest.TestCase):
     def test_search_item_found(self):
         self.view.search_var.set("SkyHigh")
         self.view.search_item()
+        self.view.search_worker._thread.join()
+        self.root.after_cancel(self.view._search_after_id)
+        self.view.show_search_results()
         children = self.view.treeview.get_children()
         self.assertEqual(len(children), 1)
 
@@ -10,6 +10,7 @@ import sys
 import os
 import unittest
 from unittest.mock import patch
+from types import SimpleNamespace
 from tkinter import Tk, Button
 from views.app import App
 import platform
@@ -56,6 +57,49 @@ class TestFlyRecordKeeper(unittest.TestCase):
             self.app.load_content("Manage Flights")
             mock_load_content.assert_called_with("Manage Flights")
 
+    def test_views_are_kept_across_navigation(self):
+        """Test if switching back to a section shows the view built before."""
+        self.app.load_content("Manage Airlines")
+        airlines_view = self.app.view
+        self.app.load_content("Manage Clients")
+        self.app.load_content("Manage Airlines")
+        self.assertIs(self.app.view, airlines_view)
+        self.assertEqual(set(self.app.views), {"Manage Clients", "Manage Airlines"})
+
+    def test_hidden_view_abandons_its_load(self):
+        """Test if leaving a section stops filling its grid, and returning finishes it."""
+        self.app.load_content("Manage Clients")
+        clients_view = self.app.view
+        fields = ("name", "address_line1", "address_line2", "address_line3", "city", "state", "zip_code",
+                  "country", "phone_number")
+        records = [SimpleNamespace(id=i, **dict.fromkeys(fields, "")) for i in range(1, 31)]
+        clients_view.grid.load(records, batch_size=10)
+        self.app.load_content("Manage Airlines")
+        self.assertFalse(clients_view.grid.loading)
+        self.assertTrue(clients_view.grid.load_incomplete)
+
+        with patch.object(clients_view, 'reload_records') as mock_reload_records:
+            self.app.load_content("Manage Clients")
+            mock_reload_records.assert_called_once_with()
+
+    def test_global_searches_share_one_worker(self):
+        """Test if every global search runs on the app's search worker."""
+        self.app.global_search_var.set("london")
+        self.app.global_search()
+        self.assertIs(self.app.view.search_worker, self.app.global_search_worker)
+        self.app.global_search_var.set("paris")
+        self.app.global_search()
+        self.assertIs(self.app.view.search_worker, self.app.global_search_worker)
+
+    def test_open_record_leaves_grouped_flights(self):
+        """Test if opening a flight from the search results shows the flat list."""
+        self.app.load_content("Manage Flights")
+        self.app.view.set_grouping("day")
+        self.app.load_content("Manage Clients")
+        self.app.open_record("flight", 1)
+        self.assertIsNone(self.app.view.group_by)
+        self.assertEqual(self.app.view.search_var.get(), "id:1")
+
     def test_status_update(self):
         """Test if the status bar updates correctly."""
         with patch.object(self.app, 'update_status') as mock_update_status:
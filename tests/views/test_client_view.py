@@ -5,7 +5,10 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../s
 
 import unittest
 import tkinter as tk
+from unittest.mock import patch
 from views.client_view import ClientView
+from models.record_manager import RecordManager
+from models.change_feed import ChangeFeed, ChangeEvent, DELETED
 
 class DummyClient:
     def __init__(self, id, name, address_line1="", address_line2="", address_line3="", city="", state="", zip_code="", country="", phone_number=""):
@@ -27,6 +30,13 @@ class DummyRecordManager:
             DummyClient(1, "Kevin", city="London"),
             DummyClient(2, "Alice", city="Paris")
         ]
+        self.changes = ChangeFeed()
+    def subscribe(self, callback):
+        self.changes.subscribe(callback)
+    def unsubscribe(self, callback):
+        self.changes.unsubscribe(callback)
+    def find_record(self, record_id, record_type):
+        return self.get_record_by_id(record_id, record_type)
     def get_records_by_type(self, record_type):
         return self.clients
     def get_record_by_id(self, record_id, record_type):
@@ -35,9 +45,17 @@ class DummyRecordManager:
         return DummyClient(3, name)
     def delete_record(self, record_id, record_type):
         self.clients = [c for c in self.clients if c.id != record_id]
+        self.changes.publish(ChangeEvent(DELETED, "client", record_id))
         return True
     def save_to_file(self):
         pass
+    def snapshot(self):
+        manager = RecordManager(filename="test_data.json")
+        manager.clients = list(self.clients)
+        return manager.snapshot()
+    def get_page(self, record_type, offset=0, limit=None, sort_key=None, filter=None, reverse=False):
+        records = sorted(self.clients, key=sort_key, reverse=reverse) if sort_key else self.clients
+        return records[offset:offset + limit], len(records)
 
 class TestClientView(unittest.TestCase):
 
@@ -59,9 +77,50 @@ class TestClientView(unittest.TestCase):
     def test_search_item_found(self):
         self.view.search_var.set("Kevin")
         self.view.search_item()
+        self.view.search_worker._thread.join()
+        self.root.after_cancel(self.view._search_after_id)
+        self.view.show_search_results()
         children = self.view.treeview.get_children()
         self.assertEqual(len(children), 1)
 
+    def test_deleted_client_leaves_grid(self):
+        self.rec_man.delete_record(1, "client")
+        self.assertEqual(self.view.treeview.get_children(), ("2",))
+
+    def test_pager_shows_page_position(self):
+        self.assertEqual(self.view.page_label.cget("text"), "1–2 of 2")
+        self.assertEqual(str(self.view.next_page_button.cget("state")), "disabled")
+
+        self.view.search_var.set("Kevin")
+        self.view.search_item()
+        self.assertEqual(self.view.page_label.cget("text"), "")
+
+    def finish_page(self):
+        self.view.page_worker._thread.join()
+        self.root.after_cancel(self.view._page_after_id)
+        self.view.show_sorted_page()
+
+    def test_sort_orders_every_page(self):
+        with patch("views.client_view.PAGE_SIZE", 1):
+            self.view.show_page(1)
+            self.view.grid.toggle_sort("name")
+            self.finish_page()
+            self.assertEqual((self.view.page_offset, self.view.treeview.get_children()), (0, ("2",)))
+            self.view.next_page()
+            self.finish_page()
+            self.assertEqual(self.view.treeview.get_children(), ("1",))
+
+            self.view.grid.toggle_sort("name")
+            self.finish_page()
+            self.assertEqual((self.view.page_offset, self.view.treeview.get_children()), (0, ("1",)))
+
+    def test_search_drops_a_pending_page(self):
+        self.view.grid.toggle_sort("name")
+        self.view.search_var.set("Kevin")
+        self.view.search_item()
+        self.assertIsNone(self.view._page_after_id)
+        self.assertFalse(self.view.is_paged)
+
     def test_toggle_search_mode(self):
         self.assertFalse(self.view.is_search_mode)
         self.view.toggle_search_mode()
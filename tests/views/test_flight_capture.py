@@ -34,6 +34,19 @@ class DummyRecordManager:
         self.clients = [DummyClient("1", "Kevin")]
         self.airlines = [DummyAirline("A1", "SkyHigh")]
 
+    def complete_names(self, record_type, prefix, limit=None):
+        records = self.clients if record_type == "client" else self.airlines
+        names = [(r.name if record_type == "client" else r.company_name, r) for r in records]
+        return [r for name, r in names if name.lower().startswith(prefix.strip().lower())][:limit]
+
+    def find_records_by_name(self, record_type, name):
+        records = self.clients if record_type == "client" else self.airlines
+        return [r for r in records if (r.name if record_type == "client" else r.company_name) == name]
+
+    def find_record(self, record_id, record_type):
+        records = self.clients if record_type == "client" else self.airlines
+        return next((r for r in records if str(r.id) == str(record_id)), None)
+
 class TestFlightCapture(unittest.TestCase):
 
     def setUp(self):
@@ -82,5 +95,30 @@ class TestFlightCapture(unittest.TestCase):
         self.assertFalse(valid)
         window.destroy()
 
+    def test_picker_filters_as_user_types(self):
+        self.rec_man.clients.append(DummyClient("2", "Alice"))
+        window = FlightCapture(self.rec_man, self.rec)
+        self.assertEqual(list(window.client_select.cget("values")), ["-- Please Select --", "Kevin", "Alice"])
+
+        window.client_select.set("Al")
+        window.filter_picker(window.client_select, "client")
+        self.assertEqual(list(window.client_select.cget("values")), ["Alice"])
+        window.destroy()
+
+    def test_duplicate_names_resolve_to_picked_client(self):
+        self.rec_man.clients.append(DummyClient("2", "Kevin"))
+        window = FlightCapture(self.rec_man, self.rec)
+        self.assertEqual(list(window.client_select.cget("values")),
+                         ["-- Please Select --", "Kevin (ID 1)", "Kevin (ID 2)"])
+
+        window.client_select.set("Kevin")
+        self.assertIsNone(window.selected_record("client", window.client_select))
+        window.client_select.set("Kevin (ID 2)")
+        window.airline_select.set("SkyHigh")
+        window.resolve_ids()
+        self.assertEqual((self.rec.client_id, self.rec.client_name), ("2", "Kevin"))
+        self.assertEqual(self.rec.airline_id, "A1")
+        window.destroy()
+
 if __name__ == '__main__':
     unittest.main()
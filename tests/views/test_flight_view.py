@@ -7,6 +7,8 @@ import unittest
 import tkinter as tk
 from datetime import datetime, timedelta
 from views.flight_view import FlightView
+from models.change_feed import ChangeEvent, UPDATED
+from models.record_manager import RecordManager
 
 class DummyClient:
     def __init__(self, id, name):
@@ -48,6 +50,20 @@ class DummyRecordManager:
         elif record_type == "flight":
             return next((f for f in self.flights if f.id == record_id), None)
 
+    def find_record(self, record_id, record_type):
+        return self.get_record_by_id(record_id, record_type)
+
+    def get_related_records(self, record_id, record_type):
+        key = "client_id" if record_type == "client" else "airline_id"
+        return [f for f in self.flights if getattr(f, key) == record_id]
+
+    def get_flight_groups(self, group_by):
+        days = sorted({f.date.date() for f in self.flights})
+        return [(day, sum(1 for f in self.flights if f.date.date() == day)) for day in days]
+
+    def get_flights_in_group(self, group_by, key):
+        return [f for f in self.flights if f.date.date() == key]
+
     def create_flight(self, client_id, airline_id, date, start_city, end_city):
         return DummyFlight(2, client_id, airline_id, date, start_city, end_city)
 
@@ -58,6 +74,16 @@ class DummyRecordManager:
     def save_to_file(self):
         pass
 
+    def get_page(self, record_type, offset=0, limit=None, sort_key=None, filter=None, reverse=False):
+        records = self.get_records_by_type(record_type)
+        return records[offset:offset + limit], len(records)
+
+    def subscribe(self, callback):
+        pass
+
+    def unsubscribe(self, callback):
+        pass
+
 class TestFlightView(unittest.TestCase):
 
     def setUp(self):
@@ -75,6 +101,37 @@ class TestFlightView(unittest.TestCase):
         children = self.view.treeview.get_children()
         self.assertEqual(len(children), 1)
 
+    def test_rows_follow_client_rename(self):
+        self.assertEqual(self.view.treeview.item("1")["values"][1], "Kevin")
+        self.rec_man.clients[0].name = "Kevin B"
+        self.assertEqual(self.view.row_values(self.rec_man.flights[0])[1], "Kevin")
+
+        self.view.on_records_changed([ChangeEvent(UPDATED, "client", 1)])
+        self.assertEqual(self.view.treeview.item("1")["values"][1], "Kevin B")
+
+    def test_grouped_flights_expand_lazily(self):
+        self.view.set_grouping("day")
+        groups = self.view.group_tree.get_children()
+        self.assertEqual(len(groups), 1)
+        self.assertTrue(self.view.group_tree.item(groups[0], "text").endswith("(1)"))
+        self.assertFalse(self.view.group_tree.exists("1"))
+
+        self.view.group_tree.focus(groups[0])
+        self.view.on_group_open(None)
+        self.assertEqual(self.view.group_tree.get_children(groups[0]), ("1",))
+        self.view.group_tree.focus("1")
+        self.assertEqual(self.view.selected_flight().id, 1)
+
+        self.view.set_grouping(None)
+        self.assertIsNone(self.view.group_by)
+
+    def test_clear_grouping(self):
+        self.view.group_var.set("Group by day")
+        self.view.set_grouping("day")
+        self.view.clear_grouping()
+        self.assertIsNone(self.view.group_by)
+        self.assertEqual(self.view.group_var.get(), "No grouping")
+
     def test_toggle_search_mode(self):
         self.assertFalse(self.view.is_search_mode)
         self.view.toggle_search_mode()
@@ -82,5 +139,71 @@ class TestFlightView(unittest.TestCase):
         self.view.toggle_search_mode()
         self.assertFalse(self.view.is_search_mode)
 
+class DummyRecord:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+@unittest.skipUnless(os.environ.get("DISPLAY"), "needs a display")
+class TestFlightViewSearchStream(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tk.Tk()
+        self.root.withdraw()
+        self.rec_man = RecordManager(filename="test_data.json")
+        self.rec_man.clients = [DummyRecord(id=1, type="client", name="Kevin")]
+        self.rec_man.airlines = [DummyRecord(id=1, type="airline", company_name="SkyHigh")]
+        self.rec_man.flights = [
+            DummyRecord(id=i, type="flight", client_id=1, airline_id=1, date=datetime(2025, 6, 1, 9, 30),
+                        start_city="London", end_city="Paris" if i % 2 else "Rome")
+            for i in range(1, 251)
+        ]
+        self.statuses = []
+        self.view = FlightView(self.root, self.rec_man, self.statuses.append)
+        self.view.search_worker.batch_size = 50
+
+    def tearDown(self):
+        self.view.destroy()
+        self.root.destroy()
+
+    def search(self, query):
+        self.view.search_var.set(query)
+        self.view.search_item()
+
+    def finish_search(self):
+        """Wait for the background search and stream in everything it queued."""
+        self.view.search_worker._thread.join()
+        self.root.after_cancel(self.view._result_stream_after_id)
+        self.view.stream_results()
+
+    def test_results_stream_into_the_grid(self):
+        self.search("paris")
+        self.assertIsNotNone(self.view._result_stream_after_id)
+        self.finish_search()
+
+        self.assertEqual(len(self.view.grid), 125)
+        self.assertTrue(all(f.end_city == "Paris" for f in self.view.grid.records))
+        self.assertFalse(self.view.is_paged)
+        self.assertIsNone(self.view._result_stream_after_id)
+        self.assertEqual(self.statuses[-1], "Found 125 matching flight(s)")
+
+    def test_superseded_query_results_are_dropped(self):
+        self.search("paris")
+        self.view.search_worker._thread.join()
+        self.search("rome")
+        self.finish_search()
+
+        self.assertEqual(len(self.view.grid), 125)
+        self.assertTrue(all(f.end_city == "Rome" for f in self.view.grid.records))
+
+    def test_cancel_stops_polling(self):
+        shown = list(self.view.grid.records)
+        self.search("paris")
+        self.view.cancel_result_stream()
+        self.assertIsNone(self.view._result_stream_after_id)
+
+        self.view.search_worker._thread.join()
+        self.assertEqual(self.view.search_worker.poll(), [])
+        self.assertEqual(self.view.grid.records, shown)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,55 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
+
+import unittest
+import tkinter as tk
+from datetime import datetime
+from models.record_manager import RecordManager
+from views.search_results_view import SearchResultsView
+
+class DummyRecord:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+class TestSearchResultsView(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tk.Tk()
+        self.root.withdraw()
+        self.rec_man = RecordManager(filename="test_data.json")
+        self.rec_man.clients = [DummyRecord(id=1, type="client", name="John Smith", city="London",
+                                            country="UK", phone_number="12345")]
+        self.rec_man.airlines = [DummyRecord(id=5, type="airline", company_name="SkyHigh Airways")]
+        self.rec_man.flights = [DummyRecord(id=100, type="flight", client_id=1, airline_id=5,
+                                            start_city="London", end_city="Paris",
+                                            date=datetime(2025, 6, 1, 9, 30))]
+        self.opened = []
+        self.view = SearchResultsView(self.root, self.rec_man, "london",
+                                      open_record=lambda t, i: self.opened.append((t, i)))
+        self.finish_search()
+
+    def tearDown(self):
+        self.view.destroy()
+        self.root.destroy()
+
+    def finish_search(self):
+        """Wait for the background search and insert its results."""
+        self.view.search_worker._thread.join()
+        self.root.after_cancel(self.view._result_stream_after_id)
+        self.view.stream_results()
+
+    def test_results_grouped_by_type(self):
+        groups = self.view.treeview.get_children()
+        self.assertEqual([self.view.treeview.item(g, "text") for g in groups],
+                         ["Clients (1)", "Airlines (0)", "Flights (1)"])
+
+    def test_open_selected(self):
+        flight_row = self.view.treeview.get_children(self.view.treeview.get_children()[2])[0]
+        self.view.treeview.focus(flight_row)
+        self.view.open_selected()
+        self.assertEqual(self.opened, [("flight", 100)])
+
+if __name__ == '__main__':
+    unittest.main()
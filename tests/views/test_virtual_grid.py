@@ -0,0 +1,146 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
+
+import unittest
+import tkinter as tk
+from tkinter import ttk
+from datetime import datetime
+from views.virtual_grid import VirtualGrid, sort_key
+
+class DummyRecord:
+    def __init__(self, id, name):
+        self.id = id
+        self.name = name
+
+class TestVirtualGrid(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tk.Tk()
+        self.root.withdraw()
+        frame = ttk.Frame(self.root)
+        self.treeview = ttk.Treeview(frame, columns=("id", "name"), show="headings", height=10)
+        self.grid = VirtualGrid(self.treeview, lambda r: (r.id, r.name), buffer_rows=2)
+        self.grid.set_records([DummyRecord(i, f"Client {i}") for i in range(1, 1001)])
+
+    def tearDown(self):
+        self.root.destroy()
+
+    def test_only_window_is_materialised(self):
+        children = self.treeview.get_children()
+        self.assertEqual(len(children), 12)
+        self.assertEqual(children[0], "1")
+        self.assertEqual(len(self.grid), 1000)
+
+    def test_scroll_moves_window(self):
+        self.grid.yview("moveto", "0.5")
+        self.assertEqual(self.treeview.get_children()[0], "501")
+        self.grid.scroll(1000)
+        self.assertEqual(self.treeview.get_children()[0], "991")
+        self.grid.yview("scroll", "-1", "pages")
+        self.assertEqual(self.treeview.get_children()[0], "981")
+
+    def test_selection_survives_scrolling(self):
+        self.grid.select(3)
+        self.grid.scroll(100)
+        self.assertFalse(self.treeview.exists("3"))
+        self.assertEqual(self.grid.selected_record().id, 3)
+        self.grid.move_focus(50)
+        self.assertEqual(self.grid.selected_record().id, 53)
+        self.assertTrue(self.treeview.exists("53"))
+
+    def test_update_remove_and_append(self):
+        self.grid.update_record(DummyRecord(2, "Renamed"))
+        self.assertEqual(self.treeview.item("2", "values")[1], "Renamed")
+
+        self.grid.remove(1)
+        self.assertEqual(self.treeview.get_children()[0], "2")
+        self.grid.append(DummyRecord(1001, "New"))
+        self.grid.select(1001)
+        self.assertEqual(self.treeview.get_children()[-1], "1001")
+
+    def test_new_records_keep_shared_rows(self):
+        self.treeview.item("2", tags=("kept",))
+        self.treeview.item("3", tags=("kept",))
+        self.grid.set_records([DummyRecord(3, "Client 3"), DummyRecord(2, "Changed"), DummyRecord(2000, "New")])
+
+        self.assertEqual(self.treeview.get_children(), ("3", "2", "2000"))
+        self.assertEqual(self.treeview.item("3", "tags"), ("kept",))
+        self.assertEqual(self.treeview.item("2", "tags"), ("kept",))
+        self.assertEqual(self.treeview.item("2", "values")[1], "Changed")
+
+    def test_load_in_batches(self):
+        progress = []
+        self.grid.load([DummyRecord(i, f"Airline {i}") for i in range(1, 1001)],
+                       lambda loaded, total: progress.append(loaded), batch_size=400)
+        self.assertTrue(self.grid.loading)
+        self.assertEqual(len(self.grid), 400)
+
+        while self.grid.loading:
+            self.root.update()
+        self.assertEqual(progress, [400, 800, 1000])
+        self.assertEqual(len(self.grid), 1000)
+
+    def test_new_records_cancel_load(self):
+        self.grid.load([DummyRecord(i, "") for i in range(1, 1001)], batch_size=400)
+        self.grid.set_records([DummyRecord(7, "Only")])
+        self.assertFalse(self.grid.loading)
+        self.assertFalse(self.grid.load_incomplete)
+        self.assertEqual(self.treeview.get_children(), ("7",))
+
+    def test_cancel_load_marks_it_incomplete(self):
+        self.grid.load([DummyRecord(i, "") for i in range(1, 1001)], batch_size=400)
+        self.grid.cancel_load()
+        self.assertFalse(self.grid.loading)
+        self.assertTrue(self.grid.load_incomplete)
+        self.assertEqual(len(self.grid), 400)
+
+    def test_sort_by_column(self):
+        self.grid.set_records([DummyRecord(1, "bob"), DummyRecord(2, "Álvaro"), DummyRecord(3, "Bob"),
+                               DummyRecord(10, "carl")])
+        self.grid.toggle_sort("name")
+        self.assertEqual(self.treeview.get_children(), ("2", "1", "3", "10"))
+        self.assertTrue(self.treeview.heading("name", "text").endswith("▲"))
+
+        self.grid.toggle_sort("name")
+        self.assertEqual(self.treeview.get_children(), ("10", "1", "3", "2"))
+
+        self.grid.sort_by("id", reverse=True)
+        self.assertEqual(self.treeview.get_children(), ("10", "3", "2", "1"))
+        self.assertFalse(self.treeview.heading("name", "text").endswith("▼"))
+
+    def test_on_sort_replaces_local_sort(self):
+        sorts = []
+        self.grid.on_sort = lambda column, reverse: sorts.append((column, reverse)) or True
+        self.grid.toggle_sort("name")
+        self.assertEqual(sorts, [("name", False)])
+        self.assertEqual(self.treeview.get_children()[0], "1")
+        self.assertTrue(self.treeview.heading("name", "text").endswith("▲"))
+
+    def test_column_sort_key(self):
+        key = self.grid.column_sort_key("name")
+        self.assertIs(self.grid.column_sort_key("name"), key)
+        self.assertIsNone(self.grid.column_sort_key(None))
+        records = [DummyRecord(1, "bob"), DummyRecord(2, "Álvaro")]
+        self.assertEqual([r.id for r in sorted(records, key=key)], [2, 1])
+
+    def test_sorted_grid_places_new_records_in_order(self):
+        self.grid.set_records([DummyRecord(1, "Bea"), DummyRecord(2, "Dan")])
+        self.grid.sort_by("name")
+        self.grid.append(DummyRecord(3, "Cat"))
+        self.assertEqual(self.treeview.get_children(), ("1", "3", "2"))
+
+        self.grid.update_record(DummyRecord(1, "Zed"))
+        self.assertEqual(self.treeview.get_children(), ("1", "3", "2"))
+        self.grid.set_records(self.grid.records)
+        self.assertEqual(self.treeview.get_children(), ("3", "2", "1"))
+
+    def test_sort_key(self):
+        self.assertLess(sort_key(9), sort_key(10))
+        self.assertLess(sort_key(datetime(2025, 1, 2)), sort_key(datetime(2025, 1, 10)))
+        self.assertEqual(sort_key("Zürich"), sort_key("zurich"))
+        self.assertEqual(sort_key(None), sort_key(""))
+
+if __name__ == '__main__':
+    unittest.main()